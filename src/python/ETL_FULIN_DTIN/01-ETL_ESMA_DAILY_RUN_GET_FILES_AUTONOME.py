@@ -8,10 +8,16 @@ Script AUTONOME : purge + détection des dates à récupérer + download + unzip
 
 Ce script remplace la logique "pilotée par paramètres" par une logique simple :
 1) Purge des fichiers de données (data/*) au démarrage (sauf data/archive).
+   [ESMA] download_cache = true (défaut false) : les ZIP (et XML extraits) sont conservés dans le cache
+   data/archive/firds_cache, vidé par éviction ([ESMA] cache_retention_days / cache_max_gb) au début et en fin
+   de run (nouveaux téléchargements compris) : un re-run ne re-télécharge rien.
 2) Lecture des dernières dates déjà chargées (FULL et DELTA) dans STG via SQL.
-3) Recherche des dernières dates disponibles (FULL et DELTA) sur ESMA (SOLR FIRDS).
-4) Téléchargement + extraction :
-   - FULL : uniquement si un FULL plus récent existe.
+3) Recherche des dernières dates disponibles (FULL et DELTA) dans le catalogue local
+   data/archive/firds_catalogue.sqlite, rafraîchi par une seule requête SOLR incrémentale.
+4) Téléchargement (pool borné, reprenable via HTTP Range, vérifié taille/checksum) + extraction
+   (sauf [ESMA] extract_mode=stream : les XML sont lus directement dans les ZIP par 02-BUILD_CSV) :
+   - FULL : uniquement si un FULL plus récent existe ([ESMA] delta_only : et seulement si la chaîne
+     DLTINS est rompue, si le dernier FULL chargé est trop ancien, ou si un échantillon du FULL diverge).
    - DELTA : du jour suivant la référence (nouveau FULL sinon last_delta sinon last_full) jusqu'au dernier DELTA disponible.
 
 Aucune création BSV/CSV, aucun chargement SQL des XML : ce script s'arrête après extraction.
@@ -54,10 +60,18 @@ except ImportError as e:
 
 import argparse
 import configparser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+import hashlib
+import importlib.util
+import os
 import re
 import shutil
+import sqlite3
+import time
+import xml.etree.ElementTree as ET
 import zipfile
 
 import pyodbc
@@ -66,6 +80,20 @@ SCRIPT_NAME = "01-ETL_ESMA_DAILY_RUN_GET_FILES_AUTONOME.py"
 CONFIG_DIR_DEFAULT = None
 ESMA_SOLR = "https://registers.esma.europa.eu/solr/esma_registers_firds_files/select"
 HTTP_TIMEOUT = 120
+SOLR_PAGE_WORKERS_DEFAULT = 4
+DOWNLOAD_WORKERS_DEFAULT = 4
+DOWNLOAD_RETRIES_DEFAULT = 3
+# Statuts HTTP transitoires hors 5xx (limitation de débit) : nouvelle tentative, .part conservé
+HTTP_RETRY_STATUSES = (429,)
+DOWNLOAD_CHUNK = 1024 * 1024
+EXTRACT_MODES = ("unzip", "stream")
+DELTA_CATCHUP_MAX_DAYS_DEFAULT = 30
+CACHE_RETENTION_DAYS_DEFAULT = 14
+CACHE_MAX_GB_DEFAULT = 50.0
+FULL_RECONCILE_DAYS_DEFAULT = 28
+FULL_SAMPLE_RECORDS_DEFAULT = 2000
+FULL_SAMPLE_MAX_MISMATCH_PCT_DEFAULT = 1.0
+CATALOGUE_LOOKBACK_DAYS_DEFAULT = 45
 
 # --- SQL last loaded (fourni par le user) ---
 SQL_LAST_LOADED_FULL = """
@@ -80,6 +108,17 @@ FROM stg.ESMA_FULINS_WIDE
 WHERE SourceFileName LIKE 'DLTINS_%'
 """
 
+# --- Fichiers DLTINS appliqués par stg.usp_Process_DLTINS_Daily (mode delta-only) ---
+SQL_APPLIED_DELTA_DATES = """
+SELECT DISTINCT FileDate
+FROM stg.ESMA_DLTINS_APPLIED
+WHERE FileDate > ?
+"""
+
+# Colonnes comparées entre un échantillon du nouveau FULL et les lignes ouvertes de stg.ESMA_FULINS_WIDE
+FULL_SAMPLE_COLUMNS = ["FullName", "ShortName", "CFI", "NotionalCurrency", "IssuerLEI",
+                       "MaturityDate", "ExpiryDate", "TerminationDate"]
+
 
 # ----------------------------
 # Root + Config
@@ -104,7 +143,10 @@ def sql_conn(cfg: configparser.ConfigParser) -> pyodbc.Connection:
     return pyodbc.connect(conn_str, autocommit=True)
 
 
-def sql_log_line(conn: pyodbc.Connection, message: str, element: str = "", complement: str = "", file_name: str = "") -> None:
+def sql_log_line(conn: Optional[pyodbc.Connection], message: str, element: str = "", complement: str = "", file_name: str = "") -> None:
+    # conn=None : exécution hors base (bench/firds_mirror.py, bench/bench_get_files.py)
+    if conn is None:
+        return
     sql = """
     INSERT INTO log.ESMA_Load_Log
         (ScriptName, LaunchTimestamp, StartTime, Message, FileName, Element, Complement)
@@ -178,32 +220,101 @@ def purge_data_dir(data_dir: Path, conn: Optional[pyodbc.Connection]) -> None:
 # ----------------------------
 # ESMA SOLR helpers
 # ----------------------------
-def solr_search_by_date_range(start_ymd: str, end_ymd: str, rows: int = 500, max_rows: int = 5000) -> List[Dict]:
+def _solr_fq(start_ymd: str, end_ymd: str) -> str:
+    return f"publication_date:[{start_ymd}T00:00:00Z TO {end_ymd}T23:59:59Z]"
+
+
+def _solr_get(params: Dict) -> Dict:
+    r = requests.get(ESMA_SOLR, params=params, timeout=HTTP_TIMEOUT)
+    r.raise_for_status()
+    return r.json()
+
+
+def _solr_iter_offset(fq: str, rows: int, max_rows: int, workers: int) -> Iterator[Dict]:
+    """
+    Page 1 d'abord (apprend numFound), puis les fenêtres start=rows, 2*rows, ... en parallèle
+    (au plus `workers` requêtes en vol), restituées dans l'ordre du tri.
+    La fenêtre glissante évite de tout télécharger si l'appelant s'arrête tôt.
+    """
+    base = {"q": "*", "fq": fq, "wt": "json", "rows": rows, "sort": "publication_date desc"}
+    resp = _solr_get({**base, "start": 0}).get("response", {})
+    batch = resp.get("docs", []) or []
+    yield from batch
+
+    num_found = int(resp.get("numFound", 0) or 0)
+    if not batch:
+        return
+    offsets = iter(range(rows, min(num_found, max_rows), rows))
+
+    pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="esma_solr")
+    try:
+        in_flight = deque()
+        for start in offsets:
+            in_flight.append(pool.submit(_solr_get, {**base, "start": start}))
+            if len(in_flight) >= max(1, workers):
+                break
+        while in_flight:
+            data = in_flight.popleft().result()
+            nxt = next(offsets, None)
+            if nxt is not None:
+                in_flight.append(pool.submit(_solr_get, {**base, "start": nxt}))
+            page = data.get("response", {}).get("docs", []) or []
+            if not page:
+                break
+            yield from page
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _solr_iter_cursor(fq: str, rows: int, max_rows: int) -> Iterator[Dict]:
+    """
+    Deep paging Solr par cursorMark (coût constant quelle que soit la profondeur).
+    Le tri doit inclure la clé unique (id) pour que le curseur soit stable.
+    """
+    base = {"q": "*", "fq": fq, "wt": "json", "rows": rows, "sort": "publication_date desc,id asc"}
+    cursor = "*"
+    seen = 0
+    while seen < max_rows:
+        data = _solr_get({**base, "cursorMark": cursor})
+        page = data.get("response", {}).get("docs", []) or []
+        yield from page
+        seen += len(page)
+        nxt = data.get("nextCursorMark")
+        if not page or not nxt or nxt == cursor:
+            return
+        cursor = nxt
+
+
+def solr_iter_by_date_range(start_ymd: str, end_ymd: str, rows: int = 500, max_rows: int = 5000,
+                            workers: int = SOLR_PAGE_WORKERS_DEFAULT, use_cursor: bool = False) -> Iterator[Dict]:
     """
-    Liste des fichiers publiés entre start_ymd et end_ymd (inclus) via l'API SOLR ESMA,
+    Générateur des fichiers publiés entre start_ymd et end_ymd (inclus), tri publication_date desc,
     conformément à la doc ESMA : q=* et fq=publication_date:[... TO ...].
+    - mode offset (défaut) : pages suivantes récupérées en parallèle après la première ;
+    - mode cursorMark (use_cursor=True) si le serveur le supporte ; repli automatique sur le mode offset sinon.
+    L'appelant peut arrêter l'itération à tout moment (ex. dès que la dernière date est connue).
     """
-    docs: List[Dict] = []
-    start = 0
-    fq = f"publication_date:[{start_ymd}T00:00:00Z TO {end_ymd}T23:59:59Z]"
-    while True:
-        params = {"q": "*", "fq": fq, "wt": "json", "rows": rows, "start": start, "sort": "publication_date desc"}
-        r = requests.get(ESMA_SOLR, params=params, timeout=HTTP_TIMEOUT)
-        r.raise_for_status()
-        data = r.json()
-        resp = data.get("response", {})
-        batch = resp.get("docs", []) or []
-        docs.extend(batch)
-
-        num_found = int(resp.get("numFound", 0) or 0)
-        if not batch:
-            break
-        start += rows
-        if start >= num_found:
-            break
-        if len(docs) >= max_rows:
-            break
-    return docs
+    fq = _solr_fq(start_ymd, end_ymd)
+    if use_cursor:
+        try:
+            first = True
+            for doc in _solr_iter_cursor(fq, rows, max_rows):
+                first = False
+                yield doc
+            return
+        except requests.HTTPError:
+            if not first:
+                raise
+            # serveur sans support cursorMark (400) -> mode offset
+    yield from _solr_iter_offset(fq, rows, max_rows, workers)
+
+
+def solr_search_by_date_range(start_ymd: str, end_ymd: str, rows: int = 500, max_rows: int = 5000,
+                              workers: int = SOLR_PAGE_WORKERS_DEFAULT, use_cursor: bool = False) -> List[Dict]:
+    """
+    Liste des fichiers publiés entre start_ymd et end_ymd (inclus) via l'API SOLR ESMA.
+    """
+    return list(solr_iter_by_date_range(start_ymd, end_ymd, rows, max_rows, workers, use_cursor))
 
 
 def doc_download_url(doc: Dict) -> Optional[str]:
@@ -217,16 +328,149 @@ def doc_filename(doc: Dict, fallback: str) -> str:
     return doc.get("file_name") or doc.get("fileName") or doc.get("name") or fallback
 
 
-def download_file(url: str, out_path: Path) -> None:
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    if out_path.exists() and out_path.stat().st_size > 0:
-        return
-    with requests.get(url, stream=True, timeout=HTTP_TIMEOUT) as r:
+def doc_expected_size(doc: Dict) -> Optional[int]:
+    for k in ("file_size", "fileSize", "size", "content_length", "contentLength"):
+        v = doc.get(k)
+        if v in (None, ""):
+            continue
+        try:
+            return int(v)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def doc_checksum(doc: Dict) -> Optional[str]:
+    for k in ("checksum", "file_checksum", "md5", "md5_checksum", "sha256"):
+        v = doc.get(k)
+        if v:
+            return str(v).strip().lower()
+    return None
+
+
+class DownloadIntegrityError(Exception):
+    """Fichier téléchargé incohérent avec les métadonnées SOLR (taille / checksum)."""
+
+
+class DownloadIncompleteError(DownloadIntegrityError):
+    """Fichier plus court que la taille attendue : transfert terminé trop tôt, le .part est repris par Range."""
+
+
+def _hash_algo_for(checksum: str) -> Optional[str]:
+    # L'algorithme est déduit de la longueur hexadécimale (MD5 par défaut côté ESMA)
+    return {32: "md5", 40: "sha1", 64: "sha256"}.get(len(checksum))
+
+
+def file_checksum(path: Path, algo: str) -> str:
+    h = hashlib.new(algo)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def verify_download(path: Path, expected_size: Optional[int], checksum: Optional[str]) -> None:
+    size = path.stat().st_size
+    if expected_size is not None and size < expected_size:
+        raise DownloadIncompleteError(f"{path.name}: size={size} expected={expected_size}")
+    if expected_size is not None and size != expected_size:
+        raise DownloadIntegrityError(f"{path.name}: size={size} expected={expected_size}")
+    if checksum:
+        algo = _hash_algo_for(checksum)
+        if algo is not None:
+            actual = file_checksum(path, algo)
+            if actual != checksum:
+                raise DownloadIntegrityError(f"{path.name}: {algo}={actual} expected={checksum}")
+    if path.name.lower().endswith((".zip", ".zip.part")) and not zipfile.is_zipfile(path):
+        raise DownloadIntegrityError(f"{path.name}: not a valid zip archive")
+
+
+def _response_total_size(r: requests.Response, offset: int) -> Optional[int]:
+    # Content-Range: bytes <start>-<end>/<total>  (réponse 206 ou 416)
+    content_range = r.headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1].strip()
+        if total.isdigit():
+            return int(total)
+    length = r.headers.get("Content-Length")
+    if length and length.isdigit() and r.status_code == 200:
+        return int(length)
+    if length and length.isdigit() and r.status_code == 206:
+        return offset + int(length)
+    return None
+
+
+def _download_to_part(url: str, part_path: Path, expected_size: Optional[int]) -> Optional[int]:
+    """
+    Télécharge (ou reprend) url dans part_path. Retourne la taille totale annoncée par le serveur.
+    Reprise via 'Range: bytes=<offset>-' ; si le serveur ignore le Range (200), on repart de zéro.
+    """
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    if expected_size is not None and offset > expected_size:
+        part_path.unlink()
+        offset = 0
+    if expected_size is not None and offset == expected_size:
+        return expected_size
+
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    with requests.get(url, stream=True, timeout=HTTP_TIMEOUT, headers=headers) as r:
+        if offset and r.status_code == 416:
+            # Range non satisfiable : le .part est déjà complet (ou plus long que la ressource)
+            return _response_total_size(r, offset)
         r.raise_for_status()
-        with open(out_path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024 * 1024):
+        if offset and r.status_code != 206:
+            offset = 0
+        total = _response_total_size(r, offset)
+        with open(part_path, "ab" if offset else "wb") as f:
+            for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK):
                 if chunk:
                     f.write(chunk)
+    return total
+
+
+def download_file(url: str, out_path: Path, expected_size: Optional[int] = None, checksum: Optional[str] = None,
+                  retries: int = DOWNLOAD_RETRIES_DEFAULT) -> None:
+    """
+    Téléchargement reprenable et vérifié :
+    - écriture dans <out_path>.part, reprise par HTTP Range après une coupure réseau
+      (seuls les octets manquants sont re-téléchargés), y compris après un 5xx / 429 ou un transfert tronqué ;
+    - vérification taille / checksum (métadonnées du doc SOLR) avant renommage atomique en out_path ;
+    - un fichier final n'existe donc que s'il a été vérifié.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    if out_path.exists() and out_path.stat().st_size > 0:
+        if expected_size is None or out_path.stat().st_size == expected_size:
+            return
+        out_path.unlink()
+
+    part_path = out_path.with_name(out_path.name + ".part")
+    last_error: Optional[BaseException] = None
+    for attempt in range(max(0, retries) + 1):
+        if attempt:
+            time.sleep(min(60, 2 ** attempt))
+        try:
+            total = _download_to_part(url, part_path, expected_size)
+            verify_download(part_path, expected_size if expected_size is not None else total, checksum)
+            os.replace(part_path, out_path)
+            return
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            # coupure réseau : on garde le .part pour reprendre
+            last_error = e
+        except requests.HTTPError as e:
+            # 5xx / 429 : erreur transitoire côté serveur, on garde le .part ; autre 4xx : échec immédiat
+            status = e.response.status_code if e.response is not None else 0
+            if status < 500 and status not in HTTP_RETRY_STATUSES:
+                raise
+            last_error = e
+        except DownloadIncompleteError as e:
+            # transfert terminé trop tôt sans exception (pas de Content-Length, urllib3 1.x) : reprise par Range
+            last_error = e
+        except DownloadIntegrityError as e:
+            # contenu incohérent : on jette le .part et on repart de zéro
+            part_path.unlink(missing_ok=True)
+            last_error = e
+    assert last_error is not None
+    raise last_error
 
 
 def extract_zip_xml_only(zip_path: Path, out_dir: Path) -> List[Path]:
@@ -239,12 +483,22 @@ def extract_zip_xml_only(zip_path: Path, out_dir: Path) -> List[Path]:
                 if target.exists() and target.stat().st_size > 0:
                     extracted.append(target)
                     continue
-                with z.open(name) as src, open(target, "wb") as dst:
-                    dst.write(src.read())
+                # copie par blocs : pas de chargement du membre complet en mémoire ;
+                # écriture en .part puis renommage (un XML tronqué ne passe jamais pour complet)
+                part = target.with_name(target.name + ".part")
+                with z.open(name) as src, open(part, "wb") as dst:
+                    shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK)
+                os.replace(part, target)
                 extracted.append(target)
     return extracted
 
 
+def list_zip_xml_members(zip_path: Path) -> List[str]:
+    """Membres XML d'un ZIP (mode extract_mode=stream : le ZIP est lu directement par 02-BUILD_CSV)."""
+    with zipfile.ZipFile(zip_path, "r") as z:
+        return [name for name in z.namelist() if name.lower().endswith(".xml")]
+
+
 def yyyymmdd(d: date) -> str:
     return d.strftime("%Y%m%d")
 
@@ -256,57 +510,234 @@ def daterange(d1: date, d2: date):
         cur += timedelta(days=1)
 
 
-def fetch_fulins_for_date(pool_date: date, data_dir: Path, conn: pyodbc.Connection, run_ts: str) -> Tuple[int, int]:
-    d = yyyymmdd(pool_date)
-    sql_log_line(conn, f"ESMA SOLR FULL list for publication_date={pool_date.isoformat()}", element="FULL_QUERY", complement=f"run_ts={run_ts}")
-    docs_all = solr_search_by_date_range(pool_date.isoformat(), pool_date.isoformat(), rows=1000, max_rows=50000)
-    # garder uniquement les ZIP FULINS dont le nom contient la date de pool
-    docs = [dct for dct in docs_all if (doc_filename(dct, '').upper().startswith('FULINS_') and f'_{d}_' in doc_filename(dct, '').upper())]
+# ----------------------------
+# Cache local des téléchargements (data/archive/firds_cache, survit à la purge)
+# ----------------------------
+def cache_zip_path(cache_dir: Path, doc: Dict, fallback_name: str) -> Path:
+    """
+    Clé de cache = nom de fichier + checksum (ou taille) du doc SOLR :
+    un fichier republié sous le même nom avec un autre contenu n'est jamais confondu.
+    """
+    name = doc_filename(doc, fallback_name)
+    stem, ext = os.path.splitext(name)
+    checksum = doc_checksum(doc)
+    size = doc_expected_size(doc)
+    if checksum:
+        tag = re.sub(r"[^0-9a-z]", "", checksum)[:16]
+    elif size is not None:
+        tag = f"s{size}"
+    else:
+        tag = "nosig"
+    return cache_dir / (_doc_file_type(name) or "OTHER") / f"{stem}__{tag}{ext}"
+
+
+def _cache_members_dir(cache_zip: Path) -> Path:
+    return cache_zip.with_name(cache_zip.name + ".d")
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Hard link (même volume, instantané) sinon copie."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
 
-    download_dir = data_dir / "downloaded" / "FULINS" / d
-    extract_dir = data_dir / "extracted" / "FULINS" / d
 
-    zip_count = 0
-    xml_count = 0
+def _cache_touch(cache_zip: Path) -> None:
+    # mtime = date de dernier usage (base de l'éviction)
+    try:
+        os.utime(cache_zip, None)
+    except OSError:
+        pass
+
+
+def _cache_entry_size(cache_zip: Path) -> int:
+    size = cache_zip.stat().st_size
+    members = _cache_members_dir(cache_zip)
+    if members.is_dir():
+        size += sum(p.stat().st_size for p in members.iterdir() if p.is_file())
+    return size
+
+
+def cache_evict(cache_dir: Path, retention_days: int, max_gb: float) -> Tuple[int, int]:
+    """
+    Éviction par politique (au lieu du rmtree systématique) :
+    - entrées non utilisées depuis plus de retention_days jours (0 = pas de limite d'âge) ;
+    - puis les moins récemment utilisées tant que le cache dépasse max_gb Go (0 = pas de limite de taille).
+    Une entrée = le ZIP + ses XML extraits (<zip>.d). Retourne (entrées supprimées, octets libérés).
+    """
+    if not cache_dir.exists():
+        return 0, 0
+    # .part orphelins (téléchargement interrompu) : gardés pour reprise, sauf s'ils sont eux aussi périmés
+    entries = []
+    for p in cache_dir.rglob("*"):
+        if p.is_file() and (p.name.lower().endswith(".zip") or p.name.lower().endswith(".zip.part")):
+            entries.append((p.stat().st_mtime, p, _cache_entry_size(p)))
+    entries.sort()
+
+    cutoff = time.time() - retention_days * 86400 if retention_days > 0 else None
+    max_bytes = int(max_gb * 1024 ** 3) if max_gb > 0 else None
+    total = sum(e[2] for e in entries)
+
+    removed = 0
+    freed = 0
+    for mtime, p, size in entries:
+        too_old = cutoff is not None and mtime < cutoff
+        too_big = max_bytes is not None and total > max_bytes
+        if not (too_old or too_big):
+            continue
+        p.unlink(missing_ok=True)
+        shutil.rmtree(_cache_members_dir(p), ignore_errors=True)
+        total -= size
+        freed += size
+        removed += 1
+    return removed, freed
 
+
+def cache_hit_count(cache_dir: Path, docs: List[Dict], fallback_name: str) -> int:
+    n = 0
     for doc in docs:
-        url = doc_download_url(doc)
-        if not url:
+        if not doc_download_url(doc):
             continue
-        fname = doc_filename(doc, f"FULINS_{d}.zip")
-        out_zip = download_dir / fname
-        download_file(url, out_zip)
-        zip_count += 1
-        xmls = extract_zip_xml_only(out_zip, extract_dir)
-        xml_count += len(xmls)
+        cached = cache_zip_path(cache_dir, doc, fallback_name)
+        size = doc_expected_size(doc)
+        if cached.exists() and (size is None or cached.stat().st_size == size):
+            n += 1
+    return n
+
+
+def _fetch_via_cache(doc: Dict, out_zip: Path, cache_zip: Path, retries: int) -> None:
+    # download_file ne fait rien si le fichier du cache est déjà complet (taille SOLR)
+    download_file(doc_download_url(doc), cache_zip, doc_expected_size(doc), doc_checksum(doc), retries)
+    _cache_touch(cache_zip)
+    link_or_copy(cache_zip, out_zip)
+
+
+def _extract_via_cache(cache_zip: Path, extract_dir: Path) -> List[Path]:
+    # extraction une seule fois dans le cache, puis liens vers extracted/
+    cached_xmls = extract_zip_xml_only(cache_zip, _cache_members_dir(cache_zip))
+    out = []
+    for x in cached_xmls:
+        target = extract_dir / x.name
+        link_or_copy(x, target)
+        out.append(target)
+    return out
+
+
+def download_and_extract_docs(docs: List[Dict], download_dir: Path, extract_dir: Path, fallback_name: str, workers: int,
+                              retries: int = DOWNLOAD_RETRIES_DEFAULT, extract_mode: str = "unzip",
+                              cache_dir: Optional[Path] = None) -> Tuple[int, int]:
+    """
+    Télécharge les ZIP des docs SOLR via un pool borné de `workers` threads.
+    Chaque ZIP terminé est extrait (thread appelant) pendant que les autres continuent à télécharger.
+    En extract_mode=stream, rien n'est extrait : on ne fait que compter les membres XML.
+    Avec cache_dir, le réseau n'est sollicité que pour les ZIP absents du cache (voir cache_zip_path).
+    Retourne (zip_count, xml_count), mêmes compteurs que la boucle séquentielle historique.
+    """
+    return download_and_extract_batches([(docs, download_dir, extract_dir, fallback_name)], workers, retries, extract_mode, cache_dir)
+
+
+def download_and_extract_batches(batches: List[Tuple[List[Dict], Path, Path, str]], workers: int,
+                                 retries: int = DOWNLOAD_RETRIES_DEFAULT, extract_mode: str = "unzip",
+                                 cache_dir: Optional[Path] = None) -> Tuple[int, int]:
+    """
+    Variante multi-lots de download_and_extract_docs : batches = [(docs, download_dir, extract_dir, fallback_name), ...].
+    Tous les ZIP de tous les lots partagent le même pool (rattrapage DLTINS : plusieurs dates en un seul passage).
+    """
+    jobs: Dict[Path, Tuple[Dict, Path, Optional[Path]]] = {}
+    for docs, download_dir, extract_dir, fallback_name in batches:
+        for doc in docs:
+            if not doc_download_url(doc):
+                continue
+            out_zip = download_dir / doc_filename(doc, fallback_name)
+            cache_zip = cache_zip_path(cache_dir, doc, fallback_name) if cache_dir is not None else None
+            jobs.setdefault(out_zip, (doc, extract_dir, cache_zip))
+
+    zip_count = 0
+    xml_count = 0
+    if not jobs:
+        return zip_count, xml_count
+
+    pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="esma_dl")
+    try:
+        futures = {}
+        for out_zip, (doc, _, cache_zip) in jobs.items():
+            if cache_zip is None:
+                fut = pool.submit(download_file, doc_download_url(doc), out_zip, doc_expected_size(doc), doc_checksum(doc), retries)
+            else:
+                fut = pool.submit(_fetch_via_cache, doc, out_zip, cache_zip, retries)
+            futures[fut] = out_zip
+        for fut in as_completed(futures):
+            out_zip = futures[fut]
+            fut.result()
+            zip_count += 1
+            _, extract_dir, cache_zip = jobs[out_zip]
+            if extract_mode == "stream":
+                xml_count += len(list_zip_xml_members(out_zip))
+            elif cache_zip is not None:
+                xml_count += len(_extract_via_cache(cache_zip, extract_dir))
+            else:
+                xmls = extract_zip_xml_only(out_zip, extract_dir)
+                xml_count += len(xmls)
+    except BaseException:
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    pool.shutdown(wait=True)
 
     return zip_count, xml_count
 
 
-def fetch_dltins_for_date(dt: date, data_dir: Path, conn: pyodbc.Connection, run_ts: str) -> Tuple[int, int]:
+def fetch_fulins_for_date(pool_date: date, data_dir: Path, conn: pyodbc.Connection, run_ts: str, cat: sqlite3.Connection,
+                          workers: int = DOWNLOAD_WORKERS_DEFAULT, retries: int = DOWNLOAD_RETRIES_DEFAULT,
+                          extract_mode: str = "unzip", cache_dir: Optional[Path] = None) -> Tuple[int, int]:
+    d = yyyymmdd(pool_date)
+    # liste des ZIP FULINS du pool, lue dans le catalogue local (plus de requête SOLR ici)
+    docs = catalogue_docs_for_date(cat, "FULINS", pool_date)
+    sql_log_line(conn, f"CATALOGUE FULL list for pool={pool_date.isoformat()} docs={len(docs)}", element="FULL_QUERY", complement=f"run_ts={run_ts}")
+    if cache_dir is not None:
+        sql_log_line(conn, f"CACHE FULL hits={cache_hit_count(cache_dir, docs, f'FULINS_{d}.zip')}/{len(docs)}", element="FULL_CACHE", complement=f"run_ts={run_ts}")
+
+    download_dir = data_dir / "downloaded" / "FULINS" / d
+    extract_dir = data_dir / "extracted" / "FULINS" / d
+
+    return download_and_extract_docs(docs, download_dir, extract_dir, f"FULINS_{d}.zip", workers, retries, extract_mode, cache_dir)
+
+
+def fetch_dltins_for_date(dt: date, data_dir: Path, conn: pyodbc.Connection, run_ts: str, cat: sqlite3.Connection,
+                          workers: int = DOWNLOAD_WORKERS_DEFAULT, retries: int = DOWNLOAD_RETRIES_DEFAULT,
+                          extract_mode: str = "unzip", cache_dir: Optional[Path] = None) -> Tuple[int, int]:
     d = yyyymmdd(dt)
-    sql_log_line(conn, f"ESMA SOLR DELTA list for publication_date={dt.isoformat()}", element="DELTA_QUERY", complement=f"run_ts={run_ts}")
-    docs_all = solr_search_by_date_range(dt.isoformat(), dt.isoformat(), rows=2000, max_rows=50000)
-    docs = [dct for dct in docs_all if (doc_filename(dct, '').upper().startswith('DLTINS_') and doc_filename(dct, '').upper().startswith(f'DLTINS_{d}_'))]
+    docs = catalogue_docs_for_date(cat, "DLTINS", dt)
+    sql_log_line(conn, f"CATALOGUE DELTA list for date={dt.isoformat()} docs={len(docs)}", element="DELTA_QUERY", complement=f"run_ts={run_ts}")
+    if cache_dir is not None:
+        sql_log_line(conn, f"CACHE DELTA hits={cache_hit_count(cache_dir, docs, f'DLTINS_{d}.zip')}/{len(docs)}", element="DELTA_CACHE", complement=f"date={dt.isoformat()} run_ts={run_ts}")
 
-    download_dir = data_dir / "downloaded" / "DLTINS"
+    # un sous-dossier par date (comme FULINS) : 02-BUILD_CSV peut y lire les ZIP en extract_mode=stream
+    download_dir = data_dir / "downloaded" / "DLTINS" / d
     extract_dir = data_dir / "extracted" / "DLTINS" / d
 
-    zip_count = 0
-    xml_count = 0
+    return download_and_extract_docs(docs, download_dir, extract_dir, f"DLTINS_{d}.zip", workers, retries, extract_mode, cache_dir)
 
-    for doc in docs:
-        url = doc_download_url(doc)
-        if not url:
-            continue
-        fname = doc_filename(doc, f"DLTINS_{d}.zip")
-        out_zip = download_dir / fname
-        download_file(url, out_zip)
-        zip_count += 1
-        xmls = extract_zip_xml_only(out_zip, extract_dir)
-        xml_count += len(xmls)
 
-    return zip_count, xml_count
+def fetch_dltins_for_dates(dates: List[date], data_dir: Path, conn: pyodbc.Connection, run_ts: str, cat: sqlite3.Connection,
+                           workers: int = DOWNLOAD_WORKERS_DEFAULT, retries: int = DOWNLOAD_RETRIES_DEFAULT,
+                           extract_mode: str = "unzip", cache_dir: Optional[Path] = None) -> Tuple[int, int]:
+    """
+    Rattrapage DLTINS : toutes les dates manquantes téléchargées dans un seul pool,
+    chacune dans son propre dossier <date> (l'ordre d'application est géré en aval par date croissante).
+    """
+    batches = []
+    for dt in dates:
+        d = yyyymmdd(dt)
+        docs = catalogue_docs_for_date(cat, "DLTINS", dt)
+        sql_log_line(conn, f"CATALOGUE DELTA list for date={dt.isoformat()} docs={len(docs)}", element="DELTA_QUERY", complement=f"run_ts={run_ts}")
+        if cache_dir is not None:
+            sql_log_line(conn, f"CACHE DELTA hits={cache_hit_count(cache_dir, docs, f'DLTINS_{d}.zip')}/{len(docs)}", element="DELTA_CACHE", complement=f"date={dt.isoformat()} run_ts={run_ts}")
+        batches.append((docs, data_dir / "downloaded" / "DLTINS" / d, data_dir / "extracted" / "DLTINS" / d, f"DLTINS_{d}.zip"))
+
+    return download_and_extract_batches(batches, workers, retries, extract_mode, cache_dir)
 
 
 # ----------------------------
@@ -329,53 +760,254 @@ def _extract_date_from_name(name: str, kind: str) -> Optional[date]:
         return None
 
 
-def get_latest_available_full_date(conn: pyodbc.Connection, run_ts: str) -> Optional[date]:
-    """
-    Détecte la dernière date 'pool' FULINS disponible en scannant les publications des N derniers jours.
-    On utilise la mécanique ESMA recommandée : q=* + fq=publication_date:[... TO ...].
-    """
-    lookback_days = 45
-    end = datetime.utcnow().date()
-    start = end - timedelta(days=lookback_days)
+# ----------------------------
+# Catalogue local des fichiers FIRDS (data/archive, survit à la purge)
+# ----------------------------
+CATALOGUE_DDL = """
+CREATE TABLE IF NOT EXISTS firds_files (
+    file_name        TEXT PRIMARY KEY,
+    file_type        TEXT NOT NULL,
+    file_date        TEXT,
+    publication_date TEXT NOT NULL,
+    download_link    TEXT,
+    file_size        INTEGER,
+    checksum         TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_firds_files_type_date ON firds_files (file_type, file_date);
+CREATE INDEX IF NOT EXISTS ix_firds_files_publication ON firds_files (publication_date);
+"""
+
+
+def catalogue_open(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cat = sqlite3.connect(str(path))
+    cat.row_factory = sqlite3.Row
+    cat.executescript(CATALOGUE_DDL)
+    return cat
 
-    sql_log_line(conn, f"ESMA SOLR scan FULL last {lookback_days} days", element="FULL_LATEST_SCAN", complement=f"{start.isoformat()}..{end.isoformat()} run_ts={run_ts}")
-    docs = solr_search_by_date_range(start.isoformat(), end.isoformat(), rows=1000, max_rows=200000)
 
-    best: Optional[date] = None
+def _doc_file_type(name: str) -> str:
+    return name.split("_", 1)[0].upper() if "_" in name else ""
+
+
+def catalogue_upsert_docs(cat: sqlite3.Connection, docs) -> int:
+    n = 0
     for doc in docs:
         name = doc_filename(doc, "")
-        if not name:
-            continue
-        if not name.upper().startswith("FULINS_"):
+        pub = doc.get("publication_date") or ""
+        if not name or not pub:
             continue
-        d = _extract_date_from_name(name, "FULL")
-        if d and (best is None or d > best):
-            best = d
+        ftype = _doc_file_type(name)
+        fdate = _extract_date_from_name(name, "FULL" if ftype == "FULINS" else "DELTA") if ftype in ("FULINS", "DLTINS") else None
+        cat.execute(
+            """
+            INSERT INTO firds_files (file_name, file_type, file_date, publication_date, download_link, file_size, checksum)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(file_name) DO UPDATE SET
+                file_type = excluded.file_type,
+                file_date = excluded.file_date,
+                publication_date = excluded.publication_date,
+                download_link = excluded.download_link,
+                file_size = excluded.file_size,
+                checksum = excluded.checksum
+            """,
+            (name, ftype, fdate.isoformat() if fdate else None, str(pub), doc_download_url(doc),
+             doc_expected_size(doc), doc_checksum(doc)),
+        )
+        n += 1
+    cat.commit()
+    return n
+
+
+def catalogue_refresh(cat: sqlite3.Connection, conn: pyodbc.Connection, run_ts: str,
+                      lookback_days: int = CATALOGUE_LOOKBACK_DAYS_DEFAULT,
+                      page_workers: int = SOLR_PAGE_WORKERS_DEFAULT, use_cursor: bool = False) -> int:
+    """
+    Rafraîchissement incrémental : une seule requête SOLR sur les publications
+    depuis la dernière publication_date connue (jour inclus, pour les publications tardives du même jour).
+    Premier lancement (catalogue vide) : fenêtre de lookback_days jours.
+    """
+    end = datetime.utcnow().date()
+    last_pub = cat.execute("SELECT MAX(publication_date) FROM firds_files").fetchone()[0]
+    if last_pub:
+        start = datetime.strptime(str(last_pub)[:10], "%Y-%m-%d").date()
+    else:
+        start = end - timedelta(days=lookback_days)
+
+    sql_log_line(conn, "CATALOGUE refresh from ESMA SOLR", element="CATALOGUE_REFRESH", complement=f"{start.isoformat()}..{end.isoformat()} last_pub={last_pub} run_ts={run_ts}")
+    # flux de docs : upsert page par page, sans matérialiser les 200k docs en mémoire
+    docs = solr_iter_by_date_range(start.isoformat(), end.isoformat(), rows=1000, max_rows=200000,
+                                   workers=page_workers, use_cursor=use_cursor)
+    n = catalogue_upsert_docs(cat, docs)
+    sql_log_line(conn, f"CATALOGUE_RESULT - docs_upserted={n}", element="CATALOGUE_RESULT", complement=f"run_ts={run_ts}")
+    return n
+
+
+def catalogue_latest_date(cat: sqlite3.Connection, file_type: str) -> Optional[date]:
+    v = cat.execute("SELECT MAX(file_date) FROM firds_files WHERE file_type = ?", (file_type,)).fetchone()[0]
+    return datetime.strptime(v, "%Y-%m-%d").date() if v else None
+
+
+def catalogue_docs_for_date(cat: sqlite3.Connection, file_type: str, d: date) -> List[Dict]:
+    """Docs (au format SOLR : file_name, download_link, file_size, checksum) d'un type pour une date de fichier."""
+    rows = cat.execute(
+        """
+        SELECT file_name, publication_date, download_link, file_size, checksum
+        FROM firds_files
+        WHERE file_type = ? AND file_date = ?
+        ORDER BY file_name
+        """,
+        (file_type, d.isoformat()),
+    ).fetchall()
+    return [{k: r[k] for k in r.keys() if r[k] is not None} for r in rows]
+
+
+def catalogue_dates(cat: sqlite3.Connection, file_type: str, start: date, end: date) -> List[date]:
+    """Dates de fichier disponibles dans le catalogue pour un type, entre start et end inclus (ordre croissant)."""
+    rows = cat.execute(
+        "SELECT DISTINCT file_date FROM firds_files WHERE file_type = ? AND file_date BETWEEN ? AND ? ORDER BY file_date",
+        (file_type, start.isoformat(), end.isoformat()),
+    ).fetchall()
+    return [datetime.strptime(r[0], "%Y-%m-%d").date() for r in rows]
+
+
+def get_latest_available_full_date(cat: sqlite3.Connection, conn: pyodbc.Connection, run_ts: str) -> Optional[date]:
+    """
+    Dernière date 'pool' FULINS disponible, lue dans le catalogue local (rafraîchi juste avant).
+    """
+    best = catalogue_latest_date(cat, "FULINS")
+    sql_log_line(conn, f"CATALOGUE latest FULL={best}", element="FULL_LATEST_SCAN", complement=f"run_ts={run_ts}")
     return best
 
 
-def get_latest_available_delta_date(conn: pyodbc.Connection, run_ts: str) -> Optional[date]:
+def get_latest_available_delta_date(cat: sqlite3.Connection, conn: pyodbc.Connection, run_ts: str) -> Optional[date]:
     """
-    Détecte la dernière date DLTINS disponible en scannant les publications des N derniers jours.
+    Dernière date DLTINS disponible, lue dans le catalogue local (rafraîchi juste avant).
     """
-    lookback_days = 45
-    end = datetime.utcnow().date()
-    start = end - timedelta(days=lookback_days)
+    best = catalogue_latest_date(cat, "DLTINS")
+    sql_log_line(conn, f"CATALOGUE latest DELTA={best}", element="DELTA_LATEST_SCAN", complement=f"run_ts={run_ts}")
+    return best
 
-    sql_log_line(conn, f"ESMA SOLR scan DELTA last {lookback_days} days", element="DELTA_LATEST_SCAN", complement=f"{start.isoformat()}..{end.isoformat()} run_ts={run_ts}")
-    docs = solr_search_by_date_range(start.isoformat(), end.isoformat(), rows=2000, max_rows=200000)
 
-    best: Optional[date] = None
-    for doc in docs:
-        name = doc_filename(doc, "")
-        if not name:
-            continue
-        if not name.upper().startswith("DLTINS_"):
-            continue
-        d = _extract_date_from_name(name, "DELTA")
-        if d and (best is None or d > best):
-            best = d
-    return best
+# ----------------------------
+# Mode delta-only : FULL rechargé seulement si nécessaire
+# ----------------------------
+def sql_applied_delta_dates(conn: pyodbc.Connection, since: date) -> Optional[set]:
+    """Dates DLTINS déjà appliquées après `since` ; None si la table de trace est absente/inaccessible."""
+    try:
+        cur = conn.cursor()
+        cur.execute(SQL_APPLIED_DELTA_DATES, since)
+        rows = cur.fetchall()
+        cur.close()
+    except pyodbc.Error:
+        return None
+    out = set()
+    for (v,) in rows:
+        if isinstance(v, datetime):
+            v = v.date()
+        if v is not None:
+            out.add(v)
+    return out
+
+
+def delta_chain_gaps(cat: sqlite3.Connection, conn: pyodbc.Connection, last_full: date, last_delta: Optional[date]) -> Optional[List[date]]:
+    """
+    Dates DLTINS publiées (catalogue) entre last_full+1 et last_delta mais jamais appliquées.
+    None si la continuité ne peut pas être prouvée (aucun delta, trace SQL absente, catalogue trop court).
+    """
+    if last_delta is None or last_delta <= last_full:
+        return None
+    first_known = cat.execute("SELECT MIN(file_date) FROM firds_files WHERE file_type = 'DLTINS'").fetchone()[0]
+    if not first_known or first_known > (last_full + timedelta(days=1)).isoformat():
+        return None
+    applied = sql_applied_delta_dates(conn, last_full)
+    if applied is None:
+        return None
+    expected = catalogue_dates(cat, "DLTINS", last_full + timedelta(days=1), last_delta)
+    return [dt for dt in expected if dt not in applied]
+
+
+def _load_build_csv_module():
+    """02-BUILD_CSV chargé par chemin (nom non importable) : même parseur FULINS que le run normal."""
+    path = Path(__file__).resolve().parent / "02-ETL_ESMA_DAILY_BUILD_CSV_AUTONOME.py"
+    spec = importlib.util.spec_from_file_location("esma_build_csv", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _sample_fulins_rows(zip_path: Path, n: int) -> List[Dict[str, str]]:
+    """Les n premiers RefData (avec ISIN) du ZIP, parsés par extract_record_fulins de 02-BUILD_CSV."""
+    build = _load_build_csv_module()
+    rows: List[Dict[str, str]] = []
+    with zipfile.ZipFile(zip_path, "r") as z:
+        members = [name for name in z.namelist() if name.lower().endswith(".xml")]
+        for name in members:
+            with z.open(name) as fh:
+                for _, elem in ET.iterparse(fh, events=("end",)):
+                    if not str(elem.tag).endswith("}RefData"):
+                        continue
+                    row = build.extract_record_fulins(elem, {}, Path(name).name, len(rows) + 1)
+                    elem.clear()
+                    if row.get("ISIN"):
+                        rows.append({c: build.sanitize(row.get(c, "")) for c in ["ISIN", "TradingVenueMIC"] + FULL_SAMPLE_COLUMNS})
+                    if len(rows) >= n:
+                        return rows
+    return rows
+
+
+def sample_full_mismatch(cat: sqlite3.Connection, conn: pyodbc.Connection, pool_date: date, data_dir: Path,
+                         cache_dir: Optional[Path], n: int, retries: int = DOWNLOAD_RETRIES_DEFAULT) -> Tuple[int, int]:
+    """
+    Contrôle par échantillon : le plus petit ZIP du nouveau pool FULL est téléchargé (dans le cache s'il est actif,
+    il resservira si le FULL doit finalement être rechargé), ses n premiers enregistrements sont comparés
+    aux lignes ouvertes de stg.ESMA_FULINS_WIDE. Les lignes modifiées par un DLTINS postérieur au pool sont ignorées.
+    Retourne (comparés, écarts).
+    """
+    docs = [doc for doc in catalogue_docs_for_date(cat, "FULINS", pool_date) if doc_download_url(doc)]
+    if not docs:
+        return 0, 0
+    doc = min(docs, key=lambda x: doc_expected_size(x) or float("inf"))
+    fallback = f"FULINS_{yyyymmdd(pool_date)}.zip"
+    if cache_dir is not None:
+        zip_path = cache_zip_path(cache_dir, doc, fallback)
+    else:
+        zip_path = data_dir / "downloaded" / "FULINS_SAMPLE" / doc_filename(doc, fallback)
+    download_file(doc_download_url(doc), zip_path, doc_expected_size(doc), doc_checksum(doc), retries)
+
+    sample = _sample_fulins_rows(zip_path, n)
+    compared = 0
+    mismatched = 0
+    chunk = 500  # 2 paramètres par clé, sous la limite SQL Server de 2100
+    cols = ", ".join(f"f.{c}" for c in FULL_SAMPLE_COLUMNS)
+    for i in range(0, len(sample), chunk):
+        part = sample[i:i + chunk]
+        values = ", ".join("(?, ?)" for _ in part)
+        params = [v for r in part for v in (r["ISIN"], r["TradingVenueMIC"])]
+        cur = conn.cursor()
+        cur.execute(
+            f"""
+            SELECT f.ISIN, f.TradingVenueMIC, f.SourceFileName, {cols}
+            FROM stg.ESMA_FULINS_WIDE f
+            JOIN (VALUES {values}) k(ISIN, MIC)
+              ON f.ISIN = k.ISIN AND f.TradingVenueMIC = k.MIC
+            WHERE f.LatestRecordFlag = 1 AND f.ValidToDate IS NULL
+            """,
+            params,
+        )
+        db = {(r[0], r[1]): r for r in cur.fetchall()}
+        cur.close()
+
+        for r in part:
+            hit = db.get((r["ISIN"], r["TradingVenueMIC"]))
+            if hit is not None:
+                src_date = _extract_date_from_name(hit[2] or "", "DELTA")
+                if src_date is not None and src_date > pool_date:
+                    continue
+            compared += 1
+            if hit is None or any((hit[3 + k] or "").strip() != r[c] for k, c in enumerate(FULL_SAMPLE_COLUMNS)):
+                mismatched += 1
+    return compared, mismatched
 
 
 # ----------------------------
@@ -393,26 +1025,55 @@ def main() -> int:
     cfg = load_config()
     ##print("[DEBUG] SQLSERVER keys:", list(cfg["SQLSERVER"].keys()))
 
+    # [ESMA] solr_url : autre endpoint SOLR (ex. miroir local bench/firds_mirror.py)
+    global ESMA_SOLR
+    ESMA_SOLR = cfg.get("ESMA", "solr_url", fallback="").strip() or ESMA_SOLR
+
     conn = sql_conn(cfg)
 
     data_dir = root_dir / "data"
+    download_workers = cfg.getint("ESMA", "download_workers", fallback=DOWNLOAD_WORKERS_DEFAULT)
+    download_retries = cfg.getint("ESMA", "download_retries", fallback=DOWNLOAD_RETRIES_DEFAULT)
+    catalogue_lookback = cfg.getint("ESMA", "catalogue_lookback_days", fallback=CATALOGUE_LOOKBACK_DAYS_DEFAULT)
+    solr_page_workers = cfg.getint("ESMA", "solr_page_workers", fallback=SOLR_PAGE_WORKERS_DEFAULT)
+    solr_use_cursor = cfg.getboolean("ESMA", "solr_use_cursor", fallback=False)
+    extract_mode = cfg.get("ESMA", "extract_mode", fallback="unzip").strip().lower()
+    if extract_mode not in EXTRACT_MODES:
+        raise ValueError(f"Invalid [ESMA].extract_mode={extract_mode!r} (expected one of {EXTRACT_MODES})")
+    delta_catchup = cfg.getboolean("ESMA", "delta_catchup", fallback=False)
+    delta_catchup_max_days = cfg.getint("ESMA", "delta_catchup_max_days", fallback=DELTA_CATCHUP_MAX_DAYS_DEFAULT)
+    cache_dir: Optional[Path] = data_dir / "archive" / "firds_cache"
+    if not cfg.getboolean("ESMA", "download_cache", fallback=False):
+        cache_dir = None
+    cache_retention_days = cfg.getint("ESMA", "cache_retention_days", fallback=CACHE_RETENTION_DAYS_DEFAULT)
+    cache_max_gb = cfg.getfloat("ESMA", "cache_max_gb", fallback=CACHE_MAX_GB_DEFAULT)
+    delta_only = cfg.getboolean("ESMA", "delta_only", fallback=False)
+    full_reconcile_days = cfg.getint("ESMA", "full_reconcile_days", fallback=FULL_RECONCILE_DAYS_DEFAULT)
+    full_sample_records = cfg.getint("ESMA", "full_sample_records", fallback=FULL_SAMPLE_RECORDS_DEFAULT)
+    full_sample_max_mismatch_pct = cfg.getfloat("ESMA", "full_sample_max_mismatch_pct", fallback=FULL_SAMPLE_MAX_MISMATCH_PCT_DEFAULT)
+    cat = catalogue_open(data_dir / "archive" / "firds_catalogue.sqlite")
 
     try:
-        sql_log_line(conn, "BEGIN", element="GET_FILES", complement=f"run_ts={run_ts}")
+        sql_log_line(conn, "BEGIN", element="GET_FILES", complement=f"run_ts={run_ts} download_workers={download_workers} extract_mode={extract_mode}")
 
         # STEP0 purge
         sql_log_line(conn, "STEP0 - Purge data directory (except data/archive)", element="STEP0", complement=f"data_dir={data_dir} run_ts={run_ts}")
         purge_data_dir(data_dir, conn)
         sql_log_line(conn, "STEP0_RESULT - Purge done", element="STEP0_RESULT", complement=f"run_ts={run_ts}")
+        if cache_dir is not None:
+            # les ZIP/XML déjà téléchargés restent dans data/archive/firds_cache : seule la politique d'éviction les supprime
+            removed, freed = cache_evict(cache_dir, cache_retention_days, cache_max_gb)
+            sql_log_line(conn, f"STEP0_CACHE - evicted={removed} freed_mb={freed // (1024 * 1024)}", element="STEP0_CACHE", complement=f"cache_dir={cache_dir} retention_days={cache_retention_days} max_gb={cache_max_gb} run_ts={run_ts}")
 
         # STEP1 last loaded
         last_full = sql_scalar_date(conn, SQL_LAST_LOADED_FULL)
         last_delta = sql_scalar_date(conn, SQL_LAST_LOADED_DELTA)
         sql_log_line(conn, f"LAST_LOADED - FULL={last_full} DELTA={last_delta}", element="LAST_LOADED", complement=f"run_ts={run_ts}")
 
-        # STEP2 latest available
-        latest_full = get_latest_available_full_date(conn, run_ts)
-        latest_delta = get_latest_available_delta_date(conn, run_ts)
+        # STEP2 latest available (catalogue local + delta SOLR incrémental)
+        catalogue_refresh(cat, conn, run_ts, catalogue_lookback, solr_page_workers, solr_use_cursor)
+        latest_full = get_latest_available_full_date(cat, conn, run_ts)
+        latest_delta = get_latest_available_delta_date(cat, conn, run_ts)
         sql_log_line(conn, f"LATEST_AVAILABLE - FULL={latest_full} DELTA={latest_delta}", element="LATEST_AVAILABLE", complement=f"run_ts={run_ts}")
 
         # PLAN
@@ -420,6 +1081,28 @@ def main() -> int:
         if latest_full is not None and (last_full is None or last_full < latest_full):
             full_to_get = latest_full
 
+        # Mode delta-only : le nouveau FULL n'est rechargé que si la chaîne DLTINS est rompue,
+        # si le dernier FULL chargé a plus de full_reconcile_days jours, ou si l'échantillon diverge.
+        if full_to_get is not None and delta_only and last_full is not None:
+            age = (full_to_get - last_full).days
+            gaps = delta_chain_gaps(cat, conn, last_full, last_delta)
+            if age >= full_reconcile_days:
+                reason = f"reconcile age={age}d >= {full_reconcile_days}d"
+            elif gaps is None:
+                reason = "DLTINS chain unverifiable"
+            elif gaps:
+                reason = f"DLTINS chain broken missing={len(gaps)} first={gaps[0]}"
+            else:
+                compared, mismatched = sample_full_mismatch(cat, conn, full_to_get, data_dir, cache_dir, full_sample_records, download_retries)
+                pct = (100.0 * mismatched / compared) if compared else 100.0
+                sql_log_line(conn, f"DELTA_ONLY sample compared={compared} mismatched={mismatched} pct={pct:.3f}", element="DELTA_ONLY_SAMPLE", complement=f"pool={full_to_get} max_pct={full_sample_max_mismatch_pct} run_ts={run_ts}")
+                reason = f"sample mismatch pct={pct:.3f} > {full_sample_max_mismatch_pct}" if pct > full_sample_max_mismatch_pct else None
+            if reason is None:
+                sql_log_line(conn, "DELTA_ONLY - Skip FULL reload (DLTINS chain unbroken)", element="DELTA_ONLY", complement=f"pool={full_to_get} last_full={last_full} last_delta={last_delta} run_ts={run_ts}")
+                full_to_get = None
+            else:
+                sql_log_line(conn, f"DELTA_ONLY - FULL reload required: {reason}", element="DELTA_ONLY", complement=f"pool={full_to_get} last_full={last_full} last_delta={last_delta} run_ts={run_ts}")
+
         delta_from: Optional[date] = None
         delta_to: Optional[date] = latest_delta
 
@@ -439,13 +1122,15 @@ def main() -> int:
         # STEP3 FULL
         if full_to_get is not None:
             sql_log_line(conn, "STEP3 - Download/Extract FULL files", element="STEP3", complement=f"pool={full_to_get} run_ts={run_ts}")
-            zc, xc = fetch_fulins_for_date(full_to_get, data_dir, conn, run_ts)
+            zc, xc = fetch_fulins_for_date(full_to_get, data_dir, conn, run_ts, cat, download_workers, download_retries, extract_mode, cache_dir)
             sql_log_line(conn, f"STEP3_RESULT - FULL zips={zc} xmls={xc}", element="STEP3_RESULT", complement=f"pool={full_to_get} run_ts={run_ts}")
         else:
             sql_log_line(conn, "STEP3 - Skip FULL (already up-to-date)", element="STEP3_SKIP", complement=f"run_ts={run_ts}")
 
         # STEP4 DELTA (NOUVELLE REGLE) : on ne récupère QUE la date DELTA maximale disponible
         # Exemple : last_delta=2026-01-11, ESMA a 2026-01-11/12/13 -> on ne prend que 2026-01-13
+        # [ESMA] delta_catchup=true : on récupère toutes les dates delta_from..latest_delta (2026-01-12 et 2026-01-13),
+        # en parallèle ; 02/03/04 les appliquent ensuite une par une, par date croissante.
         if latest_delta is None:
             sql_log_line(conn, "STEP4 - Skip DELTA (no latest_delta)", element="STEP4_SKIP", complement=f"run_ts={run_ts}")
         else:
@@ -453,11 +1138,28 @@ def main() -> int:
             ref = last_delta or last_full
             if ref is not None and latest_delta <= ref:
                 sql_log_line(conn, "STEP4 - Skip DELTA (already up-to-date)", element="STEP4_SKIP", complement=f"latest={latest_delta} ref={ref} run_ts={run_ts}")
+            elif delta_catchup and delta_from is not None and delta_from < latest_delta:
+                catchup_dates = catalogue_dates(cat, "DLTINS", delta_from, latest_delta)
+                missing = [dt for dt in daterange(delta_from, latest_delta) if dt not in catchup_dates]
+                if missing:
+                    sql_log_line(conn, f"STEP4 - DELTA days absent from catalogue: {len(missing)}", element="STEP4_GAP", complement=",".join(dt.isoformat() for dt in missing)[:4000])
+                # on garde les plus anciennes : la chaîne reste continue, le reste sera rattrapé au prochain run
+                if len(catchup_dates) > delta_catchup_max_days:
+                    catchup_dates = catchup_dates[:delta_catchup_max_days]
+                sql_log_line(conn, f"STEP4 - Download/Extract DELTA catch-up days={len(catchup_dates)}", element="STEP4", complement=f"from={delta_from} to={latest_delta} ref={ref} run_ts={run_ts}")
+                zc, xc = fetch_dltins_for_dates(catchup_dates, data_dir, conn, run_ts, cat, download_workers, download_retries, extract_mode, cache_dir)
+                sql_log_line(conn, f"STEP4_RESULT - DELTA zips={zc} xmls={xc} days={len(catchup_dates)}", element="STEP4_RESULT", complement=f"dates={','.join(yyyymmdd(dt) for dt in catchup_dates)} run_ts={run_ts}")
             else:
                 sql_log_line(conn, "STEP4 - Download/Extract ONLY latest DELTA date", element="STEP4", complement=f"date={latest_delta} ref={ref} run_ts={run_ts}")
-                zc, xc = fetch_dltins_for_date(latest_delta, data_dir, conn, run_ts)
+                zc, xc = fetch_dltins_for_date(latest_delta, data_dir, conn, run_ts, cat, download_workers, download_retries, extract_mode, cache_dir)
                 sql_log_line(conn, f"STEP4_RESULT - DELTA zips={zc} xmls={xc}", element="STEP4_RESULT", complement=f"date={latest_delta} run_ts={run_ts}")
 
+        if cache_dir is not None:
+            # seconde éviction après STEP3/STEP4 : le cache revient sous cache_max_gb avec le pool qui vient d'arriver
+            # (data/downloaded et data/extracted en gardent des liens durs ou des copies pour 02-BUILD_CSV)
+            removed, freed = cache_evict(cache_dir, cache_retention_days, cache_max_gb)
+            sql_log_line(conn, f"STEP5_CACHE - evicted={removed} freed_mb={freed // (1024 * 1024)}", element="STEP5_CACHE", complement=f"cache_dir={cache_dir} retention_days={cache_retention_days} max_gb={cache_max_gb} run_ts={run_ts}")
+
         sql_log_line(conn, "END", element="END", complement=f"run_ts={run_ts}")
         return 0
 
@@ -468,6 +1170,10 @@ def main() -> int:
             pass
         raise
     finally:
+        try:
+            cat.close()
+        except Exception:
+            pass
         try:
             conn.close()
         except Exception:
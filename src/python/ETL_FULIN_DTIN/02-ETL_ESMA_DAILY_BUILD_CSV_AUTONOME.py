@@ -8,6 +8,9 @@ Script AUTONOME (sans argument) :
 - Cherche les XML déjà extraits sous :
     <DATA_ROOT>\extracted\DLTINS\<YYYYMMDD>\**\*.xml
     <DATA_ROOT>\extracted\FULINS\<YYYYMMDD>\**\*.xml
+  ou, si [ESMA] extract_mode = stream, lit les membres XML directement dans les ZIP :
+    <DATA_ROOT>\downloaded\DLTINS\<YYYYMMDD>\**\*.zip
+    <DATA_ROOT>\downloaded\FULINS\<YYYYMMDD>\**\*.zip
 
 Règle d'entrée :
 - DLTINS : on prend UNIQUEMENT le sous-répertoire de date MAX présent (un seul attendu).
@@ -17,6 +20,34 @@ Puis :
 - Construit les fichiers BSV (pipe-delimited) :
     <DATA_ROOT>\csv\FULINS\<YYYYMMDD>\FULINS_WIDE_<YYYYMMDD>.bsv
     <DATA_ROOT>\csv\DLTINS\<YYYYMMDD>\dltins_wide_<YYYYMMDD>.bsv
+- Si [ESMA] parse_workers > 1 : un part BSV par XML, parsé en parallèle (process pool), et un manifest :
+    <DATA_ROOT>\csv\<TYPE>\<YYYYMMDD>\parts\<stem>.partNNNN.bsv
+    <DATA_ROOT>\csv\<TYPE>\<YYYYMMDD>\<stem>.manifest.json   (lu par 03-LOAD_STG)
+  ([ESMA] parse_concat_parts = true : parts reconcaténés dans le BSV unique ci-dessus)
+  Un FULINS extrait de plus de [ESMA] parse_split_mb est découpé aux balises <RefData> : un part par tranche
+  (parse_workers > 1 seulement).
+- Si [ESMA] parse_resume = true (défaut false) : chaque part terminé est consigné dans parts\<stem>.checkpoint.json ;
+  une relance après incident ne reparse que les XML non terminés (ou modifiés). En séquentiel, les parts
+  sont alors reconcaténés dans le BSV unique.
+- DLTINS dédoublonné côté Python avant chargement STG (une ligne par ISIN, MIC, date de validité, action ;
+  même règle que l'ancien ROW_NUMBER de stg.usp_Process_DLTINS_Daily) : toujours un BSV unique.
+- Si [ESMA] instruments_output = true (défaut false) : fan-out des lignes FULINS, dans la même passe, en BSV typés et
+  dédoublonnés sur la PK (typage / routage de stg.usp_Load_ESMA_INSTRUMENTS_From_FULINS_WIDE), chargés tels quels
+  par 03-LOAD_STG dans stg.ESMA_INSTRUMENT_LISTING / _DEBT / _DERIVATIVE :
+    <DATA_ROOT>\csv\INSTRUMENTS\<YYYYMMDD>\ESMA_INSTRUMENT_<TABLE>.bsv
+- Si [ESMA] fulins_incremental = true : empreinte de contenu par (ISIN, MIC) de chaque ligne FULINS, comparée à
+  l'index du FULL précédent (<DATA_ROOT>\archive\fulins_hash_index.sqlite, promu par 03-LOAD_STG) ; jeu de
+  changements NEW / MOD / TERM au format DLTINS, appliqué par 03-LOAD_STG au lieu du rechargement complet :
+    <DATA_ROOT>\csv\FULINS_DIFF\<YYYYMMDD>\FULINS_DIFF_<YYYYMMDD>.bsv (+ .json, + index du FULL)
+- TechRcrdId : entier (bigint) déterministe, croissant dans l'ordre de lecture (fichiers triés par nom, puis RefData).
+- Si [ESMA] parquet_output = true (pyarrow requis) : copie colonnaire <stem>.parquet à côté du BSV
+  (ou sous [ESMA] parquet_dir\<TYPE>), row groups + encodage dictionnaire.
+
+Extraction des champs :
+- Chemins colonne -> balises lus dans firds_fields.py, généré depuis les XSD ESMA (doc/Spec_ESMA) par
+  tools/gen_firds_fields.py ; montée de version d'un XSD = relancer le générateur.
+- Un enregistrement à slots (liste alignée sur COLUMNS_FULINS_WIDE) réutilisé d'un RefData à l'autre ;
+  nettoyage + échappement par str.translate, écriture tamponnée (bench/bench_build_rows.py).
 
 Logging :
 - Toutes les étapes sont loguées dans [log].[ESMA_Load_Log].
@@ -59,28 +90,71 @@ except ImportError as e:
     raise
 
 import configparser
-import csv
 import hashlib
+import importlib.util
+import json
+import mmap
+import os
+import pickle
 import re
+import shutil
+import sqlite3
+import tempfile
 import traceback
 import xml.etree.ElementTree as ET
+import zipfile
+import zlib
+from contextlib import ExitStack, nullcontext
+from decimal import ROUND_HALF_UP, Context, Decimal
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 import pyodbc
 
+try:
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pacsv = pq = None
+
 SCRIPT_NAME = "02-ETL_ESMA_DAILY_BUILD_CSV_AUTONOME.py"
 DELIMITER = "|"
 
 DATA_ROOT = None
 CONFIG_DIR = None
 
-# Namespaces (identiques aux scripts historiques)
-NS_FUL = {"a": "urn:iso:std:iso:20022:tech:xsd:auth.017.001.02"}
-NS_DLT = {"a": "urn:iso:std:iso:20022:tech:xsd:auth.036.001.03"}
+
+def _load_firds_fields():
+    """Tables d'extraction générées depuis les XSD ESMA (firds_fields.py, cf. tools/gen_firds_fields.py)."""
+    path = Path(__file__).resolve().parent / "firds_fields.py"
+    if not path.exists():
+        raise RuntimeError(f"{path} introuvable : lancer tools/gen_firds_fields.py")
+    spec = importlib.util.spec_from_file_location("firds_fields", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+FIRDS_FIELDS = _load_firds_fields()
+
+# Namespaces des messages (targetNamespace des XSD auth.017 / auth.036)
+NS_FUL = {"a": FIRDS_FIELDS.FULINS_NS}
+NS_DLT = {"a": FIRDS_FIELDS.DLTINS_NS}
 
 SAN_RE = re.compile(r"[\r\n\t]+")
+# sanitize() + échappement BSV (csv QUOTE_NONE, escapechar "\\") en un seul str.translate par champ
+_BSV_FIELD = str.maketrans({"\r": " ", "\n": " ", "\t": " ", DELIMITER: " ", "\\": "\\\\", '"': '\\"'})
+BSV_WRITE_BUFFER = 1024 * 1024
 
 # Colonnes FULL (alignées stg.ESMA_FULINS_WIDE)
 COLUMNS_FULINS_WIDE = [
@@ -96,6 +170,87 @@ COLUMNS_FULINS_WIDE = [
 ]
 COLUMNS_DLT_STG = COLUMNS_FULINS_WIDE + ["ActionType"]
 
+# Moteur XML : lxml (iterparse filtré par tag) si disponible, sinon xml.etree (sortie BSV identique)
+XML_PARSERS = ("auto", "lxml", "stdlib")
+PARSE_WORKERS_DEFAULT = 1
+PARSE_SPLIT_MB_DEFAULT = 256.0
+MANIFEST_SUFFIX = ".manifest.json"
+CHECKPOINT_SUFFIX = ".checkpoint.json"
+PARQUET_ROW_GROUP_ROWS_DEFAULT = 250000
+# colonnes quasi uniques : pas de dictionnaire Parquet (les autres - MIC, CFI, devises, NCA, dates - en ont un)
+PARQUET_PLAIN_COLUMNS = ("TechRcrdId", "ISIN", "FullName", "ShortName", "UnderlyingISIN")
+PARQUET_INT64_COLUMNS = ("TechRcrdId",)
+DLT_ACTIONS = (("NEW", "NewRcrd"), ("MOD", "ModfdRcrd"), ("TERM", "TermntdRcrd"), ("CANC", "CancRcrd"))
+# TechRcrdId = préfixe fichier * TECH_ID_RECORD_SPAN + rang du RefData (un fichier ESMA en compte au plus 500 000)
+ESMA_FILE_RE = re.compile(r"(?:FULINS|DLTINS)_(?:([A-Z])_)?(\d{8})_(\d+)of\d+", re.IGNORECASE)
+TECH_ID_RECORD_SPAN = 10 ** 7
+TECH_ID_PART_SPAN = 100  # deux chiffres décimaux réservés au numéro de partie NN de NNofMM
+_IDX_TECH = COLUMNS_FULINS_WIDE.index("TechRcrdId")
+_IDX_ISIN = COLUMNS_FULINS_WIDE.index("ISIN")
+_IDX_MIC = COLUMNS_FULINS_WIDE.index("TradingVenueMIC")
+_IDX_PERIOD = COLUMNS_FULINS_WIDE.index("HeaderReportingPeriodDate")
+_IDX_VF = COLUMNS_FULINS_WIDE.index("ValidFromDate")
+_IDX_MARKET = COLUMNS_FULINS_WIDE.index("HeaderReportingMarketId")
+_IDX_NCA = COLUMNS_FULINS_WIDE.index("HeaderReportingNCA")
+_IDX_SOURCE = COLUMNS_FULINS_WIDE.index("SourceFileName")
+_IDX_VT = COLUMNS_FULINS_WIDE.index("ValidToDate")
+_IDX_LATEST = COLUMNS_FULINS_WIDE.index("LatestRecordFlag")
+
+# Tables instruments alimentées par le fan-out FULINS (colonnes dans l'ordre de la table, sans LoadDtmUTC) :
+# (colonne, typage de stg.usp_Load_ESMA_INSTRUMENTS_From_FULINS_WIDE) ; sNN = CONVERT(varchar/nvarchar(NN)),
+# d = TRY_CONVERT(date), n = TRY_CONVERT(decimal(38,10)), i = TRY_CONVERT(int), b = bit 1/0, bigint = TechRcrdId,
+# pk = COALESCE(ValidFromDate, '19000101')
+INSTRUMENT_TABLES = ("LISTING", "DEBT", "DERIVATIVE")
+_INSTRUMENT_KEY_SPEC = [("ISIN", "s12"), ("TradingVenueMIC", "s50"), ("ValidFromDate", "d"), ("ValidToDate", "d"),
+                        ("LatestRecordFlag", "b"), ("ValidFromDate_PK", "pk")]
+_INSTRUMENT_CMDTY_SPEC = [("CmdtyBaseProduct", "s50"), ("CmdtySubProduct", "s50"), ("CmdtySubSubProduct", "s50"),
+                          ("CmdtyTransactionType", "s50"), ("CmdtyFinalPriceType", "s50")]
+INSTRUMENT_SPECS = {
+    "LISTING": _INSTRUMENT_KEY_SPEC + [
+        ("FullName", "s400"), ("ShortName", "s200"), ("CFI", "s6"), ("CommodityDerivativeInd", "b"),
+        ("NotionalCurrency", "s10"), ("IssuerLEI", "s50"), ("IssuerReqAdmission", "b"), ("AdmissionApprvlDate", "d"),
+        ("ReqForAdmissionDate", "d"), ("FirstTradingDate", "d"), ("TerminationDate", "d"),
+    ] + _INSTRUMENT_CMDTY_SPEC + [
+        ("HeaderReportingMarketId", "s255"), ("HeaderReportingNCA", "s255"), ("HeaderReportingPeriodDate", "d"),
+        ("SourceFileName", "s260"), ("TechRcrdId", "bigint"),
+    ],
+    "DEBT": _INSTRUMENT_KEY_SPEC + [
+        ("TotalIssuedNominalAmount", "n"), ("TotalIssuedNominalAmountCcy", "s10"), ("MaturityDate", "d"),
+        ("NominalValuePerUnit", "n"), ("NominalValuePerUnitCcy", "s10"), ("FixedRate", "n"), ("FloatRefRateISIN", "s12"),
+        ("FloatRefRateIndex", "s255"), ("FloatTermUnit", "s10"), ("FloatTermValue", "i"), ("FloatBasisPointSpread", "n"),
+        ("DebtSeniority", "s100"),
+    ],
+    "DERIVATIVE": _INSTRUMENT_KEY_SPEC + [
+        ("ExpiryDate", "d"), ("PriceMultiplier", "n"), ("UnderlyingISIN", "s12"), ("UnderlyingLEI", "s50"),
+        ("UnderlyingIndexRef", "s255"), ("UnderlyingIndexTermUnit", "s10"), ("UnderlyingIndexTermValue", "i"),
+        ("OptionType", "s50"), ("OptionExerciseStyle", "s50"), ("DeliveryType", "s50"), ("StrikePrice", "n"),
+        ("StrikePriceCcy", "s10"), ("StrikeNoPriceCcy", "b"),
+    ] + _INSTRUMENT_CMDTY_SPEC,
+}
+INSTRUMENT_COLUMNS = {t: [c for c, _ in spec] for t, spec in INSTRUMENT_SPECS.items()}
+INSTRUMENT_PK_FALLBACK = "1900-01-01"
+_LST_CFI = INSTRUMENT_COLUMNS["LISTING"].index("CFI")
+_LST_CMDTY_IND = INSTRUMENT_COLUMNS["LISTING"].index("CommodityDerivativeInd")
+_LST_CMDTY_BASE = INSTRUMENT_COLUMNS["LISTING"].index("CmdtyBaseProduct")
+_LST_PK = INSTRUMENT_COLUMNS["LISTING"].index("ValidFromDate_PK")
+_SQL_TRUE = frozenset(("1", "true", "t", "y", "yes"))
+_SQL_FALSE = frozenset(("0", "false", "f", "n", "no"))
+SQL_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})(?:T[0-9]{2}:[0-9]{2}(?::[0-9]{2}(?:\.[0-9]{1,7})?)?(?:Z|[+-][0-9]{2}:[0-9]{2})?)?"
+                         r"|([0-9]{4})([0-9]{2})([0-9]{2})")
+SQL_DECIMAL_RE = re.compile(r"\s*([+-]?)([0-9]*)(?:\.([0-9]*))?\s*")
+SQL_INT_RE = re.compile(r"\s*[+-]?[0-9]+\s*")
+_SQL_DECIMAL_SCALE = Decimal("1e-10")
+_SQL_DECIMAL_CTX = Context(prec=80)
+
+# FULL incrémental : index d'empreintes par (ISIN, MIC) et jeu de changements au format DLTINS (COLUMNS_DLT_STG)
+FULINS_DIFF_DIRNAME = "FULINS_DIFF"
+HASH_INDEX_NAME = "fulins_hash_index.sqlite"
+HASH_BATCH_ROWS = 100000
+FULINS_DIFF_MAX_PCT_DEFAULT = 20.0
+# colonnes propres au fichier ou au chargement, hors contenu de l'enregistrement : exclues de l'empreinte
+_HASH_SKIP = ("HeaderReportingPeriodDate", "SourceFileName", "TechRcrdId", "ValidFromDate", "ValidToDate", "LatestRecordFlag")
+_hash_fields = itemgetter(*[i for i, c in enumerate(COLUMNS_FULINS_WIDE) if c not in _HASH_SKIP])
+
 
 
 
@@ -121,7 +276,10 @@ def sql_conn(cfg: configparser.ConfigParser) -> pyodbc.Connection:
     return pyodbc.connect(conn_str, autocommit=True)
 
 
-def sql_log_line(conn: pyodbc.Connection, message: str, element: str = "", complement: str = "", file_name: str = "") -> None:
+def sql_log_line(conn: Optional[pyodbc.Connection], message: str, element: str = "", complement: str = "", file_name: str = "") -> None:
+    # conn=None : worker de parsing (process pool), pas de connexion SQL
+    if conn is None:
+        return
     sql = """
     INSERT INTO log.ESMA_Load_Log
         (ScriptName, LaunchTimestamp, StartTime, Message, FileName, Element, Complement)
@@ -158,9 +316,68 @@ def sanitize(v: str) -> str:
     return s.strip()
 
 
-def md5_tech_id(source_file: str, isin: str, mic: str, idx: int) -> str:
-    raw = f"{source_file}|{isin}|{mic}|{idx}".encode("utf-8")
-    return hashlib.md5(raw).hexdigest()
+def bsv_fields(vals: List[str]) -> List[str]:
+    """
+    Champs BSV prêts à joindre par DELIMITER : sanitize() puis échappement, octet pour octet la sortie de csv.writer.
+    Cas courant (aucun caractère non imprimable dans l'enregistrement) : un str.translate + strip par champ ;
+    sinon SAN_RE d'abord, qui fusionne les suites de \\r \\n \\t en un seul espace.
+    """
+    if "".join(vals).isprintable():
+        return [v.translate(_BSV_FIELD).strip() for v in vals]
+    return [sanitize(v).translate(_BSV_FIELD) for v in vals]
+
+
+def open_bsv(path: Path, mode: str = "w"):
+    """BSV texte UTF-8, fins de ligne telles qu'écrites, tampon d'écriture BSV_WRITE_BUFFER."""
+    return path.open(mode, encoding="utf-8", newline="", buffering=BSV_WRITE_BUFFER)
+
+
+@lru_cache(maxsize=None)
+def _tech_id_base(source_file: str) -> int:
+    """
+    Préfixe décimal des TechRcrdId d'un fichier : AAAAMMJJ CC PP (date, catégorie FULINS A-Z -> 01-26, partie NNofMM),
+    même ordre que le tri par nom des XML d'un run ; hors convention de nommage ESMA : crc32 du nom (< 10^10).
+    """
+    m = ESMA_FILE_RE.match(source_file)
+    if m is None:
+        return zlib.crc32(source_file.encode("utf-8")) * TECH_ID_RECORD_SPAN
+    letter, ymd, part = m.groups()
+    if int(part) >= TECH_ID_PART_SPAN:
+        # pas de repli crc32 : un même run mélangerait deux encodages de TechRcrdId
+        raise ValueError(f"{source_file}: partie {part} >= {TECH_ID_PART_SPAN}, TechRcrdId hors format")
+    category = ord(letter.upper()) - 64 if letter else 0
+    return (int(ymd) * 10000 + category * TECH_ID_PART_SPAN + int(part)) * TECH_ID_RECORD_SPAN
+
+
+def tech_id(source_file: str, idx: int) -> str:
+    """TechRcrdId bigint du idx-ième RefData de source_file (max 2099123126999999999 < 2^63)."""
+    if idx >= TECH_ID_RECORD_SPAN:
+        raise ValueError(f"{source_file}: plus de {TECH_ID_RECORD_SPAN - 1} RefData, TechRcrdId hors format")
+    return str(_tech_id_base(source_file) + idx)
+
+
+class XmlSource(NamedTuple):
+    """XML FIRDS à parser : fichier extrait (member=None) ou membre XML d'un ZIP téléchargé."""
+    path: Path
+    member: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return Path(self.member).name if self.member else self.path.name
+
+    def open(self) -> BinaryIO:
+        if self.member is None:
+            return open(self.path, "rb")
+        # le flux du membre garde sa propre référence sur le fichier ZIP : on peut fermer le ZipFile
+        with zipfile.ZipFile(self.path, "r") as z:
+            return z.open(self.member, "r")
+
+    def __str__(self) -> str:
+        return f"{self.path}!{self.member}" if self.member else str(self.path)
+
+
+def _as_source(x: Union[Path, XmlSource]) -> XmlSource:
+    return x if isinstance(x, XmlSource) else XmlSource(Path(x))
 
 
 def list_xmls(extracted_dir: Path) -> List[Path]:
@@ -169,22 +386,85 @@ def list_xmls(extracted_dir: Path) -> List[Path]:
     return sorted(extracted_dir.rglob("*.xml"))
 
 
-def pick_max_yyyymmdd_dir(parent: Path) -> Optional[Tuple[str, Path]]:
+def list_zip_xml_sources(download_dir: Path) -> List[XmlSource]:
+    """Membres XML des ZIP d'un dossier de date (extract_mode=stream), triés par nom logique."""
+    if not download_dir.exists():
+        return []
+    sources: List[XmlSource] = []
+    for zip_path in sorted(download_dir.rglob("*.zip")):
+        with zipfile.ZipFile(zip_path, "r") as z:
+            for name in z.namelist():
+                if name.lower().endswith(".xml"):
+                    sources.append(XmlSource(zip_path, name))
+    return sorted(sources, key=lambda src: (src.name, str(src.path)))
+
+
+def list_sources(date_dir: Path, extract_mode: str) -> List[XmlSource]:
+    if extract_mode == "stream":
+        return list_zip_xml_sources(date_dir)
+    return [XmlSource(p) for p in list_xmls(date_dir)]
+
+
+def list_yyyymmdd_dirs(parent: Path) -> List[Tuple[str, Path]]:
     """
-    Retourne (YYYYMMDD, path) du sous-dossier date max sous parent.
+    Retourne [(YYYYMMDD, path), ...] des sous-dossiers date sous parent, par date croissante.
     Ignore tout ce qui n'est pas un dossier 8 chiffres.
     """
     if not parent.exists():
-        return None
-    best = None
+        return []
+    out = []
     for p in parent.iterdir():
         if not p.is_dir():
             continue
         name = p.name.strip()
         if len(name) == 8 and name.isdigit():
-            if best is None or name > best[0]:
-                best = (name, p)
-    return best
+            out.append((name, p))
+    return sorted(out)
+
+
+def pick_max_yyyymmdd_dir(parent: Path) -> Optional[Tuple[str, Path]]:
+    """
+    Retourne (YYYYMMDD, path) du sous-dossier date max sous parent.
+    Ignore tout ce qui n'est pas un dossier 8 chiffres.
+    """
+    dirs = list_yyyymmdd_dirs(parent)
+    return dirs[-1] if dirs else None
+
+
+# ----------------------------
+# Moteur XML (lxml / stdlib)
+# ----------------------------
+def resolve_xml_parser(name: str) -> str:
+    """auto -> lxml si le module est installé, sinon stdlib ; lxml explicite sans module -> erreur."""
+    name = (name or "auto").strip().lower()
+    if name not in XML_PARSERS:
+        raise ValueError(f"Invalid [ESMA].xml_parser={name!r} (expected one of {XML_PARSERS})")
+    if name == "auto":
+        return "lxml" if LET is not None else "stdlib"
+    if name == "lxml" and LET is None:
+        raise RuntimeError("[ESMA].xml_parser=lxml but lxml is not installed (pip install lxml)")
+    return name
+
+
+def _lxml_iterparse(fh: BinaryIO, tags: Tuple[str, ...]):
+    # seuls les éléments utiles lèvent un événement ; huge_tree : pas de limite sur les gros nœuds texte
+    return LET.iterparse(fh, events=("end",), tag=tags, huge_tree=True)
+
+
+def _lxml_release(elem) -> None:
+    """Libère un élément traité et tous les frères déjà vus (lui et ses ancêtres) : mémoire constante."""
+    elem.clear(keep_tail=True)
+    node = elem
+    parent = node.getparent()
+    while parent is not None:
+        while node.getprevious() is not None:
+            del parent[0]
+        node, parent = parent, parent.getparent()
+
+
+def _parent_endswith(elem, suffix: str) -> bool:
+    parent = elem.getparent()
+    return parent is not None and str(parent.tag).endswith(suffix)
 
 
 # ----------------------------
@@ -207,142 +487,455 @@ def _first_text(node, xpaths: List[str], ns: Dict) -> str:
     return ""
 
 
-def _find_any(node, xpath: str, ns: Dict):
-    if node is None:
-        return None
-    return node.find(xpath, ns)
+class FieldPlan:
+    """
+    Plan d'extraction compilé une fois depuis une table déclarative colonne -> chemins alternatifs.
+
+    Chemins au format ElementPath relatif au RefData ("./a:X/a:Y", ".//a:X", "./a:X//a:Y", suffixe "/@Attr").
+    Chaque RefData est parcouru une seule fois : chaque élément est rattaché à son chemin de balises
+    (arbre de préfixes mis en cache, la résolution chemin -> colonnes n'est faite qu'une fois par chemin
+    distinct) et seul le premier élément (ordre document) de chaque chemin est retenu, comme find().
+    Les sous-arbres qu'aucun chemin ne peut atteindre (ex. TechAttrbts avec les tables générées, sans "//")
+    ne sont pas parcourus, et seuls les chemins effectivement trouvés sont résolus en colonnes.
+    Par colonne, la première alternative non vide l'emporte, comme _first_text() / `a or b`.
+    Les valeurs sont écrites en place dans un enregistrement à slots (liste alignée sur `columns`, réutilisée).
+    """
 
+    _STEP_RE = re.compile(r"(//?)([^/]+)")
+
+    def __init__(self, fields: Dict[str, List[str]], ns: Dict[str, str], columns: List[str]):
+        self._ns = ns
+        self._patterns: List[Tuple[Tuple[str, str], ...]] = []
+        self._names: List[str] = list(fields)
+        self._slots: List[int] = [columns.index(name) for name in fields]
+        self._no_rank = sum(len(paths) for paths in fields.values())
+        # chemin -> [(indice colonne, rang de l'alternative, attribut)]
+        self._slot_targets: List[List[Tuple[int, int, Optional[str]]]] = []
+        for col_i, paths in enumerate(fields.values()):
+            for rank, path in enumerate(paths):
+                steps, attr = self._compile(path)
+                if steps not in self._patterns:
+                    self._patterns.append(steps)
+                    self._slot_targets.append([])
+                self._slot_targets[self._patterns.index(steps)].append((col_i, rank, attr))
+        # arbre des chemins rencontrés : (noeud parent, balise) -> noeud ; noeud 0 = le RefData lui-même
+        self._trie: Dict[Tuple[int, str], int] = {}
+        self._node_path: List[Tuple[str, ...]] = [()]
+        self._node_slots: List[Tuple[int, ...]] = [()]
+        self._node_live: List[bool] = [True]
+
+    def _compile(self, path: str) -> Tuple[Tuple[Tuple[str, str], ...], Optional[str]]:
+        attr = None
+        if "/@" in path:
+            path, attr = path.split("/@", 1)
+        steps = []
+        for sep, tok in self._STEP_RE.findall(path[1:] if path.startswith(".") else path):
+            prefix, _, local = tok.rpartition(":")
+            tag = f"{{{self._ns[prefix]}}}{local}" if prefix else local
+            steps.append(("desc" if sep == "//" else "child", tag))
+        return tuple(steps), attr
+
+    @classmethod
+    def _matches(cls, steps: Tuple[Tuple[str, str], ...], path: Tuple[str, ...]) -> bool:
+        if not steps:
+            return not path
+        axis, tag = steps[0]
+        if axis == "child":
+            return bool(path) and path[0] == tag and cls._matches(steps[1:], path[1:])
+        return any(path[k] == tag and cls._matches(steps[1:], path[k + 1:]) for k in range(len(path)))
+
+    @classmethod
+    def _reaches_below(cls, steps: Tuple[Tuple[str, str], ...], path: Tuple[str, ...]) -> bool:
+        """Vrai si un descendant strict de `path` peut correspondre à `steps`."""
+        if not steps:
+            return False
+        if not path:
+            return True
+        axis, tag = steps[0]
+        if axis == "desc":
+            return True
+        return path[0] == tag and cls._reaches_below(steps[1:], path[1:])
+
+    def _add_node(self, parent: int, tag: str) -> int:
+        path = self._node_path[parent] + (tag,)
+        node = len(self._node_path)
+        self._node_path.append(path)
+        self._node_slots.append(tuple(i for i, steps in enumerate(self._patterns) if self._matches(steps, path)))
+        self._node_live.append(any(self._reaches_below(steps, path) for steps in self._patterns))
+        self._trie[(parent, tag)] = node
+        return node
+
+    def _walk(self, elem, node: int, found: list, hits: list) -> None:
+        for child in elem:
+            tag = child.tag
+            n = self._trie.get((node, tag))
+            if n is None:
+                if not isinstance(tag, str):
+                    continue  # commentaires / instructions (lxml)
+                n = self._add_node(node, tag)
+            for slot in self._node_slots[n]:
+                if found[slot] is None:
+                    found[slot] = child
+                    hits.append(slot)
+            if len(child) and self._node_live[n]:
+                self._walk(child, n, found, hits)
+
+    def fill(self, refdata, rec: List[str]) -> None:
+        """Écrit les colonnes du plan (valeur ou "") dans rec ; les autres slots ne sont pas touchés."""
+        found = [None] * len(self._patterns)
+        hits: List[int] = []
+        self._walk(refdata, 0, found, hits)
+        values = [""] * len(self._names)
+        ranks = [self._no_rank] * len(self._names)
+        for slot in hits:
+            el = found[slot]
+            for col_i, rank, attr in self._slot_targets[slot]:
+                if rank >= ranks[col_i]:
+                    continue
+                if attr is None:
+                    v = el.text.strip() if el.text is not None else ""
+                else:
+                    v = el.attrib.get(attr, "")
+                if v:
+                    values[col_i] = v
+                    ranks[col_i] = rank
+        for slot, v in zip(self._slots, values):
+            rec[slot] = v
 
-def _find_first(node, xpath: str, ns: Dict):
-    if node is None:
-        return None
-    items = node.findall(xpath, ns)
-    return items[0] if items else None
+
+FULINS_PLAN = FieldPlan(FIRDS_FIELDS.FULINS_FIELDS, NS_FUL, COLUMNS_FULINS_WIDE)
+
+
+def new_record() -> List[str]:
+    """Enregistrement à slots (ordre COLUMNS_FULINS_WIDE), réutilisé d'un RefData à l'autre par les parcours XML."""
+    rec = [""] * len(COLUMNS_FULINS_WIDE)
+    rec[_IDX_LATEST] = "1"
+    return rec
+
+
+def fill_record_fulins(rec: List[str], refdata, hdr: Dict[str, str], source_file: str, record_idx: int) -> None:
+    rec[_IDX_MARKET] = hdr.get("HeaderReportingMarketId", "")
+    rec[_IDX_NCA] = hdr.get("HeaderReportingNCA", "")
+    rec[_IDX_PERIOD] = rec[_IDX_VF] = hdr.get("HeaderReportingPeriodDate", "")
+    rec[_IDX_SOURCE] = source_file
+    rec[_IDX_TECH] = tech_id(source_file, record_idx)
+    FULINS_PLAN.fill(refdata, rec)
 
 
 def extract_record_fulins(refdata, hdr: Dict[str, str], source_file: str, record_idx: int) -> Dict[str, str]:
-    row = {c: "" for c in COLUMNS_FULINS_WIDE}
-
-    row["HeaderReportingMarketId"] = hdr.get("HeaderReportingMarketId", "")
-    row["HeaderReportingNCA"] = hdr.get("HeaderReportingNCA", "")
-    row["HeaderReportingPeriodDate"] = hdr.get("HeaderReportingPeriodDate", "")
-    row["SourceFileName"] = source_file
-
-    row["ISIN"] = _first_text(refdata, ["./a:FinInstrmGnlAttrbts/a:Id","./a:FinInstrmGnlAttrbts/a:ISIN"], NS_FUL)
-    row["FullName"] = _text(refdata, "./a:FinInstrmGnlAttrbts/a:FullNm", NS_FUL)
-    row["ShortName"] = _text(refdata, "./a:FinInstrmGnlAttrbts/a:ShrtNm", NS_FUL)
-    row["CFI"] = _first_text(refdata, ["./a:FinInstrmGnlAttrbts/a:ClssfctnTp","./a:FinInstrmGnlAttrbts/a:CFI"], NS_FUL)
-    row["CommodityDerivativeInd"] = _first_text(refdata, ["./a:FinInstrmGnlAttrbts/a:CmmdtyDerivInd","./a:FinInstrmGnlAttrbts/a:CommmodityDerivInd"], NS_FUL)
-    row["NotionalCurrency"] = _first_text(refdata, ["./a:FinInstrmGnlAttrbts/a:NtnlCcy","./a:FinInstrmGnlAttrbts/a:NotionalCcy"], NS_FUL)
-
-    row["IssuerLEI"] = _first_text(refdata, ["./a:Issr","./a:FinInstrmGnlAttrbts/a:Issr"], NS_FUL)
-
-    row["TradingVenueMIC"] = _first_text(refdata, ["./a:TradgVnRltdAttrbts/a:Id","./a:TradgVnRltdAttrbts/a:MIC"], NS_FUL)
-    row["IssuerReqAdmission"] = _first_text(refdata, ["./a:TradgVnRltdAttrbts/a:IssrReq","./a:TradgVnRltdAttrbts/a:IssrReqAdmssn"], NS_FUL)
-    row["AdmissionApprvlDate"] = _first_text(refdata, ["./a:TradgVnRltdAttrbts/a:AdmssnApprvlDtByIssr","./a:TradgVnRltdAttrbts/a:AdmissionApprovalDate"], NS_FUL)
-    row["ReqForAdmissionDate"] = _first_text(refdata, ["./a:TradgVnRltdAttrbts/a:ReqForAdmssnDt","./a:TradgVnRltdAttrbts/a:RequestForAdmissionDate"], NS_FUL)
-    row["FirstTradingDate"] = _first_text(refdata, ["./a:TradgVnRltdAttrbts/a:FrstTradDt","./a:TradgVnRltdAttrbts/a:FirstTradingDate"], NS_FUL)
-    row["TerminationDate"] = _first_text(refdata, ["./a:TradgVnRltdAttrbts/a:TermntnDt","./a:TradgVnRltdAttrbts/a:TerminationDate"], NS_FUL)
-
-    debt = _find_any(refdata, "./a:DebtInstrmAttrbts", NS_FUL)
-    if debt is not None:
-        row["TotalIssuedNominalAmount"] = _first_text(debt, ["./a:TtlIssdNmnlAmt","./a:TotalIssuedNominalAmount"], NS_FUL)
-        ccy = _text(debt, "./a:TtlIssdNmnlAmtCcy", NS_FUL)
-        if not ccy:
-            amt_el = debt.find("./a:TtlIssdNmnlAmt", NS_FUL)
-            if amt_el is not None:
-                ccy = amt_el.attrib.get("Ccy", "") or amt_el.attrib.get("CCY", "")
-        row["TotalIssuedNominalAmountCcy"] = ccy
-
-        row["MaturityDate"] = _first_text(debt, ["./a:MtrtyDt","./a:MaturityDate"], NS_FUL)
-        row["NominalValuePerUnit"] = _first_text(debt, ["./a:NmnlValPerUnit","./a:NominalValuePerUnit"], NS_FUL)
-
-        nvp_el = debt.find("./a:NmnlValPerUnit", NS_FUL)
-        nvp_ccy = _text(debt, "./a:NmnlValPerUnitCcy", NS_FUL)
-        if not nvp_ccy and nvp_el is not None:
-            nvp_ccy = nvp_el.attrib.get("Ccy", "")
-        row["NominalValuePerUnitCcy"] = nvp_ccy
-
-        row["FixedRate"] = _first_text(debt, ["./a:FxddRate","./a:FixedRate"], NS_FUL)
-        row["FloatRefRateISIN"] = _first_text(debt, [".//a:FltgRate/a:RefRate/a:Id",".//a:FloatgRate/a:RefRate/a:Id",".//a:FltgRate/a:RefRateISIN"], NS_FUL)
-        row["FloatRefRateIndex"] = _first_text(debt, [".//a:FltgRate/a:RefRateIndx",".//a:FloatgRate/a:RefRateIndx",".//a:FltgRate/a:RefRateIndex"], NS_FUL)
-        row["FloatTermUnit"] = _first_text(debt, [".//a:FltgRate/a:Term/a:Unit",".//a:FloatgRate/a:Term/a:Unit"], NS_FUL)
-        row["FloatTermValue"] = _first_text(debt, [".//a:FltgRate/a:Term/a:Val",".//a:FloatgRate/a:Term/a:Val"], NS_FUL)
-        row["FloatBasisPointSpread"] = _first_text(debt, [".//a:FltgRate/a:BssPtsSprd",".//a:FloatgRate/a:BssPtsSprd"], NS_FUL)
-        row["DebtSeniority"] = _first_text(debt, ["./a:DbtSnrty","./a:DebtSeniority"], NS_FUL)
-
-    der = _find_any(refdata, "./a:DerivInstrmAttrbts", NS_FUL)
-    if der is not None:
-        row["ExpiryDate"] = _first_text(der, ["./a:XpryDt","./a:ExpiryDate"], NS_FUL)
-        row["PriceMultiplier"] = _first_text(der, ["./a:PricMltplr","./a:PriceMultiplier"], NS_FUL)
-
-        und = _find_first(der, ".//a:UndrlygInstrm", NS_FUL)
-        if und is not None:
-            row["UnderlyingISIN"] = _first_text(und, ["./a:Id","./a:ISIN"], NS_FUL)
-            row["UnderlyingLEI"] = _first_text(und, ["./a:LEI","./a:IdLEI"], NS_FUL)
-            row["UnderlyingIndexRef"] = _first_text(und, ["./a:Indx/a:Id","./a:Indx/a:Nm","./a:Index/a:Id","./a:Index/a:Name"], NS_FUL)
-            row["UnderlyingIndexTermUnit"] = _first_text(und, [".//a:Indx/a:Term/a:Unit",".//a:Index/a:Term/a:Unit"], NS_FUL)
-            row["UnderlyingIndexTermValue"] = _first_text(und, [".//a:Indx/a:Term/a:Val",".//a:Index/a:Term/a:Val"], NS_FUL)
-
-        row["OptionType"] = _first_text(der, [".//a:OptnTp",".//a:OptionType"], NS_FUL)
-        row["OptionExerciseStyle"] = _first_text(der, [".//a:ExrcStyle",".//a:ExerciseStyle"], NS_FUL)
-        row["DeliveryType"] = _first_text(der, [".//a:DlvryTp",".//a:DeliveryType"], NS_FUL)
-
-        row["StrikePrice"] = _first_text(der, [".//a:StrkPric/a:Val",".//a:StrikePrice/a:Val",".//a:StrkPric"], NS_FUL)
-        row["StrikePriceCcy"] = _first_text(der, [".//a:StrkPric/a:Ccy",".//a:StrikePrice/a:Ccy"], NS_FUL)
-        row["StrikeNoPriceCcy"] = _first_text(der, [".//a:StrkNoPric/a:Ccy",".//a:StrikeNoPrice/a:Ccy"], NS_FUL)
-
-        row["CmdtyBaseProduct"] = _first_text(der, [".//a:BasePdct"], NS_FUL)
-        row["CmdtySubProduct"] = _first_text(der, [".//a:SubPdct"], NS_FUL)
-        row["CmdtySubSubProduct"] = _first_text(der, [".//a:SubSubPdct"], NS_FUL)
-        row["CmdtyTransactionType"] = _first_text(der, [".//a:TxTp"], NS_FUL)
-        row["CmdtyFinalPriceType"] = _first_text(der, [".//a:FnlPricTp"], NS_FUL)
-
-    row["ValidFromDate"] = row["HeaderReportingPeriodDate"]
-    row["ValidToDate"] = ""
-    row["LatestRecordFlag"] = "1"
-    row["TechRcrdId"] = md5_tech_id(source_file, row["ISIN"], row["TradingVenueMIC"], record_idx)
-
-    return row
-
-
-def extract_fulins_xmls_to_bsv(xml_files: List[Path], out_bsv: Path, conn: pyodbc.Connection, run_ts: str) -> int:
+    """Un RefData FULINS en dict colonne -> valeur brute (contrôle par échantillon de 01-GET_FILES)."""
+    rec = new_record()
+    fill_record_fulins(rec, refdata, hdr, source_file, record_idx)
+    return dict(zip(COLUMNS_FULINS_WIDE, rec))
+
+
+def _read_hdr_fulins(hdr_el, hdr: Dict[str, str]) -> None:
+    hdr["HeaderReportingMarketId"] = _first_text(hdr_el, ["./a:RptgNtty/a:MktIdCd", "./a:RptgNtty/a:MktId"], NS_FUL)
+    hdr["HeaderReportingNCA"] = _first_text(hdr_el, ["./a:RptgNtty/a:NtlCmptntAuthrty", "./a:RptgNtty/a:NCA"], NS_FUL)
+    hdr["HeaderReportingPeriodDate"] = _first_text(hdr_el, ["./a:RptgPrd/a:Dt", "./a:ReportingPeriod/a:Date"], NS_FUL)
+
+
+def _fulins_rows_stdlib(fh: BinaryIO, source_file: str, record_idx: int = 0) -> Iterator[List[str]]:
+    context = ET.iterparse(fh, events=("start", "end"))
+    _, root = next(context)
+
+    hdr = {"HeaderReportingMarketId": "", "HeaderReportingNCA": "", "HeaderReportingPeriodDate": ""}
+    rec = new_record()
+
+    for ev, elem in context:
+        if ev == "end" and str(elem.tag).endswith("FinInstrmRptgRefDataRpt"):
+            hdr_el = elem.find("./a:RptHdr", NS_FUL)
+            if hdr_el is not None:
+                _read_hdr_fulins(hdr_el, hdr)
+
+            for refdata in elem.findall("./a:RefData", NS_FUL):
+                record_idx += 1
+                fill_record_fulins(rec, refdata, hdr, source_file, record_idx)
+                if not rec[_IDX_ISIN]:
+                    continue
+                yield bsv_fields(rec)
+
+            elem.clear()
+            root.clear()
+
+
+def _fulins_rows_lxml(fh: BinaryIO, source_file: str, record_idx: int = 0) -> Iterator[List[str]]:
+    # RptHdr précède les RefData dans le rapport : chaque RefData est émis (puis libéré) dès sa balise fermante
+    tag_hdr = f"{{{NS_FUL['a']}}}RptHdr"
+    tag_refdata = f"{{{NS_FUL['a']}}}RefData"
+
+    hdr = {"HeaderReportingMarketId": "", "HeaderReportingNCA": "", "HeaderReportingPeriodDate": ""}
+    rec = new_record()
+
+    for _, elem in _lxml_iterparse(fh, (tag_hdr, tag_refdata)):
+        if not _parent_endswith(elem, "FinInstrmRptgRefDataRpt"):
+            continue
+        if elem.tag == tag_hdr:
+            _read_hdr_fulins(elem, hdr)
+            continue
+
+        record_idx += 1
+        fill_record_fulins(rec, elem, hdr, source_file, record_idx)
+        _lxml_release(elem)
+        if not rec[_IDX_ISIN]:
+            continue
+        yield bsv_fields(rec)
+
+
+def extract_fulins_xmls_to_bsv(xml_files: List[Union[Path, XmlSource]], out_bsv: Path, conn: pyodbc.Connection, run_ts: str,
+                               xml_parser: str = "auto", instrument_paths: Optional[Dict[str, Path]] = None) -> int:
+    """instrument_paths : sorties typées LISTING / DEBT / DERIVATIVE écrites dans la même passe (InstrumentWriter)."""
+    parser = resolve_xml_parser(xml_parser)
+    rows_of = _fulins_rows_lxml if parser == "lxml" else _fulins_rows_stdlib
+
     out_bsv.parent.mkdir(parents=True, exist_ok=True)
-    with out_bsv.open("w", encoding="utf-8", newline="") as f:
-        w = csv.writer(f, delimiter=DELIMITER, lineterminator="\n", quoting=csv.QUOTE_NONE, escapechar="\\")
-        w.writerow(COLUMNS_FULINS_WIDE)
+    with open_bsv(out_bsv) as f, (InstrumentWriter(instrument_paths) if instrument_paths else nullcontext()) as inst:
+        f.write(DELIMITER.join(COLUMNS_FULINS_WIDE) + "\n")
 
         total = 0
-        for xml_path in xml_files:
-            source_file = xml_path.name
-            sql_log_line(conn, "Parsing XML", element="FUL_PARSE", complement=f"file={xml_path} run_ts={run_ts}")
+        for xml_src in map(_as_source, xml_files):
+            source_file = xml_src.name
+            sql_log_line(conn, "Parsing XML", element="FUL_PARSE", complement=f"file={xml_src} parser={parser} run_ts={run_ts}")
 
-            context = ET.iterparse(xml_path, events=("start", "end"))
-            _, root = next(context)
+            with xml_src.open() as fh:
+                for out in rows_of(fh, source_file):
+                    f.write(DELIMITER.join(out) + "\n")
+                    if inst is not None:
+                        inst.add(out)
+                    total += 1
 
-            hdr = {"HeaderReportingMarketId": "", "HeaderReportingNCA": "", "HeaderReportingPeriodDate": ""}
-            record_idx = 0
+        return total
 
-            for ev, elem in context:
-                if ev == "end" and str(elem.tag).endswith("FinInstrmRptgRefDataRpt"):
-                    hdr_el = elem.find("./a:RptHdr", NS_FUL)
-                    if hdr_el is not None:
-                        hdr["HeaderReportingMarketId"] = _first_text(hdr_el, ["./a:RptgNtty/a:MktIdCd", "./a:RptgNtty/a:MktId"], NS_FUL)
-                        hdr["HeaderReportingNCA"] = _first_text(hdr_el, ["./a:RptgNtty/a:NtlCmptntAuthrty", "./a:RptgNtty/a:NCA"], NS_FUL)
-                        hdr["HeaderReportingPeriodDate"] = _first_text(hdr_el, ["./a:RptgPrd/a:Dt", "./a:ReportingPeriod/a:Date"], NS_FUL)
 
-                    for refdata in elem.findall("./a:RefData", NS_FUL):
-                        record_idx += 1
-                        row = extract_record_fulins(refdata, hdr, source_file, record_idx)
-                        if not row.get("ISIN"):
-                            continue
-                        w.writerow([sanitize(row.get(c, "")) for c in COLUMNS_FULINS_WIDE])
-                        total += 1
+# ----------------------------
+# Fan-out FULINS -> instruments typés (stg.ESMA_INSTRUMENT_LISTING / _DEBT / _DERIVATIVE)
+# ----------------------------
+@lru_cache(maxsize=1 << 16)
+def sql_date(v: str) -> str:
+    """TRY_CONVERT(date, v) pour les formats ISO des XML FIRDS (AAAA-MM-JJ[Thh:mm[:ss[.f]]][Z|±hh:mm], AAAAMMJJ) ; '' = NULL."""
+    m = SQL_DATE_RE.fullmatch(v)
+    if m is None:
+        return ""
+    y, mo, d = (int(x) for x in (m.groups()[:3] if m.group(1) else m.groups()[3:]))
+    try:
+        return date(y, mo, d).isoformat()
+    except ValueError:
+        return ""
 
-                    elem.clear()
-                    root.clear()
 
-        return total
+@lru_cache(maxsize=1 << 16)
+def sql_decimal(v: str) -> str:
+    """TRY_CONVERT(decimal(38,10), REPLACE(v, ',', '.')) : arrondi à 10 décimales, NULL au-delà de 28 chiffres entiers."""
+    m = SQL_DECIMAL_RE.fullmatch(v.replace(",", "."))
+    if m is None:
+        return ""
+    sign, ip, fp = m.group(1), m.group(2).lstrip("0"), m.group(3) or ""
+    if (not ip and not fp and not m.group(2)) or len(ip) > 28:
+        return ""
+    if len(fp) > 10:
+        q = Decimal(f"{ip or '0'}.{fp}").quantize(_SQL_DECIMAL_SCALE, rounding=ROUND_HALF_UP, context=_SQL_DECIMAL_CTX)
+        ip, fp = f"{q:f}".split(".")
+        ip = ip.lstrip("0")
+    if len(ip) > 28:
+        return ""
+    return f"{'-' if sign == '-' else ''}{ip or '0'}" + (f".{fp}" if fp else "")
+
+
+def sql_int(v: str) -> str:
+    """TRY_CONVERT(int, v) ; '' = NULL (vide, non entier ou hors int32)."""
+    if not v or SQL_INT_RE.fullmatch(v) is None:
+        return ""
+    n = int(v)
+    return str(n) if -(1 << 31) <= n < (1 << 31) else ""
+
+
+def sql_bit(v: str) -> str:
+    """CASE LOWER(LTRIM(RTRIM(v))) WHEN '1'/'true'/'t'/'y'/'yes' THEN 1 WHEN '0'/'false'/'f'/'n'/'no' THEN 0 ELSE NULL."""
+    v = v.strip(" ").lower()
+    return "1" if v in _SQL_TRUE else "0" if v in _SQL_FALSE else ""
+
+
+def _sql_truncate(n: int):
+    return lambda v: v[:n]
+
+
+def _instrument_converters(table: str) -> List[Tuple[int, object]]:
+    """(index wide, conversion) des colonnes d'une table instruments après les 6 colonnes de clé (_INSTRUMENT_KEY_SPEC)."""
+    conv = {"d": sql_date, "n": sql_decimal, "i": sql_int, "b": sql_bit,
+            "bigint": lambda v: "" if _sql_bigint(v) is None else v}
+    return [(COLUMNS_FULINS_WIDE.index(col), _sql_truncate(int(kind[1:])) if kind[0] == "s" else conv[kind])
+            for col, kind in INSTRUMENT_SPECS[table][len(_INSTRUMENT_KEY_SPEC):]]
+
+
+_INSTRUMENT_CONVERTERS = {t: _instrument_converters(t) for t in INSTRUMENT_TABLES}
+
+
+def instrument_route(listing: List[str]) -> Tuple[bool, bool]:
+    """
+    (DEBT, DERIVATIVE) d'une ligne LISTING typée, règles des INSERT de la proc (collation CI) :
+    DEBT si le CFI commence par D ; DERIVATIVE si CFI F/O/S, CommodityDerivativeInd = 1 ou CmdtyBaseProduct renseigné.
+    """
+    cfi = listing[_LST_CFI][:1].upper()
+    return cfi == "D", cfi in ("F", "O", "S") or listing[_LST_CMDTY_IND] == "1" or listing[_LST_CMDTY_BASE] != ""
+
+
+def instrument_key(listing: List[str]) -> str:
+    """Clé primaire (ISIN, TradingVenueMIC, ValidFromDate_PK) telle que comparée par SQL Server (French_CI_AS)."""
+    return f"{listing[0].rstrip(' ').upper()}|{listing[1].rstrip(' ').upper()}|{listing[_LST_PK]}"
+
+
+def instrument_outputs(instruments_dir: Path) -> Dict[str, Path]:
+    """BSV typés finaux (chargés par 03-LOAD_STG) : <dossier>/ESMA_INSTRUMENT_<TABLE>.bsv."""
+    return {t: instruments_dir / f"ESMA_INSTRUMENT_{t}.bsv" for t in INSTRUMENT_TABLES}
+
+
+def instrument_part_paths(part_bsv: Path) -> Dict[str, Path]:
+    """Sorties typées non dédoublonnées d'un part (ou d'un BSV unique) : <stem>.<table>.raw à côté du BSV."""
+    return {t: part_bsv.with_name(f"{part_bsv.stem}.{t.lower()}.raw") for t in INSTRUMENT_TABLES}
+
+
+class InstrumentWriter:
+    """
+    Fan-out des lignes FULINS (champs tels qu'écrits dans le BSV, cf. bsv_fields) vers trois BSV typés,
+    au fil du parsing : même typage et même routage que stg.usp_Load_ESMA_INSTRUMENTS_From_FULINS_WIDE
+    appliqués à stg.ESMA_FULINS_WIDE chargé depuis ce BSV. Ligne sans ISIN ou MIC : ignorée (PK NOT NULL).
+    Pas de dédoublonnage ici : merge_instruments() une fois tous les parts écrits.
+    """
+
+    def __init__(self, paths: Dict[str, Path]):
+        self.paths = paths
+        self.rows = dict.fromkeys(INSTRUMENT_TABLES, 0)
+        self.skipped = 0
+        self._stack = ExitStack()
+        self._files: Dict[str, object] = {}
+
+    def __enter__(self) -> "InstrumentWriter":
+        for t, path in self.paths.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._files[t] = self._stack.enter_context(open_bsv(path))
+            self._files[t].write(DELIMITER.join(INSTRUMENT_COLUMNS[t]) + "\n")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stack.close()
+
+    def _write(self, table: str, row: List[str]) -> None:
+        self._files[table].write(DELIMITER.join(row) + "\n")
+        self.rows[table] += 1
+
+    def add(self, out: List[str]) -> None:
+        isin, mic = out[_IDX_ISIN][:12], out[_IDX_MIC][:50]
+        if not isin or not mic:
+            self.skipped += 1
+            return
+        vf = sql_date(out[_IDX_VF])
+        key = [isin, mic, vf, sql_date(out[_IDX_VT]), sql_bit(out[_IDX_LATEST]), vf or INSTRUMENT_PK_FALLBACK]
+        listing = key + [conv(out[i]) for i, conv in _INSTRUMENT_CONVERTERS["LISTING"]]
+        self._write("LISTING", listing)
+        is_debt, is_deriv = instrument_route(listing)
+        if is_debt:
+            self._write("DEBT", key + [conv(out[i]) for i, conv in _INSTRUMENT_CONVERTERS["DEBT"]])
+        if is_deriv:
+            self._write("DERIVATIVE", key + [conv(out[i]) for i, conv in _INSTRUMENT_CONVERTERS["DERIVATIVE"]])
+
+
+class InstrumentDedup:
+    """
+    Unicité de la PK des tables instruments (instrument_key) sur l'ensemble des parts : une clé en double
+    (ex. même ISIN et MIC sous deux LEI) garde la dernière ligne lue, soit le TechRcrdId le plus grand.
+    Les clés sont comptées dans une base SQLite temporaire (sur disque, mémoire bornée) ; seules les clés
+    en double sont ensuite gardées en mémoire, pour keep().
+    """
+
+    BATCH_ROWS = 100000
+
+    def __init__(self):
+        self._db = sqlite3.connect("")
+        self._db.execute("PRAGMA journal_mode = OFF")
+        self._db.execute("PRAGMA synchronous = OFF")
+        self._db.execute("CREATE TABLE k (key TEXT NOT NULL)")
+        self._batch: List[Tuple[str]] = []
+        self._dups: Optional[Dict[str, int]] = None
+        self.rows = 0
+
+    def add(self, listing: List[str]) -> None:
+        self._batch.append((instrument_key(listing),))
+        self.rows += 1
+        if len(self._batch) >= self.BATCH_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._db.executemany("INSERT INTO k VALUES (?)", self._batch)
+        self._batch = []
+
+    def duplicates(self) -> Dict[str, int]:
+        """Clés présentes plus d'une fois -> nombre d'occurrences (lignes perdantes = somme - nombre de clés)."""
+        if self._dups is None:
+            self._flush()
+            self._db.commit()
+            self._dups = dict(self._db.execute("SELECT key, COUNT(*) FROM k GROUP BY key HAVING COUNT(*) > 1"))
+            self._db.close()
+        return self._dups
+
+    def keep(self, listing: List[str]) -> bool:
+        """Relecture dans l'ordre des add() : True sauf pour les occurrences d'une clé en double autres que la dernière."""
+        dups = self.duplicates()
+        if not dups:
+            return True
+        key = instrument_key(listing)
+        n = dups.get(key)
+        if n is None:
+            return True
+        dups[key] = n - 1
+        return n == 1
+
+
+def merge_instruments(sources: List[Dict[str, Path]], instruments_dir: Path, conn: Optional[pyodbc.Connection], run_ts: str) -> Dict[str, int]:
+    """
+    Fusionne les sorties typées des parts (instrument_part_paths, dans l'ordre du manifest) dans les BSV finaux
+    instrument_outputs(instruments_dir), dédoublonnés sur la PK (InstrumentDedup). DEBT et DERIVATIVE sont relus
+    en parallèle de LISTING : une ligne LISTING est suivie de ses lignes DEBT / DERIVATIVE selon instrument_route().
+    """
+    dedup = InstrumentDedup()
+    for src in sources:
+        with src["LISTING"].open("r", encoding="utf-8", newline="\n") as fh:
+            fh.readline()
+            for line in fh:
+                dedup.add(line.rstrip("\n").split(DELIMITER))
+    dups = dedup.duplicates()
+    losers = sum(dups.values()) - len(dups)
+
+    finals = instrument_outputs(instruments_dir)
+    rows = dict.fromkeys(INSTRUMENT_TABLES, 0)
+    instruments_dir.mkdir(parents=True, exist_ok=True)
+    with ExitStack() as stack:
+        outs = {t: stack.enter_context(open_bsv(finals[t].with_name(finals[t].name + ".tmp"))) for t in INSTRUMENT_TABLES}
+        for t, out in outs.items():
+            out.write(DELIMITER.join(INSTRUMENT_COLUMNS[t]) + "\n")
+        for src in sources:
+            with ExitStack() as part_stack:
+                ins = {t: part_stack.enter_context(src[t].open("r", encoding="utf-8", newline="\n")) for t in INSTRUMENT_TABLES}
+                for fh in ins.values():
+                    fh.readline()
+                for line in ins["LISTING"]:
+                    listing = line.rstrip("\n").split(DELIMITER)
+                    keep = dedup.keep(listing)
+                    for table, routed in zip(("DEBT", "DERIVATIVE"), instrument_route(listing)):
+                        if routed:
+                            sub = ins[table].readline()
+                            if keep:
+                                outs[table].write(sub)
+                                rows[table] += 1
+                    if keep:
+                        outs["LISTING"].write(line)
+                        rows["LISTING"] += 1
+    for t in INSTRUMENT_TABLES:
+        os.replace(finals[t].with_name(finals[t].name + ".tmp"), finals[t])
+
+    sql_log_line(conn, f"INSTRUMENTS rows={dedup.rows} duplicates_dropped={losers} "
+                       + " ".join(f"{t}={rows[t]}" for t in INSTRUMENT_TABLES),
+                 element="INS_DEDUP", complement=f"parts={len(sources)} out={instruments_dir} run_ts={run_ts}")
+    return rows
 
 
 # ----------------------------
@@ -352,175 +945,787 @@ def _text_dlt(node, xpath: str) -> str:
     return _text(node, xpath, NS_DLT)
 
 
-def _find_any_dlt(node, xpath: str):
-    return _find_any(node, xpath, NS_DLT)
+DLTINS_PLAN = FieldPlan(FIRDS_FIELDS.DLTINS_FIELDS, NS_DLT, COLUMNS_FULINS_WIDE)
 
 
-def _find_first_dlt(node, xpath: str):
-    return _find_first(node, xpath, NS_DLT)
+def _iter_refdata_nodes(record_elem):
+    refdatas = record_elem.findall(".//a:RefData", NS_DLT)
+    if refdatas:
+        return refdatas
+    if record_elem.find(".//a:FinInstrmGnlAttrbts", NS_DLT) is not None:
+        return [record_elem]
+    return []
 
 
-def get_valid_from_dlt(refdata) -> str:
-    for xp in ["./a:FinInstrmGnlAttrbts/a:VldFr", ".//a:VldFr", ".//a:ValidFrom"]:
-        v = _text_dlt(refdata, xp)
-        if v:
-            return v
-    return ""
+def _values_dlt(rec: List[str], refdata, hdr_market: str, hdr_nca: str, hdr_period: str, source_file: str) -> List[str]:
+    """Remplit rec (new_record()) avec les valeurs brutes (non nettoyées) d'un RefData DLTINS ; TechRcrdId posé à l'émission."""
+    rec[_IDX_MARKET] = hdr_market
+    rec[_IDX_NCA] = hdr_nca
+    rec[_IDX_PERIOD] = hdr_period
+    rec[_IDX_SOURCE] = source_file
+    DLTINS_PLAN.fill(refdata, rec)
+    return rec
+
+
+def _emit_dlt(vals: List[str], action: str, source_file: str, record_idx: int) -> Optional[List[str]]:
+    vals[_IDX_TECH] = tech_id(source_file, record_idx)
+    if not vals[_IDX_ISIN] or not vals[_IDX_MIC]:
+        return None
+    out = bsv_fields(vals)
+    out.append(action)
+    return out
+
+
+def _dltins_rows_stdlib(fh: BinaryIO, source_file: str) -> Iterator[List[str]]:
+    context = ET.iterparse(fh, events=("start", "end"))
+    _, root = next(context)
+
+    hdr_market = ""
+    hdr_nca = ""
+    hdr_period = ""
+    record_idx = 0
+    rec = new_record()
+
+    for ev, elem in context:
+        if ev != "end":
+            continue
+        if not str(elem.tag).endswith("FinInstrmRptgRefDataDltaRpt"):
+            continue
+
+        hdr = elem.find("./a:RptHdr", NS_DLT)
+        if hdr is not None:
+            hdr_market = _text_dlt(hdr, "./a:RptgNtty/a:MktIdCd")
+            hdr_nca = _text_dlt(hdr, "./a:RptgNtty/a:NtlCmptntAuthrty")
+            hdr_period = _text_dlt(hdr, "./a:RptgPrd/a:Dt")
+
+        for action, tag in DLT_ACTIONS:
+            for record_elem in elem.findall(f".//a:{tag}", NS_DLT):
+                for refdata in _iter_refdata_nodes(record_elem):
+                    record_idx += 1
+                    out = _emit_dlt(_values_dlt(rec, refdata, hdr_market, hdr_nca, hdr_period, source_file), action, source_file, record_idx)
+                    if out is not None:
+                        yield out
+
+        elem.clear()
+        root.clear()
+
+
+def _spool_read(spool) -> Iterator[List[str]]:
+    spool.seek(0)
+    while True:
+        try:
+            yield pickle.load(spool)
+        except EOFError:
+            return
+
+
+def _dltins_rows_lxml(fh: BinaryIO, source_file: str) -> Iterator[List[str]]:
+    """
+    Même sortie que le parcours stdlib (blocs NEW, MOD, TERM, CANC par rapport, record_idx dans cet ordre),
+    sans garder le rapport en mémoire : les NEW sont émis au fil de l'eau, MOD/TERM/CANC sont
+    mis en attente sur disque (valeurs déjà extraites) et émis à la fermeture du rapport.
+    """
+    ns = NS_DLT["a"]
+    tag_hdr = f"{{{ns}}}RptHdr"
+    action_of = {f"{{{ns}}}{tag}": action for action, tag in DLT_ACTIONS}
+    tags = ("{*}FinInstrmRptgRefDataDltaRpt", tag_hdr) + tuple(action_of)
+
+    hdr_market = ""
+    hdr_nca = ""
+    hdr_period = ""
+    record_idx = 0
+    rec = new_record()
+    spools = {}
+
+    try:
+        for _, elem in _lxml_iterparse(fh, tags):
+            action = action_of.get(elem.tag)
+            if action is not None:
+                for refdata in _iter_refdata_nodes(elem):
+                    vals = _values_dlt(rec, refdata, hdr_market, hdr_nca, hdr_period, source_file)
+                    if action == "NEW":
+                        record_idx += 1
+                        out = _emit_dlt(vals, action, source_file, record_idx)
+                        if out is not None:
+                            yield out
+                    else:
+                        if action not in spools:
+                            spools[action] = tempfile.TemporaryFile(prefix="dltins_spool_")
+                        pickle.dump(vals, spools[action], pickle.HIGHEST_PROTOCOL)
+                _lxml_release(elem)
+
+            elif elem.tag == tag_hdr:
+                if _parent_endswith(elem, "FinInstrmRptgRefDataDltaRpt"):
+                    hdr_market = _text_dlt(elem, "./a:RptgNtty/a:MktIdCd")
+                    hdr_nca = _text_dlt(elem, "./a:RptgNtty/a:NtlCmptntAuthrty")
+                    hdr_period = _text_dlt(elem, "./a:RptgPrd/a:Dt")
+
+            else:
+                # fin du rapport : blocs en attente, dans l'ordre MOD, TERM, CANC
+                for action, _tag in DLT_ACTIONS[1:]:
+                    spool = spools.pop(action, None)
+                    if spool is None:
+                        continue
+                    with spool:
+                        for vals in _spool_read(spool):
+                            record_idx += 1
+                            out = _emit_dlt(vals, action, source_file, record_idx)
+                            if out is not None:
+                                yield out
+                _lxml_release(elem)
+    finally:
+        for spool in spools.values():
+            spool.close()
+
+
+def _sql_bigint(v: str) -> Optional[int]:
+    """TRY_CONVERT(bigint, v) pour un identifiant décimal ; None sinon (ex. ancien TechRcrdId md5 hexadécimal)."""
+    if v.isascii() and v.isdigit():
+        n = int(v)
+        if n < 1 << 63:
+            return n
+    return None
+
+
+class DltinsDedup:
+    """
+    Dédoublonnage DLTINS en flux, clé et règle de l'ex-ROW_NUMBER de stg.usp_Process_DLTINS_Daily :
+    (ISIN, TradingVenueMIC, LEFT(COALESCE(ValidFromDate, HeaderReportingPeriodDate), 10), ActionType),
+    gagnant = TRY_CONVERT(bigint, TechRcrdId) le plus grand (NULL en dernier), à égalité la dernière ligne lue.
+    Seul clé -> rang est gardé en mémoire : les lignes sont relues ensuite (spool / parts) et filtrées par keep().
+    """
 
+    def __init__(self):
+        self._best: Dict[Tuple[str, str, str, str], Tuple[int, int, int]] = {}
+        self._winners: Optional[set] = None
+        self._pos = 0
+        self.rows = 0
+
+    def add(self, out: List[str]) -> None:
+        key = (out[_IDX_ISIN], out[_IDX_MIC], (out[_IDX_VF] or out[_IDX_PERIOD])[:10], out[-1])
+        tech = _sql_bigint(out[_IDX_TECH])
+        rank = (0, 0, self.rows) if tech is None else (1, tech, self.rows)
+        prev = self._best.get(key)
+        if prev is None or rank > prev:
+            self._best[key] = rank
+        self.rows += 1
+
+    def keep(self, lines: Iterable[str]) -> Iterator[str]:
+        """Lignes BSV (sans en-tête) dans l'ordre des add(), sur un ou plusieurs appels : ne rend que les gagnantes."""
+        if self._winners is None:
+            self._winners = {rank[2] for rank in self._best.values()}
+        for line in lines:
+            if self._pos in self._winners:
+                yield line
+            self._pos += 1
+
+    @property
+    def kept(self) -> int:
+        return len(self._best)
+
+
+def extract_dltins_xmls_to_bsv(xml_files: List[Union[Path, XmlSource]], out_bsv: Path, conn: pyodbc.Connection, run_ts: str,
+                               xml_parser: str = "auto") -> int:
+    """Lignes écrites dans un spool puis recopiées dédoublonnées (DltinsDedup) dans out_bsv ; renvoie les lignes gardées."""
+    parser = resolve_xml_parser(xml_parser)
+    rows_of = _dltins_rows_lxml if parser == "lxml" else _dltins_rows_stdlib
+    dedup = DltinsDedup()
 
-def parse_refdata_to_wide_dlt(refdata) -> Dict[str, str]:
-    row = {c: "" for c in COLUMNS_FULINS_WIDE}
-
-    row["ISIN"] = _first_text(refdata, ["./a:FinInstrmGnlAttrbts/a:Id", "./a:FinInstrmGnlAttrbts/a:ISIN"], NS_DLT)
-    row["FullName"] = _text_dlt(refdata, ".//a:FullNm")
-    row["ShortName"] = _text_dlt(refdata, ".//a:ShrtNm")
-    row["CFI"] = _first_text(refdata, [".//a:ClssfctnTp", ".//a:CFI"], NS_DLT)
-    row["CommodityDerivativeInd"] = _first_text(refdata, [".//a:CmmdtyDerivInd", ".//a:CommmodityDerivInd"], NS_DLT)
-    row["NotionalCurrency"] = _first_text(refdata, [".//a:NtnlCcy", ".//a:NotionalCcy"], NS_DLT)
-    row["IssuerLEI"] = _first_text(refdata, [".//a:Issr", ".//a:IssrLEI"], NS_DLT)
-
-    row["TradingVenueMIC"] = _first_text(refdata, [".//a:TradgVnRltdAttrbts/a:Id", ".//a:TradgVnRltdAttrbts/a:MIC"], NS_DLT)
-
-    row["IssuerReqAdmission"] = _first_text(refdata, [".//a:IssrReqAdmssn", ".//a:IssrReq"], NS_DLT)
-    row["AdmissionApprvlDate"] = _first_text(refdata, [".//a:AdmssnApprvlDtByIssr", ".//a:AdmissionApprovalDate"], NS_DLT)
-    row["ReqForAdmissionDate"] = _first_text(refdata, [".//a:ReqForAdmssnDt", ".//a:RequestForAdmissionDate"], NS_DLT)
-    row["FirstTradingDate"] = _first_text(refdata, [".//a:FrstTradDt", ".//a:FirstTradingDate"], NS_DLT)
-    row["TerminationDate"] = _first_text(refdata, [".//a:TermntnDt", ".//a:TerminationDate"], NS_DLT)
-
-    debt = _find_any_dlt(refdata, ".//a:DebtInstrmAttrbts")
-    if debt is not None:
-        row["TotalIssuedNominalAmount"] = _first_text(debt, [".//a:TtlIssdNmnlAmt", ".//a:TotalIssuedNominalAmount"], NS_DLT)
-        amt_el = debt.find(".//a:TtlIssdNmnlAmt", NS_DLT)
-        if amt_el is not None:
-            row["TotalIssuedNominalAmountCcy"] = amt_el.attrib.get("Ccy", "") or amt_el.attrib.get("CCY", "")
-        row["MaturityDate"] = _first_text(debt, [".//a:MtrtyDt", ".//a:MaturityDate"], NS_DLT)
-        row["NominalValuePerUnit"] = _first_text(debt, [".//a:NmnlValPerUnit", ".//a:NominalValuePerUnit"], NS_DLT)
-        nvp_el = debt.find(".//a:NmnlValPerUnit", NS_DLT)
-        if nvp_el is not None:
-            row["NominalValuePerUnitCcy"] = nvp_el.attrib.get("Ccy", "") or nvp_el.attrib.get("CCY", "")
-        row["FixedRate"] = _first_text(debt, [".//a:FxddRate", ".//a:FixedRate"], NS_DLT)
-        row["FloatRefRateISIN"] = _first_text(debt, [".//a:RefRate/a:Id", ".//a:RefRateISIN"], NS_DLT)
-        row["FloatRefRateIndex"] = _first_text(debt, [".//a:RefRateIndx", ".//a:RefRateIndex"], NS_DLT)
-        row["FloatTermUnit"] = _first_text(debt, [".//a:Term/a:Unit"], NS_DLT)
-        row["FloatTermValue"] = _first_text(debt, [".//a:Term/a:Val"], NS_DLT)
-        row["FloatBasisPointSpread"] = _first_text(debt, [".//a:BssPtsSprd"], NS_DLT)
-        row["DebtSeniority"] = _first_text(debt, [".//a:DbtSnrty", ".//a:DebtSeniority"], NS_DLT)
-
-    der = _find_any_dlt(refdata, ".//a:DerivInstrmAttrbts")
-    if der is not None:
-        row["ExpiryDate"] = _first_text(der, [".//a:XpryDt", ".//a:ExpiryDate"], NS_DLT)
-        row["PriceMultiplier"] = _first_text(der, [".//a:PricMltplr", ".//a:PriceMultiplier"], NS_DLT)
-
-        und = _find_first_dlt(der, ".//a:UndrlygInstrm")
-        if und is not None:
-            row["UnderlyingISIN"] = _text_dlt(und, "./a:Id") or _text_dlt(und, "./a:ISIN")
-            row["UnderlyingLEI"] = _text_dlt(und, "./a:LEI")
-            idx = _find_any_dlt(und, "./a:Indx")
-            if idx is not None:
-                row["UnderlyingIndexRef"] = _text_dlt(idx, "./a:Id") or _text_dlt(idx, "./a:Nm")
-                term = _find_any_dlt(idx, "./a:Term")
-                row["UnderlyingIndexTermUnit"] = _text_dlt(term, "./a:Unit")
-                row["UnderlyingIndexTermValue"] = _text_dlt(term, "./a:Val")
-
-        row["OptionType"] = _text_dlt(der, ".//a:OptnTp")
-        row["OptionExerciseStyle"] = _text_dlt(der, ".//a:ExrcStyle")
-        row["DeliveryType"] = _text_dlt(der, ".//a:DlvryTp")
-
-        sp = _find_any_dlt(der, ".//a:StrkPric")
-        if sp is not None:
-            row["StrikePrice"] = _text_dlt(sp, "./a:Val")
-            row["StrikePriceCcy"] = _text_dlt(sp, "./a:Ccy")
-
-        snp = _find_any_dlt(der, ".//a:StrkNoPric")
-        if snp is not None:
-            row["StrikeNoPriceCcy"] = _text_dlt(snp, "./a:Ccy")
-
-        row["CmdtyBaseProduct"] = _text_dlt(der, ".//a:BasePdct")
-        row["CmdtySubProduct"] = _text_dlt(der, ".//a:SubPdct")
-        row["CmdtySubSubProduct"] = _text_dlt(der, ".//a:SubSubPdct")
-        row["CmdtyTransactionType"] = _text_dlt(der, ".//a:TxTp")
-        row["CmdtyFinalPriceType"] = _text_dlt(der, ".//a:FnlPricTp")
-
-    return row
-
-
-def extract_dltins_xmls_to_bsv(xml_files: List[Path], out_bsv: Path, conn: pyodbc.Connection, run_ts: str) -> int:
     out_bsv.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryFile("w+", encoding="utf-8", newline="\n", buffering=BSV_WRITE_BUFFER, dir=out_bsv.parent) as spool:
+        for xml_src in map(_as_source, xml_files):
+            source_file = xml_src.name
+            sql_log_line(conn, "Parsing XML", element="DLT_PARSE", complement=f"file={xml_src} parser={parser} run_ts={run_ts}")
+
+            with xml_src.open() as fh:
+                for out in rows_of(fh, source_file):
+                    spool.write(DELIMITER.join(out) + "\n")
+                    dedup.add(out)
+
+        spool.seek(0)
+        with open_bsv(out_bsv) as f:
+            f.write(DELIMITER.join(COLUMNS_DLT_STG) + "\n")
+            f.writelines(dedup.keep(spool))
+
+    sql_log_line(conn, f"DLTINS dedup rows={dedup.rows} kept={dedup.kept}", element="DLT_DEDUP", complement=f"out={out_bsv} run_ts={run_ts}")
+    return dedup.kept
+
+
+# ----------------------------
+# Découpage d'un gros FULINS aux frontières <RefData>
+# ----------------------------
+class XmlChunk(NamedTuple):
+    """Tranche [start, end) d'un XML FULINS ; prologue [0, prolog_end) et épilogue [epilog_start, EOF) ajoutés autour."""
+    prolog_end: int
+    start: int
+    end: int
+    epilog_start: int
+    record_idx: int  # nombre de RefData avant la tranche (TechRcrdId identique au parsing du fichier entier)
+
+
+class _SpliceReader:
+    """Flux binaire lecture seule : prologue (RptHdr compris) + tranche + épilogue = fragment XML bien formé."""
+
+    def __init__(self, path: Path, chunk: XmlChunk):
+        self._fh = open(path, "rb")
+        self._segments = [(0, chunk.prolog_end), (chunk.start, chunk.end), (chunk.epilog_start, None)]
+        self._left: Optional[int] = 0
+        self._next_segment()
+
+    def _next_segment(self) -> bool:
+        if not self._segments:
+            return False
+        start, end = self._segments.pop(0)
+        self._fh.seek(start)
+        self._left = None if end is None else end - start  # None : jusqu'à la fin du fichier
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while True:
+            if self._left is None:
+                data = self._fh.read(size)
+            else:
+                data = self._fh.read(self._left if size is None or size < 0 else min(size, self._left))
+                self._left = self._left - len(data) if data else 0
+            if data:
+                return data
+            if not self._next_segment():
+                return b""
 
-    def _iter_refdata_nodes(record_elem):
-        refdatas = record_elem.findall(".//a:RefData", NS_DLT)
-        if refdatas:
-            return refdatas
-        if record_elem.find(".//a:FinInstrmGnlAttrbts", NS_DLT) is not None:
-            return [record_elem]
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+FULINS_RECORD_RE = re.compile(rb"<(?:[A-Za-z_][\w.\-]*:)?RefData[\s/>]")
+FULINS_RECORD_END = b"RefData>"
+
+
+def split_fulins_xml(path: Path, chunk_bytes: int) -> List[XmlChunk]:
+    """
+    Coupe un XML FULINS en tranches d'environ chunk_bytes, chacune commençant sur une balise <RefData>.
+    Retourne [] si le fichier est plus petit que chunk_bytes ou n'a pas la forme attendue
+    (un seul rapport FinInstrmRptgRefDataRpt dont les RefData sont contigus) : il est alors parsé entier.
+    """
+    size = path.stat().st_size
+    if chunk_bytes <= 0 or size <= chunk_bytes:
         return []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        first = FULINS_RECORD_RE.search(mm)
+        last_end = mm.rfind(FULINS_RECORD_END)
+        if first is None or last_end < first.start():
+            return []
+        body_start, body_end = first.start(), last_end + len(FULINS_RECORD_END)
+        if mm.find(b"FinInstrmRptgRefDataRpt", body_start, body_end) != -1:
+            return []
+        # balise ouvrante littérale du fichier (préfixe compris) : recherche ~4x plus rapide que le motif générique
+        record_re = re.compile(re.escape(first.group()[:-1]) + rb"[\s/>]")
+
+        cuts = [body_start]
+        while cuts[-1] + chunk_bytes < body_end:
+            m = record_re.search(mm, cuts[-1] + chunk_bytes, body_end)
+            if m is None:
+                break
+            cuts.append(m.start())
+        if len(cuts) == 1:
+            return []
+        cuts.append(body_end)
+
+        chunks = []
+        record_idx = 0
+        for start, end in zip(cuts, cuts[1:]):
+            chunks.append(XmlChunk(body_start, start, end, body_end, record_idx))
+            record_idx += sum(1 for _ in record_re.finditer(mm, start, end))
+        return chunks
 
-    with out_bsv.open("w", encoding="utf-8", newline="") as f:
-        w = csv.writer(f, delimiter=DELIMITER, lineterminator="\n", quoting=csv.QUOTE_NONE, escapechar="\\")
-        w.writerow(COLUMNS_DLT_STG)
 
+# ----------------------------
+# Parsing parallèle : un part BSV par XML (ou par tranche) + manifest
+# ----------------------------
+def _parse_part(kind: str, xml_src: XmlSource, part_bsv: Path, xml_parser: str, chunk: Optional[XmlChunk] = None,
+                instruments: bool = False) -> int:
+    """
+    Worker (process pool) : un XML (ou une tranche de FULINS) -> un part BSV avec en-tête
+    (+ ses sorties typées instrument_part_paths si instruments, FULINS uniquement).
+    """
+    instrument_paths = instrument_part_paths(part_bsv) if instruments and kind == "FULINS" else None
+    if chunk is None:
+        if kind == "FULINS":
+            return extract_fulins_xmls_to_bsv([xml_src], part_bsv, None, "", xml_parser, instrument_paths)
+        return extract_dltins_xmls_to_bsv([xml_src], part_bsv, None, "", xml_parser)
+
+    rows_of = _fulins_rows_lxml if resolve_xml_parser(xml_parser) == "lxml" else _fulins_rows_stdlib
+    part_bsv.parent.mkdir(parents=True, exist_ok=True)
+    with open_bsv(part_bsv) as f, (InstrumentWriter(instrument_paths) if instrument_paths else nullcontext()) as inst:
+        f.write(DELIMITER.join(COLUMNS_FULINS_WIDE) + "\n")
         total = 0
-        for xml_path in xml_files:
-            source_file = xml_path.name
-            sql_log_line(conn, "Parsing XML", element="DLT_PARSE", complement=f"file={xml_path} run_ts={run_ts}")
+        with _SpliceReader(xml_src.path, chunk) as fh:
+            for out in rows_of(fh, xml_src.name, chunk.record_idx):
+                f.write(DELIMITER.join(out) + "\n")
+                if inst is not None:
+                    inst.add(out)
+                total += 1
+        return total
 
-            context = ET.iterparse(xml_path, events=("start", "end"))
-            _, root = next(context)
 
-            hdr_market = ""
-            hdr_nca = ""
-            hdr_period = ""
-            record_idx = 0
+def manifest_path(out_bsv: Path) -> Path:
+    return out_bsv.with_name(out_bsv.stem + MANIFEST_SUFFIX)
 
-            for ev, elem in context:
-                if ev != "end":
-                    continue
-                if not str(elem.tag).endswith("FinInstrmRptgRefDataDltaRpt"):
-                    continue
 
-                hdr = elem.find("./a:RptHdr", NS_DLT)
-                if hdr is not None:
-                    hdr_market = _text_dlt(hdr, "./a:RptgNtty/a:MktIdCd")
-                    hdr_nca = _text_dlt(hdr, "./a:RptgNtty/a:NtlCmptntAuthrty")
-                    hdr_period = _text_dlt(hdr, "./a:RptgPrd/a:Dt")
-
-                blocks = [
-                    ("NEW",  ".//a:NewRcrd"),
-                    ("MOD",  ".//a:ModfdRcrd"),
-                    ("TERM", ".//a:TermntdRcrd"),
-                    ("CANC", ".//a:CancRcrd"),
-                ]
-
-                for action, bx in blocks:
-                    for record_elem in elem.findall(bx, NS_DLT):
-                        for refdata in _iter_refdata_nodes(record_elem):
-                            record_idx += 1
-                            row = parse_refdata_to_wide_dlt(refdata)
+def checkpoint_path(out_bsv: Path) -> Path:
+    return out_bsv.parent / "parts" / (out_bsv.stem + CHECKPOINT_SUFFIX)
+
 
-                            row["HeaderReportingMarketId"] = hdr_market
-                            row["HeaderReportingNCA"] = hdr_nca
-                            row["HeaderReportingPeriodDate"] = hdr_period
-                            row["SourceFileName"] = source_file
+def _write_json_atomic(path: Path, obj) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
 
-                            row["ValidFromDate"] = get_valid_from_dlt(refdata)
-                            row["ValidToDate"] = ""
-                            row["LatestRecordFlag"] = "1"
 
-                            if not row.get("TechRcrdId"):
-                                row["TechRcrdId"] = md5_tech_id(source_file, row.get("ISIN", ""), row.get("TradingVenueMIC", ""), record_idx)
+def _task_key(src: XmlSource, chunk: Optional[XmlChunk]) -> Dict:
+    """Identité d'une tâche de parsing : source, taille et mtime du fichier (XML ou ZIP), tranche éventuelle."""
+    st = src.path.stat()
+    key = {"source": str(src), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    if chunk is not None:
+        key["range"] = [chunk.start, chunk.end]
+    return key
 
-                            if not row.get("ISIN") or not row.get("TradingVenueMIC"):
-                                continue
 
-                            out = [sanitize(row.get(c, "")) for c in COLUMNS_FULINS_WIDE]
-                            out.append(action)
-                            w.writerow(out)
-                            total += 1
+def load_checkpoint(out_bsv: Path, kind: str) -> Dict[str, Dict]:
+    """Parts terminés par un build précédent : {nom du part: entrée} ; vide si absent, illisible ou autres colonnes."""
+    path = checkpoint_path(out_bsv)
+    if not path.exists():
+        return {}
+    try:
+        ckpt = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if ckpt.get("kind") != kind or ckpt.get("columns") != (COLUMNS_FULINS_WIDE if kind == "FULINS" else COLUMNS_DLT_STG):
+        return {}
+    return {e["part"]: e for e in ckpt.get("done", [])}
 
-                elem.clear()
-                root.clear()
 
-        return total
+def build_bsv_parts(kind: str, xml_files: List[Union[Path, XmlSource]], out_bsv: Path, conn: pyodbc.Connection, run_ts: str,
+                    xml_parser: str = "auto", workers: int = PARSE_WORKERS_DEFAULT, split_bytes: int = 0,
+                    resume: bool = False, instruments: bool = False) -> Tuple[Path, int]:
+    """
+    Parse chaque XML dans son propre part BSV (<dossier>/parts/<stem>.partNNNN.bsv), en parallèle sur
+    `workers` processus, puis écrit le manifest <stem>.manifest.json (parts dans l'ordre des XML).
+    FULINS extrait > split_bytes (workers > 1) : découpé en tranches aux frontières <RefData>, un part par tranche.
+    La concaténation des parts (en-tête une seule fois) est identique au BSV unique du mode séquentiel.
+
+    Chaque part terminé est consigné dans parts/<stem>.checkpoint.json (source, taille, mtime, tranche,
+    lignes, octets). resume=True : les parts dont la source est inchangée et le fichier intact sont repris
+    tels quels, seules les autres tâches sont parsées.
+    instruments=True (FULINS) : chaque part écrit aussi ses sorties typées (instrument_part_paths), consignées
+    avec lui ; un part repris sans elles est reparsé.
+    """
+    parser = resolve_xml_parser(xml_parser)
+    tasks: List[Tuple[XmlSource, Optional[XmlChunk]]] = []
+    for src in map(_as_source, xml_files):
+        # découpage inutile avec un seul worker : il coûterait une passe complète (mmap + regex) par XML
+        split = kind == "FULINS" and src.member is None and workers > 1
+        chunks = split_fulins_xml(src.path, split_bytes) if split else []
+        if chunks:
+            sql_log_line(conn, f"Split into {len(chunks)} chunks", element="FUL_SPLIT", complement=f"file={src} split_bytes={split_bytes} run_ts={run_ts}")
+        tasks.extend((src, c) for c in chunks or [None])
+
+    parts_dir = out_bsv.parent / "parts"
+    part_paths = [parts_dir / f"{out_bsv.stem}.part{i:04d}.bsv" for i in range(1, len(tasks) + 1)]
+    keys = [_task_key(src, chunk) for src, chunk in tasks]
+    columns = COLUMNS_FULINS_WIDE if kind == "FULINS" else COLUMNS_DLT_STG
+
+    instruments = instruments and kind == "FULINS"
+
+    def _intact(path: Path, size: int) -> bool:
+        return path.exists() and path.stat().st_size == size
+
+    def _reusable(entry: Dict, key: Dict, part: Path) -> bool:
+        if entry["key"] != key or not _intact(part, entry["bytes"]):
+            return False
+        return not instruments or ("instruments" in entry and all(
+            _intact(p, entry["instruments"].get(p.name, -1)) for p in instrument_part_paths(part).values()))
+
+    done = load_checkpoint(out_bsv, kind) if resume else {}
+    reused = [i for i, (key, part) in enumerate(zip(keys, part_paths)) if part.name in done and _reusable(done[part.name], key, part)]
+    keep = {part_paths[i].name for i in reused}
+    if instruments:
+        keep.update(p.name for i in reused for p in instrument_part_paths(part_paths[i]).values())
+    if parts_dir.exists():
+        for f in parts_dir.iterdir():
+            if f.name not in keep:
+                f.unlink()
+    parts_dir.mkdir(parents=True, exist_ok=True)
+
+    ckpt = {"kind": kind, "columns": columns, "done": [done[part_paths[i].name] for i in reused]}
+    out_checkpoint = checkpoint_path(out_bsv)
+    _write_json_atomic(out_checkpoint, ckpt)
+    rows_by_part: Dict[int, int] = {i: int(done[part_paths[i].name]["rows"]) for i in reused}
+    todo = [i for i in range(len(tasks)) if i not in rows_by_part]
+    if resume:
+        sql_log_line(conn, f"Resume: reused={len(reused)} todo={len(todo)} tasks={len(tasks)}", element=f"{kind[:3]}_RESUME",
+                     complement=f"checkpoint={out_checkpoint} run_ts={run_ts}")
+
+    def _part_done(i: int, rows: int, extra: str = "") -> None:
+        rows_by_part[i] = rows
+        entry = {"part": part_paths[i].name, "key": keys[i], "rows": rows, "bytes": part_paths[i].stat().st_size}
+        if instruments:
+            entry["instruments"] = {p.name: p.stat().st_size for p in instrument_part_paths(part_paths[i]).values()}
+        ckpt["done"].append(entry)
+        _write_json_atomic(out_checkpoint, ckpt)
+        sql_log_line(conn, f"Part parsed rows={rows}", element=f"{kind[:3]}_PARSE",
+                     complement=f"file={tasks[i][0]} part={part_paths[i].name}{extra} run_ts={run_ts}")
+
+    workers = max(1, min(workers, len(todo)))
+    if workers == 1:
+        for i in todo:
+            src, chunk = tasks[i]
+            _part_done(i, _parse_part(kind, src, part_paths[i], parser, chunk, instruments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_parse_part, kind, tasks[i][0], part_paths[i], parser, tasks[i][1], instruments): i for i in todo}
+            for fut in as_completed(futures):
+                _part_done(futures[fut], fut.result(), f" workers={workers}")
+
+    total = sum(rows_by_part.values())
+    parts = []
+    for i, ((src, chunk), part) in enumerate(zip(tasks, part_paths)):
+        entry = {"file": part.relative_to(out_bsv.parent).as_posix(), "source": str(src), "rows": rows_by_part[i], "bytes": part.stat().st_size}
+        if chunk is not None:
+            entry["range"] = [chunk.start, chunk.end]
+        parts.append(entry)
+    manifest = {
+        "kind": kind,
+        "bsv": out_bsv.name,
+        "columns": columns,
+        "rows": total,
+        "run_ts": run_ts,
+        "parts": parts,
+    }
+    out_manifest = manifest_path(out_bsv)
+    _write_json_atomic(out_manifest, manifest)
+    return out_manifest, total
+
+
+def concat_parts(out_manifest: Path, out_bsv: Path) -> int:
+    """Concatène les parts d'un manifest en un seul BSV (en-tête du premier part uniquement)."""
+    manifest = json.loads(out_manifest.read_text(encoding="utf-8"))
+    base = out_manifest.parent
+    out_bsv.parent.mkdir(parents=True, exist_ok=True)
+    with out_bsv.open("wb") as out:
+        out.write((DELIMITER.join(manifest["columns"]) + "\n").encode("utf-8"))
+        for part in manifest["parts"]:
+            with (base / part["file"]).open("rb") as fh:
+                fh.readline()
+                shutil.copyfileobj(fh, out, 1024 * 1024)
+    return int(manifest["rows"])
+
+
+def dedup_dltins_parts(out_manifest: Path, out_bsv: Path, conn: pyodbc.Connection, run_ts: str) -> int:
+    """
+    Dédoublonnage global des parts DLTINS (une même clé peut figurer dans plusieurs XML du jour) :
+    clés lues dans l'ordre du manifest, puis parts recopiés dans un BSV unique sans les perdants.
+    """
+    manifest = json.loads(out_manifest.read_text(encoding="utf-8"))
+    parts = [out_manifest.parent / part["file"] for part in manifest["parts"]]
+    dedup = DltinsDedup()
+    for part in parts:
+        with part.open("r", encoding="utf-8", newline="\n") as fh:
+            fh.readline()
+            for line in fh:
+                # champs tels qu'écrits (échappés, cf. bsv_fields) : un "|" n'y apparaît jamais, comme en flux
+                dedup.add(line.rstrip("\n").split(DELIMITER))
+
+    out_bsv.parent.mkdir(parents=True, exist_ok=True)
+    with open_bsv(out_bsv) as out:
+        out.write(DELIMITER.join(manifest["columns"]) + "\n")
+        for part in parts:
+            with part.open("r", encoding="utf-8", newline="\n") as fh:
+                fh.readline()
+                out.writelines(dedup.keep(fh))
+
+    sql_log_line(conn, f"DLTINS dedup parts={len(parts)} rows={dedup.rows} kept={dedup.kept}", element="DLT_DEDUP",
+                 complement=f"out={out_bsv} run_ts={run_ts}")
+    return dedup.kept
+
+
+def build_bsv(kind: str, xml_files: List[Union[Path, XmlSource]], out_bsv: Path, conn: pyodbc.Connection, run_ts: str,
+              xml_parser: str, workers: int, concat: bool, split_bytes: int = 0, resume: bool = False,
+              instruments_dir: Optional[Path] = None) -> int:
+    """
+    Mode séquentiel (workers=1) : BSV unique ; sinon parts + manifest (ou BSV unique si concat).
+    resume=True : toujours via parts + checkpoint (reprise d'un build interrompu) ; en séquentiel, les parts sont
+    reconcaténés dans le BSV unique.
+    DLTINS : les parts sont toujours fusionnés dans le BSV unique, dédoublonnés entre XML (dedup_dltins_parts).
+    FULINS + instruments_dir : BSV typés LISTING / DEBT / DERIVATIVE écrits pendant le parsing puis fusionnés et
+    dédoublonnés sur la PK dans instruments_dir (merge_instruments).
+    """
+    instruments = kind == "FULINS" and instruments_dir is not None
+    if instruments:
+        # pas de BSV typés d'un build précédent à côté d'un FULINS reconstruit (03 les chargerait)
+        for path in instrument_outputs(instruments_dir).values():
+            path.unlink(missing_ok=True)
+
+    if workers <= 1 and not resume:
+        # un reste de build par parts (interrompu) serait relu par 03 à côté du BSV unique
+        shutil.rmtree(out_bsv.parent / "parts", ignore_errors=True)
+        manifest_path(out_bsv).unlink(missing_ok=True)
+        if kind == "DLTINS":
+            return extract_dltins_xmls_to_bsv(xml_files, out_bsv, conn, run_ts, xml_parser)
+        raw = instrument_part_paths(out_bsv) if instruments else None
+        rows = extract_fulins_xmls_to_bsv(xml_files, out_bsv, conn, run_ts, xml_parser, raw)
+        if raw:
+            merge_instruments([raw], instruments_dir, conn, run_ts)
+            for path in raw.values():
+                path.unlink()
+        return rows
+
+    concat = concat or workers <= 1 or kind == "DLTINS"
+    out_manifest, rows = build_bsv_parts(kind, xml_files, out_bsv, conn, run_ts, xml_parser, workers, split_bytes, resume, instruments)
+    if instruments:
+        merge_instruments([instrument_part_paths(p) for p in bsv_outputs(out_bsv)], instruments_dir, conn, run_ts)
+    if kind == "DLTINS":
+        rows = dedup_dltins_parts(out_manifest, out_bsv, conn, run_ts)
+    elif concat:
+        concat_parts(out_manifest, out_bsv)
+    if concat:
+        shutil.rmtree(out_bsv.parent / "parts", ignore_errors=True)
+        out_manifest.unlink()
+    sql_log_line(conn, f"{kind} parts={len(xml_files)} rows={rows} concat={concat}", element=f"{kind[:3]}_PARTS",
+                 complement=str(out_bsv if concat else out_manifest))
+    return rows
+
+
+# ----------------------------
+# FULL incrémental : empreintes (ISIN, MIC) et jeu de changements NEW / MOD / TERM
+# ----------------------------
+def record_key(fields: List[str]) -> Optional[str]:
+    """Clé (ISIN, TradingVenueMIC) telle que comparée par SQL Server (French_CI_AS) ; None si l'une est vide."""
+    isin = fields[_IDX_ISIN].strip().upper()
+    mic = fields[_IDX_MIC].strip().upper()
+    if not isin or not mic:
+        return None
+    return f"{isin}{DELIMITER}{mic}"
+
+
+def record_hash(fields: List[str]) -> int:
+    """Empreinte 64 bits (blake2b) des champs BSV de contenu (hors _HASH_SKIP)."""
+    digest = hashlib.blake2b("\x1f".join(_hash_fields(fields)).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def iter_bsv_lines(bsv_files: List[Path]) -> Iterator[Tuple[str, List[str]]]:
+    """(ligne brute, champs) des BSV dans l'ordre de chargement, en-têtes exclus."""
+    for bsv in bsv_files:
+        with bsv.open("r", encoding="utf-8", newline="\n") as fh:
+            fh.readline()
+            for line in fh:
+                yield line, line.rstrip("\n").split(DELIMITER)
+
+
+def build_hash_index(bsv_files: List[Path], index_path: Path, full_date: str) -> int:
+    """
+    Index SQLite du FULL : h(key, hash, seq) trié par clé, seq = rang de la ligne dans bsv_files.
+    Une clé en double garde la dernière ligne lue (comme InstrumentDedup). Retourne le nombre de clés.
+    """
+    tmp = index_path.with_name(index_path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    db = sqlite3.connect(str(tmp))
+    try:
+        db.execute("PRAGMA journal_mode = OFF")
+        db.execute("PRAGMA synchronous = OFF")
+        # lignes brutes dans une base temporaire : seule la table h, remplie dans l'ordre des clés, reste dans l'index
+        db.execute("ATTACH DATABASE '' AS raw")
+        db.execute("CREATE TABLE raw.r (key TEXT NOT NULL, hash INTEGER NOT NULL, seq INTEGER NOT NULL)")
+        batch: List[Tuple[str, int, int]] = []
+        for seq, (_, fields) in enumerate(iter_bsv_lines(bsv_files)):
+            key = record_key(fields)
+            if key is None:
+                continue
+            batch.append((key, record_hash(fields), seq))
+            if len(batch) >= HASH_BATCH_ROWS:
+                db.executemany("INSERT INTO raw.r VALUES (?, ?, ?)", batch)
+                batch = []
+        if batch:
+            db.executemany("INSERT INTO raw.r VALUES (?, ?, ?)", batch)
+        db.execute("CREATE TABLE h (key TEXT PRIMARY KEY, hash INTEGER NOT NULL, seq INTEGER NOT NULL) WITHOUT ROWID")
+        # SQLite : avec MAX(), les colonnes nues viennent de la ligne retenue (dernière occurrence de la clé)
+        db.execute("INSERT INTO h SELECT key, hash, MAX(seq) FROM raw.r GROUP BY key")
+        db.execute("CREATE TABLE meta (k TEXT PRIMARY KEY, v TEXT NOT NULL)")
+        db.execute("INSERT INTO meta VALUES ('full_date', ?)", (full_date,))
+        db.commit()
+        keys = db.execute("SELECT COUNT(*) FROM h").fetchone()[0]
+    finally:
+        db.close()
+    os.replace(tmp, index_path)
+    return keys
+
+
+def hash_index_date(index_path: Path) -> Optional[str]:
+    """Date (YYYYMMDD) du FULL d'un index d'empreintes, None si absent ou illisible."""
+    if not index_path.exists():
+        return None
+    try:
+        db = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True)
+        try:
+            row = db.execute("SELECT v FROM meta WHERE k = 'full_date'").fetchone()
+        finally:
+            db.close()
+    except sqlite3.DatabaseError:
+        return None
+    return row[0] if row else None
+
+
+_SQL_DIFF_CHANGED = """
+    FROM h n LEFT JOIN base.h o ON o.key = n.key
+    WHERE (o.key IS NULL OR o.hash <> n.hash)
+"""
+_SQL_DIFF_TERM = """
+    FROM base.h o
+    WHERE NOT EXISTS (SELECT 1 FROM h n WHERE n.key = o.key)
+"""
+
+
+def write_fulins_diff(bsv_files: List[Path], index_path: Path, base_path: Path, diff_bsv: Path,
+                      max_pct: float) -> Tuple[Dict[str, int], bool]:
+    """
+    Compare l'index du FULL à celui du FULL précédent et écrit le jeu de changements (colonnes COLUMNS_DLT_STG) :
+    - NEW / MOD : la ligne du FULL (dernière occurrence de la clé), relue dans bsv_files dans l'ordre des seq ;
+    - TERM : clé absente du FULL, seuls ISIN / MIC / dates renseignés (fermeture par stg.usp_Apply_FULINS_Diff).
+    Rien n'est écrit si plus de max_pct % des clés changent (rechargement complet plus simple).
+    Retourne (compteurs, écrit).
+    """
+    db = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True)
+    try:
+        db.execute("ATTACH DATABASE ? AS base", (f"file:{base_path}?mode=ro",))
+        counts = {
+            "keys": db.execute("SELECT COUNT(*) FROM h").fetchone()[0],
+            "NEW": db.execute("SELECT COUNT(*)" + _SQL_DIFF_CHANGED + " AND o.key IS NULL").fetchone()[0],
+            "MOD": db.execute("SELECT COUNT(*)" + _SQL_DIFF_CHANGED + " AND o.key IS NOT NULL").fetchone()[0],
+            "TERM": db.execute("SELECT COUNT(*)" + _SQL_DIFF_TERM).fetchone()[0],
+        }
+        changed = counts["NEW"] + counts["MOD"] + counts["TERM"]
+        if changed * 100.0 > max_pct * max(1, counts["keys"]):
+            return counts, False
+
+        tmp = diff_bsv.with_name(diff_bsv.name + ".tmp")
+        period = ""
+        with open_bsv(tmp) as out:
+            out.write(DELIMITER.join(COLUMNS_DLT_STG) + "\n")
+            changes = db.execute("SELECT n.seq, CASE WHEN o.key IS NULL THEN 'NEW' ELSE 'MOD' END"
+                                 + _SQL_DIFF_CHANGED + " ORDER BY n.seq")
+            nxt = next(changes, None)
+            for seq, (line, fields) in enumerate(iter_bsv_lines(bsv_files)):
+                if seq == 0:
+                    period = fields[_IDX_PERIOD]
+                if nxt is None:
+                    break
+                if seq == nxt[0]:
+                    out.write(line.rstrip("\n") + DELIMITER + nxt[1] + "\n")
+                    nxt = next(changes, None)
+
+            rec = [""] * len(COLUMNS_FULINS_WIDE)
+            rec[_IDX_PERIOD] = rec[_IDX_VF] = period
+            for (key,) in db.execute("SELECT o.key" + _SQL_DIFF_TERM + " ORDER BY o.key"):
+                rec[_IDX_ISIN], rec[_IDX_MIC] = key.split(DELIMITER, 1)
+                out.write(DELIMITER.join(rec) + DELIMITER + "TERM\n")
+        os.replace(tmp, diff_bsv)
+    finally:
+        db.close()
+    return counts, True
+
+
+def build_fulins_diff(bsv_files: List[Path], full_date: str, diff_dir: Path, base_index: Path,
+                      conn: Optional[pyodbc.Connection], run_ts: str, max_pct: float = FULINS_DIFF_MAX_PCT_DEFAULT) -> bool:
+    """
+    FULL incrémental ([ESMA] fulins_incremental) :
+    - index d'empreintes du FULL dans diff_dir (promu en base_index par 03-LOAD_STG une fois le FULL chargé) ;
+    - si base_index existe (FULL précédent) : FULINS_DIFF_<date>.bsv + .json (date du FULL de base, contrôlée par
+      03-LOAD_STG avant d'appliquer le diff au lieu du rechargement complet).
+    Retourne True si un jeu de changements a été écrit.
+    """
+    shutil.rmtree(diff_dir, ignore_errors=True)
+    diff_dir.mkdir(parents=True, exist_ok=True)
+    index_path = diff_dir / HASH_INDEX_NAME
+    keys = build_hash_index(bsv_files, index_path, full_date)
+
+    base_date = hash_index_date(base_index)
+    if base_date is None:
+        sql_log_line(conn, f"FULL_DIFF - no base hash index, full reload keys={keys}", element="FUL_DIFF_SKIP",
+                     complement=f"base={base_index} run_ts={run_ts}")
+        return False
+
+    diff_bsv = diff_dir / f"FULINS_DIFF_{full_date}.bsv"
+    counts, written = write_fulins_diff(bsv_files, index_path, base_index, diff_bsv, max_pct)
+    summary = " ".join(f"{k}={v}" for k, v in counts.items())
+    if not written:
+        sql_log_line(conn, f"FULL_DIFF - too many changes, full reload {summary}", element="FUL_DIFF_SKIP",
+                     complement=f"base_date={base_date} max_pct={max_pct} run_ts={run_ts}")
+        return False
+    _write_json_atomic(diff_bsv.with_suffix(".json"), dict(counts, full_date=full_date, base_full_date=base_date))
+    sql_log_line(conn, f"FULL_DIFF - {summary}", element="FUL_DIFF",
+                 complement=f"base_date={base_date} out={diff_bsv} run_ts={run_ts}")
+    return True
+
+
+# ----------------------------
+# Sortie colonnaire Parquet (optionnelle, pyarrow)
+# ----------------------------
+def bsv_outputs(out_bsv: Path) -> List[Path]:
+    """BSV produits pour out_bsv : parts du manifest (mode parallèle) ou le BSV unique."""
+    out_manifest = manifest_path(out_bsv)
+    if out_manifest.exists():
+        manifest = json.loads(out_manifest.read_text(encoding="utf-8"))
+        return [out_manifest.parent / part["file"] for part in manifest["parts"]]
+    return [out_bsv]
+
+
+def write_parquet_from_bsv(bsv_files: List[Path], columns: List[str], out_parquet: Path,
+                           row_group_rows: int = PARQUET_ROW_GROUP_ROWS_DEFAULT, compression: str = "zstd") -> int:
+    """
+    Relit les BSV (lecteur CSV C++ de pyarrow, en flux) et écrit un Parquet colonnes string
+    (int64 pour PARQUET_INT64_COLUMNS), par row groups de row_group_rows lignes, encodage dictionnaire sauf PARQUET_PLAIN_COLUMNS.
+    Les valeurs sont celles du BSV une fois l'échappement csv ("\\") retiré.
+    """
+    if pa is None:
+        raise RuntimeError("[ESMA].parquet_output=true but pyarrow is not installed (pip install pyarrow)")
+
+    types = {c: pa.int64() if c in PARQUET_INT64_COLUMNS else pa.string() for c in columns}
+    schema = pa.schema(list(types.items()))
+    read_opts = pacsv.ReadOptions(column_names=columns, skip_rows=1, block_size=16 * 1024 * 1024)
+    parse_opts = pacsv.ParseOptions(delimiter=DELIMITER, quote_char=False, escape_char="\\")
+    convert_opts = pacsv.ConvertOptions(column_types=types, strings_can_be_null=False)
+
+    out_parquet.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_parquet.with_name(out_parquet.name + ".tmp")
+    rows = 0
+    pending: List = []
+    pending_rows = 0
+    with pq.ParquetWriter(tmp, schema, compression=compression,
+                          use_dictionary=[c for c in columns if c not in PARQUET_PLAIN_COLUMNS]) as writer:
+        for bsv in bsv_files:
+            if bsv.stat().st_size <= len(DELIMITER.join(columns)) + 1:
+                continue  # en-tête seul
+            with pacsv.open_csv(bsv, read_options=read_opts, parse_options=parse_opts, convert_options=convert_opts) as reader:
+                for batch in reader:
+                    pending.append(batch)
+                    pending_rows += batch.num_rows
+                    while pending_rows >= row_group_rows:
+                        table = pa.Table.from_batches(pending, schema)
+                        writer.write_table(table.slice(0, row_group_rows), row_group_size=row_group_rows)
+                        rows += row_group_rows
+                        pending = table.slice(row_group_rows).to_batches()
+                        pending_rows -= row_group_rows
+        if pending_rows:
+            writer.write_table(pa.Table.from_batches(pending, schema), row_group_size=row_group_rows)
+            rows += pending_rows
+    os.replace(tmp, out_parquet)
+    return rows
 
 
 # ----------------------------
@@ -539,8 +1744,37 @@ def main() -> int:
     try:
         sql_log_line(conn, "BEGIN", element="BUILD_CSV", complement=f"run_ts={run_ts} data_root={data_root}")
 
-        extracted_root = data_root / "extracted"
+        # stream : lecture directe des XML dans les zips de downloaded/ (pas d'extraction)
+        extract_mode = cfg.get("ESMA", "extract_mode", fallback="unzip").strip().lower()
+        extracted_root = data_root / ("downloaded" if extract_mode == "stream" else "extracted")
         csv_root = data_root / "csv"
+        sql_log_line(conn, f"Source mode={extract_mode}", element="BUILD_CSV", complement=str(extracted_root))
+        xml_parser = resolve_xml_parser(cfg.get("ESMA", "xml_parser", fallback="auto"))
+        sql_log_line(conn, f"XML parser={xml_parser}", element="BUILD_CSV", complement=f"lxml_available={LET is not None}")
+        parse_workers = cfg.getint("ESMA", "parse_workers", fallback=PARSE_WORKERS_DEFAULT)
+        parse_concat = cfg.getboolean("ESMA", "parse_concat_parts", fallback=False)
+        parse_split_bytes = int(cfg.getfloat("ESMA", "parse_split_mb", fallback=PARSE_SPLIT_MB_DEFAULT) * 1024 * 1024)
+        parse_resume = cfg.getboolean("ESMA", "parse_resume", fallback=False)
+        sql_log_line(conn, f"Parse workers={parse_workers} concat_parts={parse_concat} resume={parse_resume}", element="BUILD_CSV", complement=f"cpu={os.cpu_count()}")
+        parquet_output = cfg.getboolean("ESMA", "parquet_output", fallback=False)
+        parquet_dir = cfg.get("ESMA", "parquet_dir", fallback="").strip()
+        parquet_row_group_rows = cfg.getint("ESMA", "parquet_row_group_rows", fallback=PARQUET_ROW_GROUP_ROWS_DEFAULT)
+        parquet_compression = cfg.get("ESMA", "parquet_compression", fallback="zstd").strip().lower()
+        if parquet_output and pa is None:
+            raise RuntimeError("[ESMA].parquet_output=true but pyarrow is not installed (pip install pyarrow)")
+        instruments_output = cfg.getboolean("ESMA", "instruments_output", fallback=False)
+        fulins_incremental = cfg.getboolean("ESMA", "fulins_incremental", fallback=False)
+        fulins_incremental_max_pct = cfg.getfloat("ESMA", "fulins_incremental_max_pct", fallback=FULINS_DIFF_MAX_PCT_DEFAULT)
+
+        def _parquet(kind: str, out_bsv: Path) -> None:
+            if not parquet_output:
+                return
+            base = Path(parquet_dir) / kind if parquet_dir else out_bsv.parent
+            out_parquet = base / f"{out_bsv.stem}.parquet"
+            columns = COLUMNS_FULINS_WIDE if kind == "FULINS" else COLUMNS_DLT_STG
+            n = write_parquet_from_bsv(bsv_outputs(out_bsv), columns, out_parquet, parquet_row_group_rows, parquet_compression)
+            sql_log_line(conn, f"{kind} parquet rows={n} bytes={out_parquet.stat().st_size}", element=f"{kind[:3]}_PARQUET",
+                         complement=f"{out_parquet} row_group_rows={parquet_row_group_rows} compression={parquet_compression}")
 
 
         # FULL : max date
@@ -550,30 +1784,41 @@ def main() -> int:
             sql_log_line(conn, "FULL - No extracted folder found", element="FUL_SKIP", complement=str(ful_parent))
         else:
             ful_d, ful_dir = ful_pick
-            xmls = list_xmls(ful_dir)
+            xmls = list_sources(ful_dir, extract_mode)
             out_bsv = csv_root / "FULINS" / ful_d / f"FULINS_WIDE_{ful_d}.bsv"
+            # instruments typés hors de csv\FULINS (03 y charge tous les *.bsv) ; absents = 03 reconstruit par la proc
+            instruments_dir = csv_root / "INSTRUMENTS" / ful_d
+            if not instruments_output:
+                shutil.rmtree(instruments_dir, ignore_errors=True)
             sql_log_line(conn, f"FULL - picked date={ful_d} xmls={len(xmls)}", element="FUL_PLAN", complement=f"dir={ful_dir} out={out_bsv} run_ts={run_ts}")
             if not xmls:
                 sql_log_line(conn, "FULL - No XML found, skip", element="FUL_SKIP", complement=f"dir={ful_dir}")
             else:
-                rows = extract_fulins_xmls_to_bsv(xmls, out_bsv, conn, run_ts)
+                rows = build_bsv("FULINS", xmls, out_bsv, conn, run_ts, xml_parser, parse_workers, parse_concat, parse_split_bytes, parse_resume,
+                                 instruments_dir if instruments_output else None)
                 sql_log_line(conn, f"FULL_RESULT - rows={rows}", element="FUL_RESULT", complement=str(out_bsv))
+                _parquet("FULINS", out_bsv)
+                if fulins_incremental:
+                    build_fulins_diff(bsv_outputs(out_bsv), ful_d, csv_root / FULINS_DIFF_DIRNAME / ful_d,
+                                      data_root / "archive" / HASH_INDEX_NAME, conn, run_ts, fulins_incremental_max_pct)
 
-        # DELTA : max date
+        # DELTA : max date (ou toutes les dates, par ordre croissant, en rattrapage [ESMA] delta_catchup)
         dlt_parent = extracted_root / "DLTINS"
-        dlt_pick = pick_max_yyyymmdd_dir(dlt_parent)
-        if dlt_pick is None:
+        dlt_dirs = list_yyyymmdd_dirs(dlt_parent)
+        if not cfg.getboolean("ESMA", "delta_catchup", fallback=False):
+            dlt_dirs = dlt_dirs[-1:]
+        if not dlt_dirs:
             sql_log_line(conn, "DELTA - No extracted folder found", element="DLT_SKIP", complement=str(dlt_parent))
-        else:
-            dlt_d, dlt_dir = dlt_pick
-            xmls = list_xmls(dlt_dir)
+        for dlt_d, dlt_dir in dlt_dirs:
+            xmls = list_sources(dlt_dir, extract_mode)
             out_bsv = csv_root / "DLTINS" / dlt_d / f"dltins_wide_{dlt_d}.bsv"
             sql_log_line(conn, f"DELTA - picked date={dlt_d} xmls={len(xmls)}", element="DLT_PLAN", complement=f"dir={dlt_dir} out={out_bsv} run_ts={run_ts}")
             if not xmls:
                 sql_log_line(conn, "DELTA - No XML found, skip", element="DLT_SKIP", complement=f"dir={dlt_dir}")
             else:
-                rows = extract_dltins_xmls_to_bsv(xmls, out_bsv, conn, run_ts)
+                rows = build_bsv("DLTINS", xmls, out_bsv, conn, run_ts, xml_parser, parse_workers, parse_concat, resume=parse_resume)
                 sql_log_line(conn, f"DELTA_RESULT - rows={rows}", element="DLT_RESULT", complement=str(out_bsv))
+                _parquet("DLTINS", out_bsv)
 
         sql_log_line(conn, "END", element="END", complement=f"run_ts={run_ts}")
         return 0
@@ -17,7 +17,34 @@ Rules:
     * deleted date (max folder date)
     * rows inserted after bulk
     * inserted date
+- Instruments: whenever FULINS is loaded, stg.ESMA_INSTRUMENT_LISTING / _DEBT / _DERIVATIVE are truncated and
+  bulk-loaded from the typed, deduplicated BSV written by 02-BUILD_CSV under <data_root>\\csv\\INSTRUMENTS\\<YYYYMMDD>
+  (through the stg.v_ESMA_INSTRUMENT_*_LOAD views: LoadDtmUTC keeps its default).
+  Typed files missing ([ESMA] instruments_output = false, the default, or old build): full rebuild by
+  stg.usp_Load_ESMA_INSTRUMENTS_From_FULINS_WIDE instead. The DLTINS of the day are applied afterwards by 04-RUN_PROCS.
+- Load mode ([ESMA] load_mode):
+    * server : BULK INSERT, SQL Server reads the BSV itself (local disk or UNC share)
+    * client : rows pushed over ODBC (pyodbc fast_executemany, load_batch_rows rows per batch and commit)
+    * bcp    : bcp utility with a generated format file (TABLOCK, load_batch_rows per batch)
+               login: -T / -G from bcp_options, -T without [SQLSERVER] user, else -U / -P
+  client / bcp need no file access from the SQL Server service. The wide tables (heaps) are loaded by load_streams
+  concurrent connections (server: one BULK INSERT per part file; client / bcp: part files, then byte ranges of
+  each file); duration and rows/s are logged per file / stream. [ESMA] bulk_batch_size sets BATCHSIZE of BULK INSERT
+  (0 = one transaction per file, with a ROWS_PER_BATCH hint for part files counted in the manifest).
+- Shadow swap ([ESMA] load_swap = true): the wide tables and the instrument tables loaded from typed files are
+  loaded into <table>__next while readers keep the previous data, then swapped in by ALTER TABLE ... SWITCH
+  (metadata only) through the empty <table>__old, waiting at low priority (swap_wait_minutes,
+  ABORT_AFTER_WAIT = SELF, swap_retries attempts). A failed load or swap leaves <table> untouched.
+  The instrument rebuild proc (no typed files) still works in place.
+- Incremental FULL ([ESMA] fulins_incremental, change set written by 02-BUILD_CSV under
+  <data_root>\\csv\\FULINS_DIFF\\<YYYYMMDD>): when stg.ESMA_FULINS_WIDE still holds the FULL the change set was
+  computed against (and no later DLTINS), only the NEW / MOD / TERM rows are loaded into stg.ESMA_FULINS_DIFF and
+  applied by stg.usp_Apply_FULINS_Diff; otherwise full reload. After a successful FULINS load, the FULL hash index
+  is promoted to <data_root>\\archive\\fulins_hash_index.sqlite (base of the next change set).
 - Autonomous script (no mandatory parameters).
+- DLTINS catch-up (set by ETL_ESMA_DAILY_RUN_AUTONOME.py, one run per delta date in ascending order):
+    * ESMA_DLTINS_DATE=YYYYMMDD : load this DLTINS folder instead of the MAX one
+    * ESMA_SKIP_FULINS=1        : leave stg.ESMA_FULINS_WIDE untouched (FULL already loaded by the first run)
 """
 
 # ----------------------------
@@ -61,8 +88,16 @@ except Exception as e:
 # ----------------------------
 # Standard libs
 # ----------------------------
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
 import traceback
 
 import pyodbc
@@ -80,6 +115,63 @@ DELIMITER = "|"
 
 TABLE_FUL = "stg.ESMA_FULINS_WIDE"
 TABLE_DLT = "stg.ESMA_DLTINS_WIDE"
+TABLE_FUL_DIFF = "stg.ESMA_FULINS_DIFF"
+PROC_FULINS_DIFF_APPLY = "stg.usp_Apply_FULINS_Diff"
+
+# 02-BUILD_CSV incremental FULL: change set + hash index per FULINS date, index promoted to data/archive by 03
+FULINS_DIFF_DIRNAME = "FULINS_DIFF"
+HASH_INDEX_NAME = "fulins_hash_index.sqlite"
+
+# same rules as 01-GET_FILES: dates carried by SourceFileName
+SQL_LAST_LOADED_FULL = """
+select MAX(TRY_CONVERT(date, substring(SourceFileName,10,8)))
+FROM stg.ESMA_FULINS_WIDE
+WHERE SourceFileName LIKE 'FULINS_%'
+"""
+SQL_LAST_LOADED_DELTA = """
+select MAX(TRY_CONVERT(date, substring(SourceFileName,8,8)))
+FROM stg.ESMA_FULINS_WIDE
+WHERE SourceFileName LIKE 'DLTINS_%'
+"""
+
+# 02-BUILD_CSV typed output file -> (table, BULK INSERT target view without LoadDtmUTC)
+INSTRUMENT_LOADS = {
+    "ESMA_INSTRUMENT_LISTING.bsv": ("stg.ESMA_INSTRUMENT_LISTING", "stg.v_ESMA_INSTRUMENT_LISTING_LOAD"),
+    "ESMA_INSTRUMENT_DEBT.bsv": ("stg.ESMA_INSTRUMENT_DEBT", "stg.v_ESMA_INSTRUMENT_DEBT_LOAD"),
+    "ESMA_INSTRUMENT_DERIVATIVE.bsv": ("stg.ESMA_INSTRUMENT_DERIVATIVE", "stg.v_ESMA_INSTRUMENT_DERIVATIVE_LOAD"),
+}
+PROC_INSTRUMENTS_REBUILD = "stg.usp_Load_ESMA_INSTRUMENTS_From_FULINS_WIDE"
+
+ENV_DLTINS_DATE = "ESMA_DLTINS_DATE"
+ENV_SKIP_FULINS = "ESMA_SKIP_FULINS"
+
+MANIFEST_SUFFIX = ".manifest.json"
+
+LOAD_MODES = ("server", "client", "bcp")
+LOAD_STREAMS_DEFAULT = 4
+LOAD_BATCH_ROWS_DEFAULT = 50000
+BIND_SIZE_DEFAULT = 64          # non-character columns (date, bit, decimal) are bound as text, converted by SQL Server
+BCP_ROWS_RE = re.compile(r"(\d+) rows copied")
+BCP_AUTH_OPTIONS = ("-T", "-G")  # trusted / Microsoft Entra ID connection given in [ESMA] bcp_options
+
+SWAP_NEXT_SUFFIX = "__next"     # shadow table loaded by 03 (same structure and filegroup as the table)
+SWAP_OLD_SUFFIX = "__old"       # empty SWITCH target receiving the previous data, truncated after the swap
+SWAP_WAIT_MINUTES_DEFAULT = 1
+SWAP_RETRIES_DEFAULT = 3
+
+
+class LoadOptions(NamedTuple):
+    """How BSV files reach SQL Server ([ESMA] load_* keys)."""
+    mode: str = "server"
+    streams: int = 1
+    batch_rows: int = LOAD_BATCH_ROWS_DEFAULT
+    bcp_path: str = "bcp"
+    bcp_options: Tuple[str, ...] = ()
+    bulk_batch_size: int = 0
+    swap: bool = False
+    swap_wait_minutes: int = SWAP_WAIT_MINUTES_DEFAULT
+    swap_retries: int = SWAP_RETRIES_DEFAULT
+    cfg: object = None
 
 
 # ----------------------------
@@ -130,12 +222,71 @@ def sql_count_rows(conn, table: str) -> int:
     return int(n)
 
 
+def sql_scalar(conn, sql: str):
+    cur = conn.cursor()
+    cur.execute(sql)
+    row = cur.fetchone()
+    cur.close()
+    return row[0] if row else None
+
+
+def target_columns(conn, target: str) -> List[Tuple[str, int]]:
+    """
+    (column, bound size) of a table or view in ordinal order: BSV fields map to the columns by position,
+    as with BULK INSERT.
+    """
+    schema, name = target.split(".", 1)
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT COLUMN_NAME, CHARACTER_MAXIMUM_LENGTH
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ?
+        ORDER BY ORDINAL_POSITION
+        """,
+        (schema, name),
+    )
+    columns = [(r[0], int(r[1]) if r[1] and r[1] > 0 else BIND_SIZE_DEFAULT) for r in cur.fetchall()]
+    cur.close()
+    if not columns:
+        raise RuntimeError(f"No columns found for {target}")
+    return columns
+
+
+def exec_proc(conn, proc_fullname: str) -> None:
+    cur = conn.cursor()
+    try:
+        cur.execute(f"EXEC {proc_fullname};")
+        # drain every result set: a late error raised by the proc surfaces here
+        while cur.nextset():
+            pass
+    finally:
+        cur.close()
+
+
 # ----------------------------
 # Files
 # ----------------------------
-def list_bsv_files(csv_root: Path) -> Tuple[List[Path], List[Path], str, str]:
+def bsv_files_in(date_dir: Path) -> List[Path]:
     """
-    Returns FULINS and DLTINS BSV files for the MAX available YYYYMMDD folder.
+    BSV to load from one YYYYMMDD folder.
+    If 02-BUILD_CSV wrote part files (parse_workers > 1), only the parts listed by the
+    *.manifest.json files are returned, in manifest order; otherwise every *.bsv in the folder.
+    """
+    manifests = sorted(date_dir.glob(f"*{MANIFEST_SUFFIX}"))
+    if not manifests:
+        return sorted(date_dir.rglob("*.bsv"))
+    files: List[Path] = []
+    for m in manifests:
+        manifest = json.loads(m.read_text(encoding="utf-8"))
+        files.extend(date_dir / part["file"] for part in manifest["parts"])
+    return files
+
+
+def list_bsv_files(csv_root: Path, dlt_date_wanted: Optional[str] = None) -> Tuple[List[Path], List[Path], str, str]:
+    """
+    Returns FULINS and DLTINS BSV files for the MAX available YYYYMMDD folder
+    (or the dlt_date_wanted DLTINS folder when given, DLTINS catch-up).
     Robust: if folders do not exist, returns empty lists without raising.
     """
     ful_root = csv_root / "FULINS"
@@ -150,17 +301,59 @@ def list_bsv_files(csv_root: Path) -> Tuple[List[Path], List[Path], str, str]:
         ful_dirs = sorted([p for p in ful_root.iterdir() if p.is_dir() and p.name.isdigit()])
         if ful_dirs:
             ful_date = ful_dirs[-1].name
-            ful_files = sorted(ful_dirs[-1].rglob("*.bsv"))
+            ful_files = bsv_files_in(ful_dirs[-1])
 
     if dlt_root.exists():
         dlt_dirs = sorted([p for p in dlt_root.iterdir() if p.is_dir() and p.name.isdigit()])
+        if dlt_date_wanted:
+            dlt_dirs = [p for p in dlt_dirs if p.name == dlt_date_wanted]
         if dlt_dirs:
             dlt_date = dlt_dirs[-1].name
-            dlt_files = sorted(dlt_dirs[-1].rglob("*.bsv"))
+            dlt_files = bsv_files_in(dlt_dirs[-1])
 
     return ful_files, dlt_files, ful_date, dlt_date
 
 
+def bsv_ranges(file_path: Path, n: int) -> List[Tuple[int, int]]:
+    """
+    Splits a BSV into at most n byte ranges aligned on row starts, header line (FIRSTROW = 2) excluded.
+    A file holding only its header gives no range.
+    """
+    size = file_path.stat().st_size
+    with open(file_path, "rb") as fh:
+        fh.readline()
+        bounds = [fh.tell()]
+        for i in range(1, n):
+            pos = bounds[0] + (size - bounds[0]) * i // n
+            if pos <= bounds[-1]:
+                continue
+            # from pos - 1: a row starting exactly at pos stays a boundary
+            fh.seek(pos - 1)
+            fh.readline()
+            cut = fh.tell()
+            if bounds[-1] < cut < size:
+                bounds.append(cut)
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def iter_range_lines(file_path: Path, start: int, end: int) -> Iterator[bytes]:
+    with open(file_path, "rb") as fh:
+        fh.seek(start)
+        pos = start
+        for line in fh:
+            if pos >= end:
+                break
+            pos += len(line)
+            yield line
+
+
+def instrument_files(instruments_dir: Path) -> Optional[List[Path]]:
+    """Typed instrument BSV written by 02-BUILD_CSV for one FULINS date, or None if any of them is missing."""
+    files = [instruments_dir / name for name in INSTRUMENT_LOADS]
+    return files if all(f.exists() for f in files) else None
+
+
 # ----------------------------
 # Load helpers
 # ----------------------------
@@ -170,13 +363,38 @@ def truncate_table(conn, table: str) -> None:
     cur.close()
 
 
-def bulk_insert(conn, table: str, file_path: Path) -> None:
+def manifest_row_counts(files: List[Path]) -> Dict[Path, int]:
+    """
+    Data rows of the part files, as recorded by 02-BUILD_CSV in the *.manifest.json of their YYYYMMDD folder
+    (same paths as bsv_files_in). Files without a manifest entry (single BSV) are left out: count unknown.
+    """
+    counts: Dict[Path, int] = {}
+    for date_dir in {f.parent.parent if f.parent.name == "parts" else f.parent for f in files}:
+        for m in date_dir.glob(f"*{MANIFEST_SUFFIX}"):
+            manifest = json.loads(m.read_text(encoding="utf-8"))
+            for part in manifest["parts"]:
+                if "rows" in part:
+                    counts[date_dir / part["file"]] = int(part["rows"])
+    return counts
+
+
+def bulk_insert(conn, table: str, file_path: Path, batch_size: int = 0, rows_hint: Optional[int] = None) -> int:
     """
+    Returns the rows inserted (driver row count).
+    batch_size > 0: BATCHSIZE, one transaction per batch; else a single transaction, with the ROWS_PER_BATCH
+    hint when the row count of the file is known (rows_hint, from the 02-BUILD_CSV manifest).
+
     Important note:
     BULK INSERT is executed by SQL Server. Therefore, SQL Server must be able to access the file path.
     - If SQL Server is local: local path works.
-    - If SQL Server is remote: you likely need a UNC path (\\server\\share\\file.bsv).
+    - If SQL Server is remote: you likely need a UNC path (\\server\\share\\file.bsv),
+      or [ESMA] load_mode = client / bcp (see load_files).
     """
+    batch_hint = ""
+    if batch_size > 0:
+        batch_hint = f",\n        BATCHSIZE = {batch_size}"
+    elif rows_hint:
+        batch_hint = f",\n        ROWS_PER_BATCH = {rows_hint}"
     sql = f"""
     BULK INSERT {table}
     FROM '{file_path}'
@@ -186,12 +404,371 @@ def bulk_insert(conn, table: str, file_path: Path) -> None:
         ROWTERMINATOR = '0x0a',
         TABLOCK,
         KEEPNULLS,
-        CODEPAGE = '65001'
+        CODEPAGE = '65001'{batch_hint}
     );
     """
     cur = conn.cursor()
     cur.execute(sql)
+    rows = cur.rowcount
     cur.close()
+    return max(0, rows)
+
+
+def client_stream(opts: LoadOptions, target: str, columns: List[Tuple[str, int]],
+                  file_path: Path, start: int, end: int) -> int:
+    """
+    Pushes one byte range of a BSV over its own ODBC connection: fast_executemany with bound parameter
+    sizes, one commit per opts.batch_rows rows. Fields are sent as read, like BULK INSERT
+    (no unescaping, empty field = NULL as with KEEPNULLS).
+    """
+    names = ", ".join(f"[{name}]" for name, _ in columns)
+    sql = f"INSERT INTO {target} ({names}) VALUES ({', '.join('?' * len(columns))})"
+    n_cols = len(columns)
+    rows = 0
+    conn = sql_conn(opts.cfg)
+    try:
+        conn.autocommit = False
+        cur = conn.cursor()
+        cur.fast_executemany = True
+        cur.setinputsizes([(pyodbc.SQL_WVARCHAR, size, 0) for _, size in columns])
+        batch: List[List[Optional[str]]] = []
+        for line in iter_range_lines(file_path, start, end):
+            text = line.decode("utf-8")
+            if text.endswith("\n"):
+                text = text[:-1]
+            if not text:
+                continue
+            values = [v if v else None for v in text.split(DELIMITER)]
+            if len(values) != n_cols:
+                raise ValueError(f"{file_path.name}: {len(values)} fields for {n_cols} columns of {target} "
+                                 f"(row {rows + len(batch) + 1} of range {start}-{end})")
+            batch.append(values)
+            if len(batch) >= opts.batch_rows:
+                cur.executemany(sql, batch)
+                conn.commit()
+                rows += len(batch)
+                batch = []
+        if batch:
+            cur.executemany(sql, batch)
+            conn.commit()
+            rows += len(batch)
+        cur.close()
+    finally:
+        conn.close()
+    return rows
+
+
+def bcp_format_file(columns: List[Tuple[str, int]], fmt_path: Path) -> None:
+    """Non-XML bcp format file: every field is character data ended by '|', the last one by LF."""
+    lines = ["14.0", str(len(columns))]
+    for i, (name, _) in enumerate(columns, 1):
+        term = "\\n" if i == len(columns) else DELIMITER
+        lines.append(f'{i}\tSQLCHAR\t0\t0\t"{term}"\t{i}\t{name}\t""')
+    fmt_path.write_text("\r\n".join(lines) + "\r\n", encoding="ascii")
+
+
+def bcp_auth_args(opts: LoadOptions) -> List[str]:
+    """
+    bcp login: none when bcp_options carries -T / -G, a trusted connection (-T) when [SQLSERVER] has no user,
+    else the SQL login. -P puts the password on the bcp command line (visible in the process list): prefer -T / -G.
+    """
+    if any(o in BCP_AUTH_OPTIONS for o in opts.bcp_options):
+        return []
+    sqlcfg = opts.cfg["SQLSERVER"]
+    user = sqlcfg.get("user", "").strip()
+    if not user:
+        return ["-T"]
+    return ["-U", user, "-P", sqlcfg.get("password", "")]
+
+
+def bcp_redacted(cmd: List[str]) -> str:
+    """bcp command line for logs, password masked."""
+    return " ".join("****" if i and cmd[i - 1] == "-P" else a for i, a in enumerate(cmd))
+
+
+def bcp_stream(opts: LoadOptions, target: str, fmt_path: Path, file_path: Path, start: int, end: int,
+               whole: bool, work_dir: Path) -> int:
+    """
+    One bcp in run for one byte range (the whole file with -F 2, else a copy of the range without header).
+    -h TABLOCK takes a bulk update lock: concurrent streams into the same heap do not block each other.
+    """
+    src = file_path
+    first_row = 2
+    if not whole:
+        src = work_dir / f"{file_path.name}.{start}.bcp"
+        with open(file_path, "rb") as fin, open(src, "wb") as fout:
+            fin.seek(start)
+            left = end - start
+            while left > 0:
+                block = fin.read(min(left, 1 << 20))
+                if not block:
+                    break
+                fout.write(block)
+                left -= len(block)
+        first_row = 1
+
+    sqlcfg = opts.cfg["SQLSERVER"]
+    cmd = [
+        opts.bcp_path, target, "in", str(src),
+        "-S", sqlcfg["server"], "-d", sqlcfg["database_stg"], *bcp_auth_args(opts),
+        "-f", str(fmt_path), "-F", str(first_row), "-b", str(opts.batch_rows),
+        "-k", "-m", "1", "-C", "65001", "-h", "TABLOCK",
+        *opts.bcp_options,
+    ]
+    try:
+        res = subprocess.run(cmd, capture_output=True, text=True, errors="replace")
+    finally:
+        if src != file_path:
+            src.unlink(missing_ok=True)
+    out = f"{res.stdout}\n{res.stderr}".strip()
+    m = BCP_ROWS_RE.search(out)
+    if res.returncode != 0 or m is None or "Error = " in out:
+        raise RuntimeError(f"bcp failed for {file_path.name} -> {target} (rc={res.returncode}): {out[-2000:]} "
+                           f"[{bcp_redacted(cmd)}]")
+    return int(m.group(1))
+
+
+def load_files(conn, target: str, files: List[Path], opts: Optional[LoadOptions] = None,
+               streams: Optional[int] = None) -> None:
+    """
+    Loads BSV files into target (table or load view), already truncated by the caller.
+    - server: one BULK INSERT per file; with several files, up to `streams` of them run concurrently on separate
+      connections (TABLOCK bulk loads into a heap take compatible BU locks);
+    - client / bcp: files, then byte ranges of each file, spread over `streams` concurrent connections.
+    `streams` defaults to opts.streams. One log line per file / range with duration and rows/s, then a total.
+    """
+    opts = opts or LoadOptions()
+    n = max(1, streams or opts.streams)
+    jobs: List[Tuple[Path, int, int, bool]] = []
+    if opts.mode == "server":
+        jobs = [(f, 0, f.stat().st_size, True) for f in files]
+    else:
+        per_file = max(1, -(-n // max(1, len(files))))
+        for f in files:
+            ranges = bsv_ranges(f, per_file)
+            jobs.extend((f, start, end, len(ranges) == 1) for start, end in ranges)
+    if not jobs:
+        return
+    workers = min(n, len(jobs))
+
+    columns = target_columns(conn, target) if opts.mode != "server" else []
+    rows_hints = manifest_row_counts(files) if opts.mode == "server" and opts.bulk_batch_size <= 0 else {}
+    work_dir = Path(tempfile.mkdtemp(prefix="esma_load_"))
+    fmt_path = work_dir / "target.fmt"
+    if opts.mode == "bcp":
+        bcp_format_file(columns, fmt_path)
+
+    def run(job: Tuple[Path, int, int, bool]) -> Tuple[int, float]:
+        f, start, end, whole = job
+        t0 = time.perf_counter()
+        if opts.mode == "bcp":
+            rows = bcp_stream(opts, target, fmt_path, f, start, end, whole, work_dir)
+        elif opts.mode == "client":
+            rows = client_stream(opts, target, columns, f, start, end)
+        elif workers == 1:
+            rows = bulk_insert(conn, target, f, opts.bulk_batch_size, rows_hints.get(f))
+        else:
+            # one connection per concurrent BULK INSERT (a pyodbc connection is not shared between threads)
+            job_conn = sql_conn(opts.cfg)
+            try:
+                rows = bulk_insert(job_conn, target, f, opts.bulk_batch_size, rows_hints.get(f))
+            finally:
+                job_conn.close()
+        return rows, time.perf_counter() - t0
+
+    def log_job(i: int, rows: int, seconds: float) -> None:
+        f, start, end, _ = jobs[i - 1]
+        element = "LOAD_FILE" if opts.mode == "server" else "LOAD_STREAM"
+        sql_log_line(
+            conn,
+            f"{element} mode={opts.mode} rows={rows} seconds={seconds:.1f} rows_per_s={rows / max(seconds, 1e-9):.0f}",
+            element=element,
+            complement=f"{target} stream={i}/{len(jobs)} bytes={start}-{end}",
+            file_name=f.name
+        )
+
+    t_all = time.perf_counter()
+    total = 0
+    try:
+        if workers == 1:
+            for i, job in enumerate(jobs, 1):
+                rows, seconds = run(job)
+                total += rows
+                log_job(i, rows, seconds)
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="esma_load")
+            try:
+                futures = {pool.submit(run, job): i for i, job in enumerate(jobs, 1)}
+                for fut in as_completed(futures):
+                    rows, seconds = fut.result()
+                    total += rows
+                    log_job(futures[fut], rows, seconds)
+            except BaseException:
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+            pool.shutdown(wait=True)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    seconds = time.perf_counter() - t_all
+    sql_log_line(
+        conn,
+        f"LOAD_TOTAL mode={opts.mode} streams={workers} rows={total} seconds={seconds:.1f} "
+        f"rows_per_s={total / max(seconds, 1e-9):.0f}",
+        element="LOAD_TOTAL",
+        complement=f"{target} files={len(files)} ranges={len(jobs)}"
+    )
+
+
+def load_options(cfg) -> LoadOptions:
+    mode = cfg.get("ESMA", "load_mode", fallback="server").strip().lower()
+    if mode not in LOAD_MODES:
+        raise ValueError(f"Invalid [ESMA].load_mode={mode!r} (expected one of {LOAD_MODES})")
+    return LoadOptions(
+        mode=mode,
+        streams=max(1, cfg.getint("ESMA", "load_streams", fallback=LOAD_STREAMS_DEFAULT)),
+        batch_rows=max(1, cfg.getint("ESMA", "load_batch_rows", fallback=LOAD_BATCH_ROWS_DEFAULT)),
+        bcp_path=cfg.get("ESMA", "bcp_path", fallback="bcp").strip() or "bcp",
+        bcp_options=tuple(cfg.get("ESMA", "bcp_options", fallback="").split()),
+        bulk_batch_size=max(0, cfg.getint("ESMA", "bulk_batch_size", fallback=0)),
+        swap=cfg.getboolean("ESMA", "load_swap", fallback=False),
+        swap_wait_minutes=max(0, cfg.getint("ESMA", "swap_wait_minutes", fallback=SWAP_WAIT_MINUTES_DEFAULT)),
+        swap_retries=max(1, cfg.getint("ESMA", "swap_retries", fallback=SWAP_RETRIES_DEFAULT)),
+        cfg=cfg,
+    )
+
+
+def load_target(conn, table: str, opts: LoadOptions) -> str:
+    """
+    Empties the table the files are loaded into and returns it: the table itself (TRUNCATE, readers see it
+    empty until the load ends) or, with opts.swap, its <table>__next shadow (the table keeps serving readers).
+    """
+    target = f"{table}{SWAP_NEXT_SUFFIX}" if opts.swap else table
+    truncate_table(conn, target)
+    return target
+
+
+def swap_in(conn, table: str, opts: LoadOptions) -> None:
+    """
+    Publishes <table>__next as <table>: the current rows are switched out to the empty <table>__old, then the
+    shadow rows are switched in, in one transaction (metadata-only operations).
+    The first SWITCH waits at low priority behind running readers without blocking new ones; after
+    swap_wait_minutes it gives up (ABORT_AFTER_WAIT = SELF) and is retried up to swap_retries times.
+    On failure the transaction is rolled back: <table> keeps its previous rows.
+    """
+    shadow = f"{table}{SWAP_NEXT_SUFFIX}"
+    old = f"{table}{SWAP_OLD_SUFFIX}"
+    sql = f"""
+    SET XACT_ABORT ON;
+    BEGIN TRANSACTION;
+    ALTER TABLE {table} SWITCH TO {old}
+        WITH (WAIT_AT_LOW_PRIORITY (MAX_DURATION = {opts.swap_wait_minutes} MINUTES, ABORT_AFTER_WAIT = SELF));
+    ALTER TABLE {shadow} SWITCH TO {table};
+    COMMIT TRANSACTION;
+    """
+    truncate_table(conn, old)
+    for attempt in range(1, opts.swap_retries + 1):
+        cur = conn.cursor()
+        try:
+            cur.execute(sql)
+            # drain the batch: an error on the second SWITCH surfaces here
+            while cur.nextset():
+                pass
+            break
+        except pyodbc.Error as e:
+            cur.execute("IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;")
+            if attempt == opts.swap_retries:
+                raise
+            sql_log_line(conn, f"SWAP_RETRY attempt={attempt}/{opts.swap_retries} table={table}: {e}",
+                         element="SWAP_RETRY", complement=shadow)
+        finally:
+            cur.close()
+    truncate_table(conn, old)
+
+
+def fulins_diff_file(conn, diff_dir: Path, ful_date: str) -> Optional[Path]:
+    """
+    Change set of 02-BUILD_CSV for this FULL, if it can replace the full reload: stg.ESMA_FULINS_WIDE must hold
+    the FULL it was computed against, and no DLTINS dated after this FULL (a delta already applied would be
+    overwritten by the older FULL row). None otherwise (logged).
+    """
+    diff_bsv = diff_dir / f"FULINS_DIFF_{ful_date}.bsv"
+    meta_path = diff_bsv.with_suffix(".json")
+    if not diff_bsv.exists() or not meta_path.exists():
+        return None
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    last_full = sql_scalar(conn, SQL_LAST_LOADED_FULL)
+    last_delta = sql_scalar(conn, SQL_LAST_LOADED_DELTA)
+    last_full_s = last_full.strftime("%Y%m%d") if last_full else None
+    last_delta_s = last_delta.strftime("%Y%m%d") if last_delta else None
+    reason = None
+    if last_full_s != meta.get("base_full_date"):
+        reason = f"STG FULL={last_full_s} differs from diff base={meta.get('base_full_date')}"
+    elif last_delta_s is not None and last_delta_s > ful_date:
+        reason = f"STG DLTINS={last_delta_s} newer than FULL={ful_date}"
+    if reason is not None:
+        sql_log_line(conn, f"FULINS_DIFF not applicable, full reload: {reason}", element="FUL_DIFF_SKIP",
+                     complement=str(diff_bsv))
+        return None
+    return diff_bsv
+
+
+def apply_fulins_diff(conn, diff_bsv: Path, ful_date: str, opts: Optional[LoadOptions] = None) -> None:
+    """Loads the NEW / MOD / TERM change set into stg.ESMA_FULINS_DIFF and applies it to stg.ESMA_FULINS_WIDE in place."""
+    truncate_table(conn, TABLE_FUL_DIFF)
+    load_files(conn, TABLE_FUL_DIFF, [diff_bsv], opts, streams=1)
+    rows = sql_count_rows(conn, TABLE_FUL_DIFF)
+    exec_proc(conn, PROC_FULINS_DIFF_APPLY)
+    sql_log_line(conn, f"FULINS_DIFF rows_applied={rows} date={ful_date}", element="FUL_DIFF",
+                 complement=f"{TABLE_FUL_DIFF} -> {TABLE_FUL}", file_name=diff_bsv.name)
+
+
+def promote_hash_index(conn, diff_dir: Path, archive_dir: Path) -> None:
+    """The FULL just loaded becomes the base of the next change set computed by 02-BUILD_CSV."""
+    pending = diff_dir / HASH_INDEX_NAME
+    if not pending.exists():
+        return
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    shutil.move(str(pending), str(archive_dir / HASH_INDEX_NAME))
+    sql_log_line(conn, "FULINS hash index promoted", element="FUL_HASH_INDEX", complement=str(archive_dir / HASH_INDEX_NAME))
+
+
+def load_instruments(conn, instruments_dir: Path, ful_date: str, opts: Optional[LoadOptions] = None) -> None:
+    """
+    Reloads the three instrument tables from the FULINS just loaded into stg.ESMA_FULINS_WIDE:
+    straight TRUNCATE + load of the typed files, or the full rebuild proc when they are missing.
+    With opts.swap, the three <table>__next shadows are all loaded (through their <view>__next) before any
+    of them is swapped in: a failed load leaves the previous instruments intact. The rebuild proc always
+    works in place.
+    Single stream: the instrument tables have a clustered primary key and are small.
+    """
+    files = instrument_files(instruments_dir)
+    if files is None:
+        sql_log_line(conn, f"INSTRUMENTS - no typed files, full rebuild date={ful_date}", element="INS_REBUILD",
+                     complement=f"{PROC_INSTRUMENTS_REBUILD} dir={instruments_dir}")
+        exec_proc(conn, PROC_INSTRUMENTS_REBUILD)
+        return
+
+    opts = opts or LoadOptions()
+    rows_before = {}
+    for f in files:
+        table, view = INSTRUMENT_LOADS[f.name]
+        rows_before[table] = sql_count_rows(conn, table)
+        load_target(conn, table, opts)
+        load_files(conn, f"{view}{SWAP_NEXT_SUFFIX}" if opts.swap else view, [f], opts, streams=1)
+
+    for f in files:
+        table, _ = INSTRUMENT_LOADS[f.name]
+        if opts.swap:
+            swap_in(conn, table, opts)
+        rows_after = sql_count_rows(conn, table)
+        sql_log_line(
+            conn,
+            f"INSTRUMENTS_INSERT rows_deleted={rows_before[table]} rows_inserted={rows_after} date_inserted={ful_date}",
+            element="INS_INSERT",
+            complement=table,
+            file_name=f.name
+        )
 
 
 # ----------------------------
@@ -206,6 +783,10 @@ def main() -> int:
 
     try:
         sql_log_line(conn, "BEGIN", element="RUN", complement=f"run_ts={run_ts}")
+        opts = load_options(cfg)
+        sql_log_line(conn, f"LOAD mode={opts.mode} streams={opts.streams} batch_rows={opts.batch_rows} "
+                           f"bulk_batch_size={opts.bulk_batch_size} swap={opts.swap}",
+                     element="LOAD_MODE", complement=f"run_ts={run_ts}")
 
         data_root = REPO_ROOT / "data"
         csv_root = data_root / "csv"
@@ -218,22 +799,36 @@ def main() -> int:
         if not (csv_root / "DLTINS").exists():
             sql_log_line(conn, f"WARNING - DLTINS csv folder not found: {csv_root / 'DLTINS'}", element="WARN_NO_DLTINS_CSV")
 
-        ful_files, dlt_files, ful_date, dlt_date = list_bsv_files(csv_root)
+        dlt_date_wanted = os.environ.get(ENV_DLTINS_DATE, "").strip() or None
+        skip_fulins = os.environ.get(ENV_SKIP_FULINS, "").strip() == "1"
+        if dlt_date_wanted or skip_fulins:
+            sql_log_line(conn, f"CATCHUP - dltins_date={dlt_date_wanted} skip_fulins={skip_fulins}", element="CATCHUP", complement=f"run_ts={run_ts}")
 
-        # ---- FULINS ----
-        if ful_files:
-            rows_before = sql_count_rows(conn, TABLE_FUL)
-            truncate_table(conn, TABLE_FUL)
+        ful_files, dlt_files, ful_date, dlt_date = list_bsv_files(csv_root, dlt_date_wanted)
 
-            sql_log_line(
-                conn,
-                f"FULINS_DELETE rows_deleted={rows_before} date_deleted={ful_date}",
-                element="FUL_DELETE",
-                complement=TABLE_FUL
-            )
-
-            for f in ful_files:
-                bulk_insert(conn, TABLE_FUL, f)
+        # ---- FULINS ----
+        if skip_fulins:
+            sql_log_line(conn, "Skip FULINS - catch-up run after the first delta date", element="FUL_SKIP")
+        elif ful_files:
+            diff_dir = csv_root / FULINS_DIFF_DIRNAME / ful_date
+            diff_bsv = fulins_diff_file(conn, diff_dir, ful_date)
+            if diff_bsv is not None:
+                # incremental FULL: the table keeps its rows, only the change set is applied
+                apply_fulins_diff(conn, diff_bsv, ful_date, opts)
+            else:
+                rows_before = sql_count_rows(conn, TABLE_FUL)
+                target = load_target(conn, TABLE_FUL, opts)
+
+                sql_log_line(
+                    conn,
+                    f"FULINS_DELETE rows_deleted={rows_before} date_deleted={ful_date}",
+                    element="FUL_DELETE",
+                    complement=TABLE_FUL
+                )
+
+                load_files(conn, target, ful_files, opts)
+                if target != TABLE_FUL:
+                    swap_in(conn, TABLE_FUL, opts)
 
             rows_after = sql_count_rows(conn, TABLE_FUL)
             sql_log_line(
@@ -242,13 +837,16 @@ def main() -> int:
                 element="FUL_INSERT",
                 complement=TABLE_FUL
             )
+
+            load_instruments(conn, csv_root / "INSTRUMENTS" / ful_date, ful_date, opts)
+            promote_hash_index(conn, diff_dir, data_root / "archive")
         else:
             sql_log_line(conn, "Skip FULINS - no files", element="FUL_SKIP")
 
         # ---- DLTINS ----
         if dlt_files:
             rows_before = sql_count_rows(conn, TABLE_DLT)
-            truncate_table(conn, TABLE_DLT)
+            target = load_target(conn, TABLE_DLT, opts)
 
             sql_log_line(
                 conn,
@@ -257,8 +855,9 @@ def main() -> int:
                 complement=TABLE_DLT
             )
 
-            for f in dlt_files:
-                bulk_insert(conn, TABLE_DLT, f)
+            load_files(conn, target, dlt_files, opts)
+            if target != TABLE_DLT:
+                swap_in(conn, TABLE_DLT, opts)
 
             rows_after = sql_count_rows(conn, TABLE_DLT)
             sql_log_line(
@@ -0,0 +1,298 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ETL_ESMA_BACKFILL_AUTONOME.py
+=============================
+
+Backfill historique FIRDS (reconstruction de l'historique instruments sur une plage de dates).
+
+Usage :
+    python ETL_ESMA_BACKFILL_AUTONOME.py --from 2025-01-01 --to 2025-03-31
+    python ETL_ESMA_BACKFILL_AUTONOME.py --from 2025-01-01 --to 2025-03-31 --restart
+
+Chaîne :
+1) Catalogue local (data/archive/firds_catalogue.sqlite) complété par SOLR sur la plage
+   [from - ANCHOR_LOOKBACK_DAYS, to].
+2) Pool FULINS d'ancrage = dernier pool FULINS publié <= from.
+3) Téléchargement en parallèle (pool de 01-GET_FILES, cache data/archive/firds_cache si [ESMA] download_cache) du FULL d'ancrage
+   et de TOUS les DLTINS de ]ancrage, to].
+4) Parsing par les extracteurs de 02-BUILD_CSV, une date à la fois, en avance d'une étape sur le rejeu SQL.
+5) Rejeu ordonné (date de publication croissante) dans STG :
+   - FULL   : TRUNCATE + BULK INSERT stg.ESMA_FULINS_WIDE et des instruments typés (csv/INSTRUMENTS), puis proc STG ;
+   - DLTINS : TRUNCATE + BULK INSERT stg.ESMA_DLTINS_WIDE, puis proc STG (DLTINS -> FULINS -> instruments).
+   La proc MART n'est pas rejouée (04-RUN_PROCS au prochain run quotidien).
+
+Reprise :
+- Checkpoint JSON data/archive/backfill/<from>_<to>/checkpoint.json réécrit après chaque étape rejouée ;
+  un relancement avec la même plage reprend à l'étape suivante (--restart pour repartir de zéro).
+- Le répertoire de travail est sous data/archive : il survit à la purge du run quotidien.
+- Le rejeu suppose que STG n'a pas bougé depuis le checkpoint : ne pas intercaler de run quotidien
+  entre une interruption et la reprise (sinon --restart).
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+BASE_DIR = Path(__file__).resolve().parent
+
+SCRIPT_NAME = "ETL_ESMA_BACKFILL_AUTONOME.py"
+ANCHOR_LOOKBACK_DAYS = 14
+PROC_STG = "stg.usp_Run_Daily_stg_Load"
+
+
+def _load_stage(file_name: str, module_name: str):
+    """Charge un script d'étape (nom de fichier non importable) comme module."""
+    spec = importlib.util.spec_from_file_location(module_name, BASE_DIR / file_name)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+get_files = _load_stage("01-ETL_ESMA_DAILY_RUN_GET_FILES_AUTONOME.py", "esma_get_files")
+build_csv = _load_stage("02-ETL_ESMA_DAILY_BUILD_CSV_AUTONOME.py", "esma_build_csv")
+load_stg = _load_stage("03-ETL_ESMA_DAILY_LOAD_STG_DLTINS_FULINS_AUTONOME.py", "esma_load_stg")
+
+from common.config_loader import load_config, resolve_project_root  # noqa: E402  (sys.path amorcé par les étapes)
+
+
+def sql_log_line(conn, message, element="", complement="", file_name=""):
+    sql = """
+    INSERT INTO log.ESMA_Load_Log
+        (ScriptName, LaunchTimestamp, StartTime, Message, FileName, Element, Complement)
+    VALUES (?, SYSDATETIME(), SYSDATETIME(), ?, ?, ?, ?)
+    """
+    cur = conn.cursor()
+    cur.execute(sql, (SCRIPT_NAME, str(message)[:4000], file_name[:260], element[:200], str(complement)[:4000]))
+    cur.close()
+
+
+def exec_proc(conn, proc_fullname: str) -> None:
+    cur = conn.cursor()
+    try:
+        cur.execute(f"EXEC {proc_fullname};")
+        # consomme tous les jeux de résultats : une erreur tardive de la proc remonte ici
+        while cur.nextset():
+            pass
+    finally:
+        cur.close()
+
+
+# ----------------------------
+# Checkpoint
+# ----------------------------
+def checkpoint_load(path: Path) -> Dict:
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def checkpoint_save(path: Path, state: Dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+# ----------------------------
+# Plan
+# ----------------------------
+def plan_backfill(cat, d_from: date, d_to: date) -> Tuple[date, List[date]]:
+    """(pool FULINS d'ancrage <= d_from, dates DLTINS de ]ancrage, d_to] par ordre croissant)."""
+    row = cat.execute(
+        "SELECT MAX(file_date) FROM firds_files WHERE file_type = 'FULINS' AND file_date <= ?",
+        (d_from.isoformat(),),
+    ).fetchone()
+    if not row or not row[0]:
+        raise RuntimeError(f"No FULINS pool found on or before {d_from} (catalogue too short?)")
+    anchor = datetime.strptime(row[0], "%Y-%m-%d").date()
+    deltas = get_files.catalogue_dates(cat, "DLTINS", anchor + timedelta(days=1), d_to)
+    return anchor, deltas
+
+
+def step_key(kind: str, d: date) -> str:
+    return f"{kind}:{get_files.yyyymmdd(d)}"
+
+
+def instruments_dir(work_dir: Path, d: date) -> Path:
+    """BSV typés LISTING / DEBT / DERIVATIVE du FULL d'ancrage (écrits par 02-BUILD_CSV, chargés par 03-LOAD_STG)."""
+    return work_dir / "csv" / "INSTRUMENTS" / get_files.yyyymmdd(d)
+
+
+# ----------------------------
+# Build (parsing) d'une étape
+# ----------------------------
+def build_step(kind: str, d: date, work_dir: Path, extract_mode: str, conn, run_ts: str) -> Tuple[Path, int]:
+    ds = get_files.yyyymmdd(d)
+    src_root = work_dir / ("downloaded" if extract_mode == "stream" else "extracted")
+    if kind == "FULINS":
+        out_bsv = work_dir / "csv" / "FULINS" / ds / f"FULINS_WIDE_{ds}.bsv"
+        sources = build_csv.list_sources(src_root / "FULINS" / ds, extract_mode)
+        rows = build_csv.build_bsv("FULINS", sources, out_bsv, conn, run_ts, "auto", 1, True,
+                                   instruments_dir=instruments_dir(work_dir, d))
+    else:
+        out_bsv = work_dir / "csv" / "DLTINS" / ds / f"dltins_wide_{ds}.bsv"
+        sources = build_csv.list_sources(src_root / "DLTINS" / ds, extract_mode)
+        rows = build_csv.extract_dltins_xmls_to_bsv(sources, out_bsv, conn, run_ts)
+    return out_bsv, rows
+
+
+# ----------------------------
+# Rejeu SQL d'une étape
+# ----------------------------
+def replay_step(kind: str, bsv: Path, conn, inst_dir: Optional[Path] = None, load_opts=None) -> int:
+    if kind == "FULINS":
+        load_stg.truncate_table(conn, load_stg.TABLE_FUL)
+        load_stg.load_files(conn, load_stg.TABLE_FUL, [bsv], load_opts)
+        load_stg.load_instruments(conn, inst_dir, bsv.parent.name, load_opts)
+        # proc STG avec un DLTINS vide : aucune clé instrument à rafraîchir
+        load_stg.truncate_table(conn, load_stg.TABLE_DLT)
+        rows = load_stg.sql_count_rows(conn, load_stg.TABLE_FUL)
+    else:
+        load_stg.truncate_table(conn, load_stg.TABLE_DLT)
+        load_stg.load_files(conn, load_stg.TABLE_DLT, [bsv], load_opts)
+        rows = load_stg.sql_count_rows(conn, load_stg.TABLE_DLT)
+    exec_proc(conn, PROC_STG)
+    return rows
+
+
+# ----------------------------
+# Main
+# ----------------------------
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Backfill historique FIRDS (FULINS d'ancrage + rejeu ordonné des DLTINS).")
+    p.add_argument("--from", dest="d_from", required=True, type=date.fromisoformat, help="Première date (YYYY-MM-DD)")
+    p.add_argument("--to", dest="d_to", required=True, type=date.fromisoformat, help="Dernière date incluse (YYYY-MM-DD)")
+    p.add_argument("--restart", action="store_true", help="Ignore le checkpoint existant et repart de l'ancrage")
+    p.add_argument("--keep-files", action="store_true", help="Conserve le répertoire de travail après succès")
+    args = p.parse_args(argv)
+    if args.d_to < args.d_from:
+        p.error("--to must be on or after --from")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    cfg = load_config()
+    conn = load_stg.sql_conn(cfg)
+
+    data_dir = resolve_project_root() / "data"
+    work_dir = data_dir / "archive" / "backfill" / f"{get_files.yyyymmdd(args.d_from)}_{get_files.yyyymmdd(args.d_to)}"
+    ckpt_path = work_dir / "checkpoint.json"
+
+    download_workers = cfg.getint("ESMA", "download_workers", fallback=get_files.DOWNLOAD_WORKERS_DEFAULT)
+    download_retries = cfg.getint("ESMA", "download_retries", fallback=get_files.DOWNLOAD_RETRIES_DEFAULT)
+    solr_page_workers = cfg.getint("ESMA", "solr_page_workers", fallback=get_files.SOLR_PAGE_WORKERS_DEFAULT)
+    solr_use_cursor = cfg.getboolean("ESMA", "solr_use_cursor", fallback=False)
+    extract_mode = cfg.get("ESMA", "extract_mode", fallback="unzip").strip().lower()
+    if extract_mode not in get_files.EXTRACT_MODES:
+        raise ValueError(f"Invalid [ESMA].extract_mode={extract_mode!r} (expected one of {get_files.EXTRACT_MODES})")
+    load_opts = load_stg.load_options(cfg)
+    cache_dir: Optional[Path] = data_dir / "archive" / "firds_cache"
+    if not cfg.getboolean("ESMA", "download_cache", fallback=False):
+        cache_dir = None
+
+    cat = get_files.catalogue_open(data_dir / "archive" / "firds_catalogue.sqlite")
+    try:
+        sql_log_line(conn, "BEGIN", element="BACKFILL", complement=f"from={args.d_from} to={args.d_to} restart={args.restart} run_ts={run_ts}")
+
+        state = {} if args.restart else checkpoint_load(ckpt_path)
+        if args.restart and work_dir.exists():
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        # 1) catalogue sur la plage (+ marge pour trouver le pool FULINS d'ancrage)
+        solr_from = args.d_from - timedelta(days=ANCHOR_LOOKBACK_DAYS)
+        docs = get_files.solr_iter_by_date_range(solr_from.isoformat(), args.d_to.isoformat(), rows=1000, max_rows=500000,
+                                                 workers=solr_page_workers, use_cursor=solr_use_cursor)
+        n = get_files.catalogue_upsert_docs(cat, docs)
+        sql_log_line(conn, f"CATALOGUE upserted={n}", element="BACKFILL_CATALOGUE", complement=f"{solr_from}..{args.d_to} run_ts={run_ts}")
+
+        # 2) plan
+        anchor, delta_dates = plan_backfill(cat, args.d_from, args.d_to)
+        if state and state.get("anchor") != anchor.isoformat():
+            raise RuntimeError(f"Checkpoint anchor={state.get('anchor')} differs from planned anchor={anchor} (use --restart)")
+        steps = [("FULINS", anchor)] + [("DLTINS", d) for d in delta_dates]
+        done = set(state.get("done", []))
+        todo = [(k, d) for k, d in steps if step_key(k, d) not in done]
+        state.update({"from": args.d_from.isoformat(), "to": args.d_to.isoformat(), "anchor": anchor.isoformat(),
+                      "steps": [step_key(k, d) for k, d in steps], "done": sorted(done), "completed": False})
+        checkpoint_save(ckpt_path, state)
+        sql_log_line(conn, f"PLAN anchor={anchor} deltas={len(delta_dates)} todo={len(todo)}", element="BACKFILL_PLAN", complement=f"checkpoint={ckpt_path} run_ts={run_ts}")
+
+        if not todo:
+            sql_log_line(conn, "Nothing to replay (checkpoint complete)", element="BACKFILL_SKIP", complement=f"run_ts={run_ts}")
+        else:
+            # 3) téléchargements parallèles (toutes les étapes restantes dans un seul pool)
+            batches = []
+            for kind, d in todo:
+                ds = get_files.yyyymmdd(d)
+                batches.append((get_files.catalogue_docs_for_date(cat, kind, d),
+                                work_dir / "downloaded" / kind / ds, work_dir / "extracted" / kind / ds, f"{kind}_{ds}.zip"))
+            zc, xc = get_files.download_and_extract_batches(batches, download_workers, download_retries, extract_mode, cache_dir)
+            sql_log_line(conn, f"DOWNLOAD zips={zc} xmls={xc}", element="BACKFILL_DOWNLOAD", complement=f"steps={len(todo)} run_ts={run_ts}")
+
+            # 4+5) parsing de l'étape suivante pendant le rejeu SQL de l'étape courante
+            # (connexion dédiée au thread de parsing : une connexion pyodbc ne se partage pas entre threads ;
+            # l'étape suivante n'est soumise qu'une fois la courante récupérée : au plus un parsing d'avance)
+            conn_build = load_stg.sql_conn(cfg)
+            parser = ThreadPoolExecutor(max_workers=1, thread_name_prefix="esma_backfill_build")
+            try:
+                fut = parser.submit(build_step, todo[0][0], todo[0][1], work_dir, extract_mode, conn_build, run_ts)
+                for i, (kind, d) in enumerate(todo):
+                    bsv, parsed = fut.result()
+                    if i + 1 < len(todo):
+                        next_kind, next_d = todo[i + 1]
+                        fut = parser.submit(build_step, next_kind, next_d, work_dir, extract_mode, conn_build, run_ts)
+                    inst_dir = instruments_dir(work_dir, d)
+                    rows = replay_step(kind, bsv, conn, inst_dir, load_opts)
+                    done.add(step_key(kind, d))
+                    state["done"] = sorted(done)
+                    checkpoint_save(ckpt_path, state)
+                    sql_log_line(conn, f"REPLAY {kind} date={d} parsed={parsed} loaded={rows}", element="BACKFILL_REPLAY", complement=f"{len(done)}/{len(steps)} bsv={bsv} run_ts={run_ts}")
+                    bsv.unlink(missing_ok=True)
+                    shutil.rmtree(inst_dir, ignore_errors=True)
+            finally:
+                # attend le parsing en cours (connexion conn_build) ; aucune étape n'est en file d'attente
+                parser.shutdown(wait=True, cancel_futures=True)
+                conn_build.close()
+
+        state["completed"] = True
+        checkpoint_save(ckpt_path, state)
+        if not args.keep_files:
+            for sub in ("downloaded", "extracted", "csv"):
+                shutil.rmtree(work_dir / sub, ignore_errors=True)
+
+        sql_log_line(conn, "END", element="BACKFILL", complement=f"anchor={anchor} steps={len(steps)} run_ts={run_ts}")
+        return 0
+
+    except Exception:
+        try:
+            load_stg.sql_log_long(conn, traceback.format_exc(), element="TRACEBACK", complement=f"run_ts={run_ts}")
+        except Exception:
+            pass
+        raise
+    finally:
+        try:
+            cat.close()
+        except Exception:
+            pass
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -18,6 +18,11 @@ Règles :
 - Stop immédiat si un script échoue
 - Chaque script gère son propre logging SQL
 
+Rattrapage DLTINS ([ESMA] delta_catchup, voir 01/02) :
+- si 02 a produit plusieurs dossiers data/csv/DLTINS/<YYYYMMDD>, 03 + 04 sont
+  rejoués une fois par date, par ordre croissant (ESMA_DLTINS_DATE) ;
+  le FULINS n'est chargé qu'au premier passage (ESMA_SKIP_FULINS=1 ensuite).
+
 Correctif (2026-01-27):
 - Assure que les imports partagés (package `common`, etc.) fonctionnent même
   en exécution standalone via `subprocess` en injectant `src/python` dans PYTHONPATH.
@@ -38,6 +43,9 @@ SCRIPTS = [
     "04-ETL_ESMA_DAILY_RUN_PROCS_AUTONOME.py",
 ]
 
+# Scripts rejoués par date DLTINS en rattrapage
+SCRIPTS_PER_DELTA_DATE = SCRIPTS[2:]
+
 def resolve_project_root() -> Path:
     """Remonte depuis ce fichier jusqu'à trouver un dossier `config/` (repo root)."""
     here = Path(__file__).resolve()
@@ -66,6 +74,13 @@ def build_env() -> dict:
     env["PYTHONPATH"] = os.pathsep.join(parts)
     return env
 
+def list_delta_csv_dates() -> list:
+    """Dossiers data/csv/DLTINS/<YYYYMMDD> produits par 02, par ordre croissant."""
+    dlt_root = resolve_project_root() / "data" / "csv" / "DLTINS"
+    if not dlt_root.is_dir():
+        return []
+    return sorted(p.name for p in dlt_root.iterdir() if p.is_dir() and len(p.name) == 8 and p.name.isdigit())
+
 def run_script(script_path: Path, env: dict) -> None:
     print(f"[ETL] START {script_path.name}")
     result = subprocess.run(
@@ -86,7 +101,22 @@ def main() -> int:
         path = BASE_DIR / name
         if not path.exists():
             raise FileNotFoundError(f"Missing script: {path}")
-        run_script(path, env)
+
+    for name in SCRIPTS[:2]:
+        run_script(BASE_DIR / name, env)
+
+    delta_dates = list_delta_csv_dates()
+    if len(delta_dates) <= 1:
+        for name in SCRIPTS_PER_DELTA_DATE:
+            run_script(BASE_DIR / name, env)
+    else:
+        # Rattrapage : application ordonnée, une date DLTINS à la fois
+        print(f"[ETL] DELTA CATCH-UP dates={','.join(delta_dates)}")
+        for i, d in enumerate(delta_dates):
+            env_d = dict(env, ESMA_DLTINS_DATE=d, ESMA_SKIP_FULINS="1" if i > 0 else "0")
+            print(f"[ETL] DELTA {d}")
+            for name in SCRIPTS_PER_DELTA_DATE:
+                run_script(BASE_DIR / name, env_d)
     print(f"[ETL] DAILY RUN END   {datetime.now():%Y-%m-%d %H:%M:%S}")
     return 0
 
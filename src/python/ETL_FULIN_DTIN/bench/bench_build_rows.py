@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+bench_build_rows.py
+===================
+
+Benchmark de la construction des lignes BSV de l'étape 02-BUILD_CSV (XML synthétiques de firds_mirror.py,
+aucun accès réseau ni SQL).
+
+Mesure, pour chaque moteur XML et chaque type (FULINS / DLTINS) :
+- débit : RefData/s et µs par RefData (meilleur de --repeat passes, XML déjà sur disque) ;
+- pression GC : collectes du ramasse-miettes (gen0/gen1/gen2) et temps passé dedans pendant la passe.
+
+--baseline <fichier.py> mesure en plus une autre version de 02-BUILD_CSV (ex. extraite par
+`git show <rev>:src/python/ETL_FULIN_DTIN/02-ETL_ESMA_DAILY_BUILD_CSV_AUTONOME.py`), et vérifie que les BSV
+produits sont identiques octet pour octet.
+
+Exemple :
+    python bench_build_rows.py --records 50000 --parsers lxml,stdlib --baseline /tmp/02_prev.py
+"""
+
+import argparse
+import gc
+import importlib.util
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, List
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+
+from firds_mirror import build_dltins_xml, build_fulins_xml  # noqa: E402
+
+
+def _load_build_csv(path: Path, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class GcMeter:
+    """Compte les collectes par génération et leur durée (gc.callbacks)."""
+
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.seconds = 0.0
+        self._t0 = 0.0
+
+    def __call__(self, phase: str, info: Dict) -> None:
+        if phase == "start":
+            self._t0 = time.perf_counter()
+        else:
+            self.seconds += time.perf_counter() - self._t0
+            self.collections[info["generation"]] += 1
+
+    def __enter__(self):
+        gc.collect()
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        gc.callbacks.remove(self)
+
+
+def run_once(build, kind: str, xml: Path, out_bsv: Path, parser: str) -> Dict:
+    extract = build.extract_fulins_xmls_to_bsv if kind == "FULINS" else build.extract_dltins_xmls_to_bsv
+    with GcMeter() as meter:
+        t0 = time.perf_counter()
+        rows = extract([xml], out_bsv, None, "bench", parser)
+        seconds = time.perf_counter() - t0
+    return {"rows": rows, "s": seconds, "gc": meter.collections, "gc_s": meter.seconds}
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Benchmark construction des lignes BSV (02-BUILD_CSV).")
+    p.add_argument("--records", type=int, default=20000, help="RefData par XML synthétique")
+    p.add_argument("--parsers", default="lxml,stdlib", help="Moteurs XML à mesurer (ex. lxml,stdlib)")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--baseline", type=Path, default=None, help="Autre version de 02-BUILD_CSV à comparer")
+    args = p.parse_args()
+
+    builds = [("current", _load_build_csv(HERE.parent / "02-ETL_ESMA_DAILY_BUILD_CSV_AUTONOME.py", "esma_build_csv"))]
+    if args.baseline is not None:
+        # chargé depuis le dossier de 02 (firds_fields.py y est résolu relativement au module)
+        copy = HERE.parent / "_bench_baseline_build_csv.py"
+        shutil.copyfile(args.baseline, copy)
+        try:
+            builds.append(("baseline", _load_build_csv(copy, "esma_build_csv_baseline")))
+        finally:
+            copy.unlink()
+
+    work = Path(tempfile.mkdtemp(prefix="firds_bench_rows_"))
+    try:
+        period = date(2025, 1, 10)
+        xmls = {"FULINS": work / f"FULINS_E_{period:%Y%m%d}_01of01.xml", "DLTINS": work / f"DLTINS_{period:%Y%m%d}_01of01.xml"}
+        xmls["FULINS"].write_bytes(build_fulins_xml(args.records, period, 1))
+        xmls["DLTINS"].write_bytes(build_dltins_xml(args.records, period, 2))
+
+        print(f"[BENCH] records={args.records} repeat={args.repeat} baseline={args.baseline}")
+        print(f"{'build':>8} {'parser':>6} {'kind':>6} {'rows':>7} {'s':>7} {'rec/s':>9} {'us/rec':>7} {'gc0':>5} {'gc1':>4} {'gc2':>4} {'gc_ms':>7}")
+        for parser in [x.strip() for x in args.parsers.split(",") if x.strip()]:
+            for kind, xml in xmls.items():
+                outputs: List[bytes] = []
+                for label, build in builds:
+                    out_bsv = work / f"{label}_{kind}.bsv"
+                    best = min((run_once(build, kind, xml, out_bsv, parser) for _ in range(max(1, args.repeat))),
+                               key=lambda r: r["s"])
+                    outputs.append(out_bsv.read_bytes())
+                    print(f"{label:>8} {parser:>6} {kind:>6} {best['rows']:>7} {best['s']:>7.3f} "
+                          f"{args.records / max(best['s'], 1e-9):>9.0f} {best['s'] / args.records * 1e6:>7.1f} "
+                          f"{best['gc'][0]:>5} {best['gc'][1]:>4} {best['gc'][2]:>4} {best['gc_s'] * 1000:>7.1f}")
+                if len(outputs) > 1:
+                    print(f"[BENCH] {parser} {kind} BSV identical to baseline: {outputs[0] == outputs[1]}")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+bench_get_files.py
+==================
+
+Benchmark de l'étape 01-GET_FILES contre le miroir local firds_mirror.py (aucun accès réseau ni SQL).
+
+Mesure, pour chaque nombre de workers demandé :
+- planification : rafraîchissement du catalogue local par SOLR (docs/s) ;
+- téléchargement + extraction du pool FULINS et des DLTINS (fichiers/s, Mo/s).
+
+Exemple :
+    python bench_get_files.py --workers 1,4,8 --full-files 8 --full-records 20000 --latency-ms 30 --bandwidth-mbps 10
+"""
+
+import argparse
+import importlib.util
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+
+from firds_mirror import start_mirror  # noqa: E402
+
+
+def _load_get_files():
+    spec = importlib.util.spec_from_file_location("esma_get_files", HERE.parent / "01-ETL_ESMA_DAILY_RUN_GET_FILES_AUTONOME.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def run_once(get_files, workers: int, extract_mode: str, page_workers: int, use_cursor: bool) -> dict:
+    work = Path(tempfile.mkdtemp(prefix="firds_bench_"))
+    try:
+        cat = get_files.catalogue_open(work / "catalogue.sqlite")
+        t0 = time.perf_counter()
+        n_docs = get_files.catalogue_refresh(cat, None, "bench", lookback_days=60, page_workers=page_workers, use_cursor=use_cursor)
+        t_plan = time.perf_counter() - t0
+
+        batches = []
+        full = get_files.catalogue_latest_date(cat, "FULINS")
+        if full is not None:
+            d = get_files.yyyymmdd(full)
+            batches.append((get_files.catalogue_docs_for_date(cat, "FULINS", full),
+                            work / "downloaded" / "FULINS" / d, work / "extracted" / "FULINS" / d, f"FULINS_{d}.zip"))
+        latest_delta = get_files.catalogue_latest_date(cat, "DLTINS")
+        if full is not None and latest_delta is not None:
+            for dt in get_files.catalogue_dates(cat, "DLTINS", full, latest_delta):
+                d = get_files.yyyymmdd(dt)
+                batches.append((get_files.catalogue_docs_for_date(cat, "DLTINS", dt),
+                                work / "downloaded" / "DLTINS" / d, work / "extracted" / "DLTINS" / d, f"DLTINS_{d}.zip"))
+        cat.close()
+
+        t0 = time.perf_counter()
+        zips, xmls = get_files.download_and_extract_batches(batches, workers, retries=3, extract_mode=extract_mode)
+        t_dl = time.perf_counter() - t0
+        mb = sum(p.stat().st_size for p in (work / "downloaded").rglob("*.zip")) / 1024 / 1024
+        return {"docs": n_docs, "plan_s": t_plan, "zips": zips, "xmls": xmls, "mb": mb, "dl_s": t_dl}
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Benchmark 01-GET_FILES sur miroir FIRDS local.")
+    p.add_argument("--workers", default="1,4,8", help="Liste de download_workers à mesurer (ex. 1,4,8)")
+    p.add_argument("--extract-mode", default="unzip", choices=("unzip", "stream"))
+    p.add_argument("--solr-page-workers", type=int, default=4)
+    p.add_argument("--solr-use-cursor", action="store_true")
+    p.add_argument("--repeat", type=int, default=1)
+    p.add_argument("--full-files", type=int, default=4)
+    p.add_argument("--full-records", type=int, default=2000)
+    p.add_argument("--delta-days", type=int, default=3)
+    p.add_argument("--delta-records", type=int, default=500)
+    p.add_argument("--latency-ms", type=float, default=0.0)
+    p.add_argument("--bandwidth-mbps", type=float, default=0.0)
+    p.add_argument("--fail-rate", type=float, default=0.0)
+    args = p.parse_args()
+
+    server, solr_url = start_mirror(args.full_files, args.full_records, args.delta_days, args.delta_records,
+                                    args.latency_ms, args.bandwidth_mbps, args.fail_rate)
+    get_files = _load_get_files()
+    get_files.ESMA_SOLR = solr_url
+    print(f"[BENCH] mirror={solr_url} latency_ms={args.latency_ms} bandwidth_mbps={args.bandwidth_mbps} fail_rate={args.fail_rate}")
+    print(f"{'workers':>7} {'docs':>5} {'plan_s':>7} {'docs/s':>8} {'files':>5} {'MB':>8} {'dl_s':>7} {'files/s':>8} {'MB/s':>8}")
+    try:
+        for workers in [int(w) for w in args.workers.split(",") if w.strip()]:
+            for _ in range(max(1, args.repeat)):
+                r = run_once(get_files, workers, args.extract_mode, args.solr_page_workers, args.solr_use_cursor)
+                print(f"{workers:>7} {r['docs']:>5} {r['plan_s']:>7.3f} {r['docs'] / max(r['plan_s'], 1e-9):>8.1f} "
+                      f"{r['zips']:>5} {r['mb']:>8.2f} {r['dl_s']:>7.3f} {r['zips'] / max(r['dl_s'], 1e-9):>8.2f} "
+                      f"{r['mb'] / max(r['dl_s'], 1e-9):>8.2f}")
+    finally:
+        server.shutdown()
+    stats = server.RequestHandlerClass.stats
+    print(f"[BENCH] solr_requests={stats['solr_requests']} file_requests={stats['file_requests']} "
+          f"bytes_sent={stats['bytes_sent']} injected_failures={stats['injected_failures']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
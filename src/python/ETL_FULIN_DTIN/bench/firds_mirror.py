@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+firds_mirror.py
+===============
+
+Miroir FIRDS local (hors réseau) pour mesurer / régler l'étape 01-GET_FILES sans registers.esma.europa.eu.
+
+Expose :
+- /solr/esma_registers_firds_files/select : contrat SOLR utilisé par 01 (q, fq=publication_date:[.. TO ..],
+  rows, start, sort, wt=json, cursorMark) ;
+- /files/<file_name> : ZIP FULINS/DLTINS synthétiques, avec HTTP Range (reprise).
+
+Injection de conditions réseau :
+- latency_ms    : délai avant chaque réponse (SOLR et fichiers) ;
+- bandwidth_mbps: débit max par connexion (Mo/s, 0 = illimité) ;
+- fail_rate     : probabilité qu'un téléchargement soit coupé à mi-fichier (reprise Range côté client).
+
+Usage autonome :
+    python firds_mirror.py --port 8765 --full-files 8 --delta-days 5 --latency-ms 50 --bandwidth-mbps 20
+puis [ESMA] solr_url = http://127.0.0.1:8765/solr/esma_registers_firds_files/select
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import random
+import re
+import threading
+import time
+import zipfile
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+SOLR_PATH = "/solr/esma_registers_firds_files/select"
+FILES_PATH = "/files/"
+SEND_CHUNK = 64 * 1024
+
+NS_FUL = "urn:iso:std:iso:20022:tech:xsd:auth.017.001.02"
+NS_DLT = "urn:iso:std:iso:20022:tech:xsd:auth.036.001.03"
+NS_HEAD = "urn:iso:std:iso:20022:tech:xsd:head.003.001.01"
+
+FQ_RE = re.compile(r"publication_date:\[(\S+)\s+TO\s+(\S+)\]")
+
+
+# ----------------------------
+# Fichiers synthétiques
+# ----------------------------
+def _refdata(i: int, rnd: random.Random, tag: str = "RefData") -> str:
+    isin = f"XS{i:010d}"
+    mic = f"XM{i % 17:02d}"
+    kind = rnd.choice(("equity", "debt", "deriv"))
+    parts = [
+        f"<{tag}><FinInstrmGnlAttrbts><Id>{isin}</Id><FullNm>Synthetic instrument {i}</FullNm>"
+        f"<ShrtNm>SYN{i}</ShrtNm><ClssfctnTp>{'ESVUFR' if kind == 'equity' else ('DBFTFR' if kind == 'debt' else 'FFICSX')}</ClssfctnTp>"
+        f"<NtnlCcy>EUR</NtnlCcy><CmmdtyDerivInd>false</CmmdtyDerivInd></FinInstrmGnlAttrbts>",
+        f"<Issr>5299{i:016d}</Issr>",
+        f"<TradgVnRltdAttrbts><Id>{mic}</Id><IssrReq>false</IssrReq><FrstTradDt>2020-01-02T00:00:00Z</FrstTradDt></TradgVnRltdAttrbts>",
+    ]
+    if kind == "debt":
+        parts.append(f"<DebtInstrmAttrbts><TtlIssdNmnlAmt Ccy=\"EUR\">{(i + 1) * 1000}</TtlIssdNmnlAmt><MtrtyDt>2031-06-30</MtrtyDt>"
+                     f"<NmnlValPerUnit Ccy=\"EUR\">1000</NmnlValPerUnit><IntrstRate><Fxd>{i % 7}.5</Fxd></IntrstRate></DebtInstrmAttrbts>")
+    elif kind == "deriv":
+        parts.append(f"<DerivInstrmAttrbts><XpryDt>2027-12-17</XpryDt><PricMltplr>10</PricMltplr>"
+                     f"<UndrlygInstrm><Sngl><ISIN>FR{i:010d}</ISIN></Sngl></UndrlygInstrm><OptnTp>CALL</OptnTp><DlvryTp>CASH</DlvryTp></DerivInstrmAttrbts>")
+    parts.append(f"<TechAttrbts><RlvntCmptntAuthrty>FR</RlvntCmptntAuthrty><PblctnPrd><FrDt>2024-01-01</FrDt></PblctnPrd></TechAttrbts></{tag}>")
+    return "".join(parts)
+
+
+def build_fulins_xml(records: int, period: date, seed: int) -> bytes:
+    rnd = random.Random(seed)
+    body = "".join(_refdata(seed * 1_000_000 + i, rnd) for i in range(records))
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><BizData xmlns="{NS_HEAD}"><Pyld><Document xmlns="{NS_FUL}">'
+        f"<FinInstrmRptgRefDataRpt><RptHdr><RptgNtty><NtlCmptntAuthrty>EU</NtlCmptntAuthrty></RptgNtty>"
+        f"<RptgPrd><Dt>{period.isoformat()}</Dt></RptgPrd></RptHdr>{body}</FinInstrmRptgRefDataRpt></Document></Pyld></BizData>"
+    ).encode("utf-8")
+
+
+def build_dltins_xml(records: int, period: date, seed: int) -> bytes:
+    rnd = random.Random(seed)
+    tags = ("NewRcrd", "ModfdRcrd", "TermntdRcrd", "CancRcrd")
+    body = "".join(_refdata(rnd.randrange(records * 10), rnd, tag=rnd.choice(tags)) for _ in range(records))
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><BizData xmlns="{NS_HEAD}"><Pyld><Document xmlns="{NS_DLT}">'
+        f"<FinInstrmRptgRefDataDltaRpt><RptHdr><RptgNtty><NtlCmptntAuthrty>EU</NtlCmptntAuthrty></RptgNtty>"
+        f"<RptgPrd><Dt>{period.isoformat()}</Dt></RptgPrd></RptHdr>{body}</FinInstrmRptgRefDataDltaRpt></Document></Pyld></BizData>"
+    ).encode("utf-8")
+
+
+def _zip_bytes(member: str, payload: bytes) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr(member, payload)
+    return buf.getvalue()
+
+
+def build_catalogue(full_files: int, full_records: int, delta_days: int, delta_records: int,
+                    today: Optional[date] = None) -> Tuple[List[Dict], Dict[str, bytes]]:
+    """
+    Un pool FULINS (full_files ZIP, publié il y a delta_days+1 jours) puis un DLTINS par jour jusqu'à today.
+    Retourne (docs SOLR sans download_link, {file_name: contenu ZIP}).
+    """
+    today = today or datetime.utcnow().date()
+    pool = today - timedelta(days=delta_days + 1)
+    docs: List[Dict] = []
+    blobs: Dict[str, bytes] = {}
+
+    def add(name: str, ftype: str, pub: date, xml: bytes) -> None:
+        blob = _zip_bytes(name[:-4] + ".xml", xml)
+        blobs[name] = blob
+        docs.append({
+            "id": hashlib.sha1(name.encode()).hexdigest(),
+            "file_name": name,
+            "file_type": ftype,
+            "publication_date": f"{pub.isoformat()}T08:00:00Z",
+            "file_size": len(blob),
+            "checksum": hashlib.md5(blob).hexdigest(),
+        })
+
+    ymd = pool.strftime("%Y%m%d")
+    for k in range(full_files):
+        add(f"FULINS_E_{ymd}_{k + 1:02d}of{full_files:02d}.zip", "FULINS", pool, build_fulins_xml(full_records, pool, k + 1))
+    for n in range(1, delta_days + 1):
+        d = pool + timedelta(days=n)
+        add(f"DLTINS_{d.strftime('%Y%m%d')}_01of01.zip", "DLTINS", d, build_dltins_xml(delta_records, d, 1000 + n))
+    return docs, blobs
+
+
+# ----------------------------
+# Serveur
+# ----------------------------
+class MirrorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    docs: List[Dict] = []
+    blobs: Dict[str, bytes] = {}
+    latency_ms = 0.0
+    bandwidth_mbps = 0.0
+    fail_rate = 0.0
+    rnd = random.Random(0)
+    lock = threading.Lock()
+    stats = {"solr_requests": 0, "file_requests": 0, "bytes_sent": 0, "injected_failures": 0}
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _count(self, key: str, n: int = 1) -> None:
+        with self.lock:
+            self.stats[key] += n
+
+    def _send_json(self, payload: Dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+        url = urlparse(self.path)
+        if url.path == SOLR_PATH:
+            self._count("solr_requests")
+            self._solr(parse_qs(url.query))
+        elif url.path.startswith(FILES_PATH):
+            self._count("file_requests")
+            self._file(unquote(url.path[len(FILES_PATH):]))
+        else:
+            self.send_error(404)
+
+    def _solr(self, qs: Dict[str, List[str]]) -> None:
+        fq = (qs.get("fq") or [""])[0]
+        m = FQ_RE.search(fq)
+        lo, hi = (m.group(1), m.group(2)) if m else ("", "~")
+        hits = [d for d in self.docs if lo <= d["publication_date"] <= hi]
+        sort = (qs.get("sort") or ["publication_date desc"])[0]
+        desc = "publication_date desc" in sort
+        hits.sort(key=lambda d: d["id"])
+        hits.sort(key=lambda d: d["publication_date"], reverse=desc)
+
+        rows = int((qs.get("rows") or ["10"])[0])
+        base = f"http://{self.headers.get('Host')}{FILES_PATH}"
+
+        def out_docs(page: List[Dict]) -> List[Dict]:
+            return [dict(d, download_link=base + d["file_name"]) for d in page]
+
+        if "cursorMark" in qs:
+            # curseur = position dans le tri (suffisant pour un index figé)
+            cursor = qs["cursorMark"][0]
+            pos = 0 if cursor == "*" else int(cursor)
+            page = hits[pos:pos + rows]
+            nxt = str(pos + len(page)) if page else cursor
+            self._send_json({"response": {"numFound": len(hits), "start": pos, "docs": out_docs(page)}, "nextCursorMark": nxt})
+            return
+        start = int((qs.get("start") or ["0"])[0])
+        page = hits[start:start + rows]
+        self._send_json({"response": {"numFound": len(hits), "start": start, "docs": out_docs(page)}})
+
+    def _file(self, name: str) -> None:
+        blob = self.blobs.get(name)
+        if blob is None:
+            self.send_error(404)
+            return
+        start = 0
+        rng = self.headers.get("Range")
+        if rng:
+            m = re.match(r"bytes=(\d+)-", rng)
+            start = int(m.group(1)) if m else 0
+            if start >= len(blob):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(blob)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(blob) - 1}/{len(blob)}")
+        else:
+            self.send_response(200)
+        body = memoryview(blob)[start:]
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        with self.lock:
+            fail = self.fail_rate > 0 and self.rnd.random() < self.fail_rate
+        cut = len(body) // 2 if fail else len(body)
+        throttle = self.bandwidth_mbps * 1024 * 1024 if self.bandwidth_mbps > 0 else 0
+        sent = 0
+        t0 = time.perf_counter()
+        while sent < cut:
+            chunk = body[sent:min(cut, sent + SEND_CHUNK)]
+            self.wfile.write(chunk)
+            sent += len(chunk)
+            if throttle:
+                ahead = sent / throttle - (time.perf_counter() - t0)
+                if ahead > 0:
+                    time.sleep(ahead)
+        self._count("bytes_sent", sent)
+        if fail:
+            self._count("injected_failures")
+            self.wfile.flush()
+            self.close_connection = True
+            self.connection.shutdown(2)
+
+
+def start_mirror(full_files: int = 4, full_records: int = 2000, delta_days: int = 3, delta_records: int = 500,
+                 latency_ms: float = 0.0, bandwidth_mbps: float = 0.0, fail_rate: float = 0.0,
+                 host: str = "127.0.0.1", port: int = 0, seed: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """Démarre le miroir dans un thread démon. Retourne (serveur, url SOLR select)."""
+    docs, blobs = build_catalogue(full_files, full_records, delta_days, delta_records)
+    handler = type("BoundMirrorHandler", (MirrorHandler,), {
+        "docs": docs, "blobs": blobs, "latency_ms": latency_ms, "bandwidth_mbps": bandwidth_mbps,
+        "fail_rate": fail_rate, "rnd": random.Random(seed), "lock": threading.Lock(),
+        "stats": {"solr_requests": 0, "file_requests": 0, "bytes_sent": 0, "injected_failures": 0},
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="firds_mirror", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}{SOLR_PATH}"
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Miroir FIRDS local (SOLR select + ZIP synthétiques).")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--full-files", type=int, default=4)
+    p.add_argument("--full-records", type=int, default=2000)
+    p.add_argument("--delta-days", type=int, default=3)
+    p.add_argument("--delta-records", type=int, default=500)
+    p.add_argument("--latency-ms", type=float, default=0.0)
+    p.add_argument("--bandwidth-mbps", type=float, default=0.0)
+    p.add_argument("--fail-rate", type=float, default=0.0)
+    args = p.parse_args()
+
+    server, solr_url = start_mirror(args.full_files, args.full_records, args.delta_days, args.delta_records,
+                                    args.latency_ms, args.bandwidth_mbps, args.fail_rate, args.host, args.port)
+    handler = server.RequestHandlerClass
+    total = sum(len(b) for b in handler.blobs.values())
+    print(f"[MIRROR] {len(handler.docs)} files ({total / 1024 / 1024:.1f} MB) solr_url={solr_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
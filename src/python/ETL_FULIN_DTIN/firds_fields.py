@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+firds_fields.py
+===============
+
+FICHIER GÉNÉRÉ par tools/gen_firds_fields.py - ne pas modifier à la main.
+
+Tables d'extraction colonne BSV -> chemins ElementPath relatifs à l'enregistrement (préfixe 'a' = namespace
+du message), issues des XSD ESMA. Par colonne, le premier chemin non vide l'emporte (cf. FieldPlan dans 02).
+
+FULINS : auth.017.001.02_ESMAUG_FULINS_1.1.0.xsd
+DLTINS : auth.036.001.03_ESMAUG_DLTINS_1.2.0.xsd
+"""
+
+from typing import Dict, List
+
+
+FULINS_XSD = "auth.017.001.02_ESMAUG_FULINS_1.1.0.xsd"
+FULINS_NS = "urn:iso:std:iso:20022:tech:xsd:auth.017.001.02"
+FULINS_FIELDS: Dict[str, List[str]] = {
+    "ISIN": ["./a:FinInstrmGnlAttrbts/a:Id"],
+    "FullName": ["./a:FinInstrmGnlAttrbts/a:FullNm"],
+    "ShortName": ["./a:FinInstrmGnlAttrbts/a:ShrtNm"],
+    "CFI": ["./a:FinInstrmGnlAttrbts/a:ClssfctnTp"],
+    "CommodityDerivativeInd": ["./a:FinInstrmGnlAttrbts/a:CmmdtyDerivInd"],
+    "NotionalCurrency": ["./a:FinInstrmGnlAttrbts/a:NtnlCcy"],
+    "IssuerLEI": ["./a:Issr"],
+    "TradingVenueMIC": ["./a:TradgVnRltdAttrbts/a:Id"],
+    "IssuerReqAdmission": ["./a:TradgVnRltdAttrbts/a:IssrReq"],
+    "AdmissionApprvlDate": ["./a:TradgVnRltdAttrbts/a:AdmssnApprvlDtByIssr"],
+    "ReqForAdmissionDate": ["./a:TradgVnRltdAttrbts/a:ReqForAdmssnDt"],
+    "FirstTradingDate": ["./a:TradgVnRltdAttrbts/a:FrstTradDt"],
+    "TerminationDate": ["./a:TradgVnRltdAttrbts/a:TermntnDt"],
+    "TotalIssuedNominalAmount": ["./a:DebtInstrmAttrbts/a:TtlIssdNmnlAmt"],
+    "TotalIssuedNominalAmountCcy": ["./a:DebtInstrmAttrbts/a:TtlIssdNmnlAmt/@Ccy"],
+    "MaturityDate": ["./a:DebtInstrmAttrbts/a:MtrtyDt"],
+    "NominalValuePerUnit": ["./a:DebtInstrmAttrbts/a:NmnlValPerUnit"],
+    "NominalValuePerUnitCcy": ["./a:DebtInstrmAttrbts/a:NmnlValPerUnit/@Ccy"],
+    "FixedRate": ["./a:DebtInstrmAttrbts/a:IntrstRate/a:Fxd"],
+    "FloatRefRateISIN": ["./a:DebtInstrmAttrbts/a:IntrstRate/a:Fltg/a:RefRate/a:ISIN"],
+    "FloatRefRateIndex": [
+        "./a:DebtInstrmAttrbts/a:IntrstRate/a:Fltg/a:RefRate/a:Indx",
+        "./a:DebtInstrmAttrbts/a:IntrstRate/a:Fltg/a:RefRate/a:Nm",
+    ],
+    "FloatTermUnit": ["./a:DebtInstrmAttrbts/a:IntrstRate/a:Fltg/a:Term/a:Unit"],
+    "FloatTermValue": ["./a:DebtInstrmAttrbts/a:IntrstRate/a:Fltg/a:Term/a:Val"],
+    "FloatBasisPointSpread": ["./a:DebtInstrmAttrbts/a:IntrstRate/a:Fltg/a:BsisPtSprd"],
+    "DebtSeniority": ["./a:DebtInstrmAttrbts/a:DebtSnrty"],
+    "ExpiryDate": ["./a:DerivInstrmAttrbts/a:XpryDt"],
+    "PriceMultiplier": ["./a:DerivInstrmAttrbts/a:PricMltplr"],
+    "UnderlyingISIN": [
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:ISIN",
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Bskt/a:ISIN",
+    ],
+    "UnderlyingLEI": [
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:LEI",
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Bskt/a:LEI",
+    ],
+    "UnderlyingIndexRef": [
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:Indx/a:ISIN",
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:Indx/a:Nm/a:RefRate/a:Indx",
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:Indx/a:Nm/a:RefRate/a:Nm",
+    ],
+    "UnderlyingIndexTermUnit": ["./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:Indx/a:Nm/a:Term/a:Unit"],
+    "UnderlyingIndexTermValue": ["./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:Indx/a:Nm/a:Term/a:Val"],
+    "OptionType": ["./a:DerivInstrmAttrbts/a:OptnTp"],
+    "OptionExerciseStyle": ["./a:DerivInstrmAttrbts/a:OptnExrcStyle"],
+    "DeliveryType": ["./a:DerivInstrmAttrbts/a:DlvryTp"],
+    "StrikePrice": [
+        "./a:DerivInstrmAttrbts/a:StrkPric/a:Pric/a:MntryVal/a:Amt",
+        "./a:DerivInstrmAttrbts/a:StrkPric/a:Pric/a:Pctg",
+        "./a:DerivInstrmAttrbts/a:StrkPric/a:Pric/a:Yld",
+        "./a:DerivInstrmAttrbts/a:StrkPric/a:Pric/a:BsisPts",
+    ],
+    "StrikePriceCcy": ["./a:DerivInstrmAttrbts/a:StrkPric/a:Pric/a:MntryVal/a:Amt/@Ccy"],
+    "StrikeNoPriceCcy": ["./a:DerivInstrmAttrbts/a:StrkPric/a:NoPric/a:Ccy"],
+    "CmdtyBaseProduct": [
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:GrnOilSeed/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Soft/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Ptt/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:OlvOil/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Dairy/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Frstry/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Sfd/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:LiveStock/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Grn/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Elctrcty/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:NtrlGas/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Oil/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Coal/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:IntrNrgy/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:RnwblNrgy/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:LghtEnd/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Dstllts/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:Emssns/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:Wthr/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:CrbnRltd/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Ammn/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:DmmnmPhspht/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Ptsh/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Slphr/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Urea/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:UreaAndAmmnmNtrt/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:Dry/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:Wet/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:CntnrShip/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:IndstrlPdct/a:Cnstrctn/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:IndstrlPdct/a:Manfctg/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Metl/a:NonPrcs/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Metl/a:Prcs/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:OthrC10/a:Dlvrbl/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:OthrC10/a:NonDlvrbl/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:CntnrBrd/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:Nwsprnt/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:Pulp/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:RcvrdPpr/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Plprpln/a:Plstc/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Infltn/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:MultiCmmdtyExtc/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:OffclEcnmcSttstcs/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Othr/a:BasePdct",
+    ],
+    "CmdtySubProduct": [
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:GrnOilSeed/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Soft/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Ptt/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:OlvOil/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Dairy/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Frstry/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Sfd/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:LiveStock/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Grn/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Elctrcty/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:NtrlGas/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Oil/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Coal/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:IntrNrgy/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:RnwblNrgy/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:LghtEnd/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Dstllts/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:Emssns/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:Wthr/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:CrbnRltd/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Ammn/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:DmmnmPhspht/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Ptsh/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Slphr/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Urea/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:UreaAndAmmnmNtrt/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:Dry/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:Wet/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:CntnrShip/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:IndstrlPdct/a:Cnstrctn/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:IndstrlPdct/a:Manfctg/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Metl/a:NonPrcs/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Metl/a:Prcs/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:OthrC10/a:Dlvrbl/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:OthrC10/a:NonDlvrbl/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:CntnrBrd/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:Nwsprnt/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:Pulp/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:RcvrdPpr/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Plprpln/a:Plstc/a:SubPdct",
+    ],
+    "CmdtySubSubProduct": [
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:GrnOilSeed/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Soft/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:OlvOil/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Grn/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Elctrcty/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:NtrlGas/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Oil/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:Emssns/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:Dry/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:Wet/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Metl/a:NonPrcs/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Metl/a:Prcs/a:AddtlSubPdct",
+    ],
+    "CmdtyTransactionType": ["./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:TxTp"],
+    "CmdtyFinalPriceType": ["./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:FnlPricTp"],
+}
+
+DLTINS_XSD = "auth.036.001.03_ESMAUG_DLTINS_1.2.0.xsd"
+DLTINS_NS = "urn:iso:std:iso:20022:tech:xsd:auth.036.001.03"
+DLTINS_FIELDS: Dict[str, List[str]] = {
+    "ISIN": ["./a:FinInstrmGnlAttrbts/a:Id"],
+    "FullName": ["./a:FinInstrmGnlAttrbts/a:FullNm"],
+    "ShortName": ["./a:FinInstrmGnlAttrbts/a:ShrtNm"],
+    "CFI": ["./a:FinInstrmGnlAttrbts/a:ClssfctnTp"],
+    "CommodityDerivativeInd": ["./a:FinInstrmGnlAttrbts/a:CmmdtyDerivInd"],
+    "NotionalCurrency": ["./a:FinInstrmGnlAttrbts/a:NtnlCcy"],
+    "IssuerLEI": ["./a:Issr"],
+    "TradingVenueMIC": ["./a:TradgVnRltdAttrbts/a:Id"],
+    "IssuerReqAdmission": ["./a:TradgVnRltdAttrbts/a:IssrReq"],
+    "AdmissionApprvlDate": ["./a:TradgVnRltdAttrbts/a:AdmssnApprvlDtByIssr"],
+    "ReqForAdmissionDate": ["./a:TradgVnRltdAttrbts/a:ReqForAdmssnDt"],
+    "FirstTradingDate": ["./a:TradgVnRltdAttrbts/a:FrstTradDt"],
+    "TerminationDate": ["./a:TradgVnRltdAttrbts/a:TermntnDt"],
+    "TotalIssuedNominalAmount": ["./a:DebtInstrmAttrbts/a:TtlIssdNmnlAmt"],
+    "TotalIssuedNominalAmountCcy": ["./a:DebtInstrmAttrbts/a:TtlIssdNmnlAmt/@Ccy"],
+    "MaturityDate": ["./a:DebtInstrmAttrbts/a:MtrtyDt"],
+    "NominalValuePerUnit": ["./a:DebtInstrmAttrbts/a:NmnlValPerUnit"],
+    "NominalValuePerUnitCcy": ["./a:DebtInstrmAttrbts/a:NmnlValPerUnit/@Ccy"],
+    "FixedRate": ["./a:DebtInstrmAttrbts/a:IntrstRate/a:Fxd"],
+    "FloatRefRateISIN": ["./a:DebtInstrmAttrbts/a:IntrstRate/a:Fltg/a:RefRate/a:ISIN"],
+    "FloatRefRateIndex": [
+        "./a:DebtInstrmAttrbts/a:IntrstRate/a:Fltg/a:RefRate/a:Indx",
+        "./a:DebtInstrmAttrbts/a:IntrstRate/a:Fltg/a:RefRate/a:Nm",
+    ],
+    "FloatTermUnit": ["./a:DebtInstrmAttrbts/a:IntrstRate/a:Fltg/a:Term/a:Unit"],
+    "FloatTermValue": ["./a:DebtInstrmAttrbts/a:IntrstRate/a:Fltg/a:Term/a:Val"],
+    "FloatBasisPointSpread": ["./a:DebtInstrmAttrbts/a:IntrstRate/a:Fltg/a:BsisPtSprd"],
+    "DebtSeniority": ["./a:DebtInstrmAttrbts/a:DebtSnrty"],
+    "ExpiryDate": ["./a:DerivInstrmAttrbts/a:XpryDt"],
+    "PriceMultiplier": ["./a:DerivInstrmAttrbts/a:PricMltplr"],
+    "UnderlyingISIN": [
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:ISIN",
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Bskt/a:ISIN",
+    ],
+    "UnderlyingLEI": [
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:LEI",
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Bskt/a:LEI",
+    ],
+    "UnderlyingIndexRef": [
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:Indx/a:ISIN",
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:Indx/a:Nm/a:RefRate/a:Indx",
+        "./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:Indx/a:Nm/a:RefRate/a:Nm",
+    ],
+    "UnderlyingIndexTermUnit": ["./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:Indx/a:Nm/a:Term/a:Unit"],
+    "UnderlyingIndexTermValue": ["./a:DerivInstrmAttrbts/a:UndrlygInstrm/a:Sngl/a:Indx/a:Nm/a:Term/a:Val"],
+    "OptionType": ["./a:DerivInstrmAttrbts/a:OptnTp"],
+    "OptionExerciseStyle": ["./a:DerivInstrmAttrbts/a:OptnExrcStyle"],
+    "DeliveryType": ["./a:DerivInstrmAttrbts/a:DlvryTp"],
+    "StrikePrice": [
+        "./a:DerivInstrmAttrbts/a:StrkPric/a:Pric/a:MntryVal/a:Amt",
+        "./a:DerivInstrmAttrbts/a:StrkPric/a:Pric/a:Pctg",
+        "./a:DerivInstrmAttrbts/a:StrkPric/a:Pric/a:Yld",
+        "./a:DerivInstrmAttrbts/a:StrkPric/a:Pric/a:BsisPts",
+    ],
+    "StrikePriceCcy": ["./a:DerivInstrmAttrbts/a:StrkPric/a:Pric/a:MntryVal/a:Amt/@Ccy"],
+    "StrikeNoPriceCcy": ["./a:DerivInstrmAttrbts/a:StrkPric/a:NoPric/a:Ccy"],
+    "CmdtyBaseProduct": [
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:GrnOilSeed/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Soft/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Ptt/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:OlvOil/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Dairy/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Frstry/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Sfd/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:LiveStock/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Grn/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Elctrcty/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:NtrlGas/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Oil/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Coal/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:IntrNrgy/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:RnwblNrgy/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:LghtEnd/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Dstllts/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:Emssns/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:Wthr/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:CrbnRltd/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Ammn/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:DmmnmPhspht/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Ptsh/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Slphr/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Urea/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:UreaAndAmmnmNtrt/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:Dry/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:Wet/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:CntnrShip/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:IndstrlPdct/a:Cnstrctn/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:IndstrlPdct/a:Manfctg/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Metl/a:NonPrcs/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Metl/a:Prcs/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:OthrC10/a:Dlvrbl/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:OthrC10/a:NonDlvrbl/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:CntnrBrd/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:Nwsprnt/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:Pulp/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:RcvrdPpr/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Plprpln/a:Plstc/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Infltn/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:MultiCmmdtyExtc/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:OffclEcnmcSttstcs/a:BasePdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Othr/a:BasePdct",
+    ],
+    "CmdtySubProduct": [
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:GrnOilSeed/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Soft/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Ptt/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:OlvOil/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Dairy/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Frstry/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Sfd/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:LiveStock/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Grn/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Elctrcty/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:NtrlGas/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Oil/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Coal/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:IntrNrgy/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:RnwblNrgy/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:LghtEnd/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Dstllts/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:Emssns/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:Wthr/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:CrbnRltd/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Ammn/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:DmmnmPhspht/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Ptsh/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Slphr/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:Urea/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frtlzr/a:UreaAndAmmnmNtrt/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:Dry/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:Wet/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:CntnrShip/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:IndstrlPdct/a:Cnstrctn/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:IndstrlPdct/a:Manfctg/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Metl/a:NonPrcs/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Metl/a:Prcs/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:OthrC10/a:Dlvrbl/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:OthrC10/a:NonDlvrbl/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:CntnrBrd/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:Nwsprnt/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:Pulp/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Ppr/a:RcvrdPpr/a:SubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Plprpln/a:Plstc/a:SubPdct",
+    ],
+    "CmdtySubSubProduct": [
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:GrnOilSeed/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Soft/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:OlvOil/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Agrcltrl/a:Grn/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Elctrcty/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:NtrlGas/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Nrgy/a:Oil/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Envttl/a:Emssns/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:Dry/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Frght/a:Wet/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Metl/a:NonPrcs/a:AddtlSubPdct",
+        "./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:Pdct/a:Metl/a:Prcs/a:AddtlSubPdct",
+    ],
+    "CmdtyTransactionType": ["./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:TxTp"],
+    "CmdtyFinalPriceType": ["./a:DerivInstrmAttrbts/a:AsstClssSpcfcAttrbts/a:Cmmdty/a:FnlPricTp"],
+}
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+gen_firds_fields.py
+===================
+
+Génère firds_fields.py (tables d'extraction FULINS / DLTINS utilisées par 02-BUILD_CSV) depuis les XSD ESMA
+livrés dans doc/Spec_ESMA (auth.017 FULINS, auth.036 DLTINS).
+
+Principe :
+- le graphe des complexType est parcouru depuis l'élément enregistrement de chaque message
+  (FULINS : RefData ; DLTINS : NewRcrd / ModfdRcrd / TermntdRcrd / CancRcrd) pour énumérer tous les chemins
+  de feuilles valides (avec leurs attributs, ex. TtlIssdNmnlAmt/@Ccy) ;
+- COLUMN_SPEC associe chaque colonne BSV à des motifs de chemins schéma ("*" = une balise, "**" = zéro ou plus) ;
+- chaque motif est développé en chemins explicites "./a:X/a:Y" (ordre du schéma), sans recherche descendante ;
+- une colonne (ou un motif) sans correspondance dans le schéma fait échouer la génération.
+
+Montée de version d'un XSD : remplacer le fichier dans doc/Spec_ESMA, ajuster MESSAGES si le nom change, relancer :
+    python gen_firds_fields.py
+puis relire le diff de firds_fields.py.
+"""
+
+import argparse
+import json
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+HERE = Path(__file__).resolve().parent
+REPO_ROOT = HERE.parents[3]
+XSD_DIR = REPO_ROOT / "doc" / "Spec_ESMA" / "ESMA65-11-1194 Annex FIRDS Reference Data XML Schema 1.2.0"
+OUT_DEFAULT = HERE.parent / "firds_fields.py"
+
+XS = "{http://www.w3.org/2001/XMLSchema}"
+
+# message -> (fichier XSD, chemin des éléments enregistrement depuis l'élément racine Document)
+MESSAGES: Dict[str, Tuple[str, str]] = {
+    "FULINS": ("auth.017.001.02_ESMAUG_FULINS_1.1.0.xsd", "FinInstrmRptgRefDataRpt/RefData"),
+    "DLTINS": ("auth.036.001.03_ESMAUG_DLTINS_1.2.0.xsd", "FinInstrmRptgRefDataDltaRpt/FinInstrm/*"),
+}
+
+_DEBT = "DebtInstrmAttrbts"
+_DER = "DerivInstrmAttrbts"
+_UND = _DER + "/UndrlygInstrm"
+_CMDTY = _DER + "/AsstClssSpcfcAttrbts/Cmmdty"
+
+# Colonne BSV -> motifs de chemins schéma (relatifs à l'enregistrement), par ordre de priorité
+COLUMN_SPEC: Dict[str, List[str]] = {
+    "ISIN": ["FinInstrmGnlAttrbts/Id"],
+    "FullName": ["FinInstrmGnlAttrbts/FullNm"],
+    "ShortName": ["FinInstrmGnlAttrbts/ShrtNm"],
+    "CFI": ["FinInstrmGnlAttrbts/ClssfctnTp"],
+    "CommodityDerivativeInd": ["FinInstrmGnlAttrbts/CmmdtyDerivInd"],
+    "NotionalCurrency": ["FinInstrmGnlAttrbts/NtnlCcy"],
+
+    "IssuerLEI": ["Issr"],
+
+    "TradingVenueMIC": ["TradgVnRltdAttrbts/Id"],
+    "IssuerReqAdmission": ["TradgVnRltdAttrbts/IssrReq"],
+    "AdmissionApprvlDate": ["TradgVnRltdAttrbts/AdmssnApprvlDtByIssr"],
+    "ReqForAdmissionDate": ["TradgVnRltdAttrbts/ReqForAdmssnDt"],
+    "FirstTradingDate": ["TradgVnRltdAttrbts/FrstTradDt"],
+    "TerminationDate": ["TradgVnRltdAttrbts/TermntnDt"],
+
+    "TotalIssuedNominalAmount": [_DEBT + "/TtlIssdNmnlAmt"],
+    "TotalIssuedNominalAmountCcy": [_DEBT + "/TtlIssdNmnlAmt/@Ccy"],
+    "MaturityDate": [_DEBT + "/MtrtyDt"],
+    "NominalValuePerUnit": [_DEBT + "/NmnlValPerUnit"],
+    "NominalValuePerUnitCcy": [_DEBT + "/NmnlValPerUnit/@Ccy"],
+    "FixedRate": [_DEBT + "/IntrstRate/Fxd"],
+    "FloatRefRateISIN": [_DEBT + "/IntrstRate/Fltg/RefRate/ISIN"],
+    "FloatRefRateIndex": [_DEBT + "/IntrstRate/Fltg/RefRate/Indx", _DEBT + "/IntrstRate/Fltg/RefRate/Nm"],
+    "FloatTermUnit": [_DEBT + "/IntrstRate/Fltg/Term/Unit"],
+    "FloatTermValue": [_DEBT + "/IntrstRate/Fltg/Term/Val"],
+    "FloatBasisPointSpread": [_DEBT + "/IntrstRate/Fltg/BsisPtSprd"],
+    "DebtSeniority": [_DEBT + "/DebtSnrty"],
+
+    "ExpiryDate": [_DER + "/XpryDt"],
+    "PriceMultiplier": [_DER + "/PricMltplr"],
+    "UnderlyingISIN": [_UND + "/Sngl/ISIN", _UND + "/Bskt/ISIN"],
+    "UnderlyingLEI": [_UND + "/Sngl/LEI", _UND + "/Bskt/LEI"],
+    "UnderlyingIndexRef": [_UND + "/Sngl/Indx/ISIN", _UND + "/Sngl/Indx/Nm/RefRate/Indx", _UND + "/Sngl/Indx/Nm/RefRate/Nm"],
+    "UnderlyingIndexTermUnit": [_UND + "/Sngl/Indx/Nm/Term/Unit"],
+    "UnderlyingIndexTermValue": [_UND + "/Sngl/Indx/Nm/Term/Val"],
+    "OptionType": [_DER + "/OptnTp"],
+    "OptionExerciseStyle": [_DER + "/OptnExrcStyle"],
+    "DeliveryType": [_DER + "/DlvryTp"],
+    "StrikePrice": [_DER + "/StrkPric/Pric/MntryVal/Amt", _DER + "/StrkPric/Pric/Pctg",
+                    _DER + "/StrkPric/Pric/Yld", _DER + "/StrkPric/Pric/BsisPts"],
+    "StrikePriceCcy": [_DER + "/StrkPric/Pric/MntryVal/Amt/@Ccy"],
+    "StrikeNoPriceCcy": [_DER + "/StrkPric/NoPric/Ccy"],
+    "CmdtyBaseProduct": [_CMDTY + "/Pdct/**/BasePdct"],
+    "CmdtySubProduct": [_CMDTY + "/Pdct/**/SubPdct"],
+    "CmdtySubSubProduct": [_CMDTY + "/Pdct/**/AddtlSubPdct"],
+    "CmdtyTransactionType": [_CMDTY + "/TxTp"],
+    "CmdtyFinalPriceType": [_CMDTY + "/FnlPricTp"],
+}
+
+
+class Xsd:
+    """Index minimal d'un XSD ISO 20022 (un seul fichier, pas d'import/include, types nommés)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        root = ET.parse(path).getroot()
+        self.target_ns = root.get("targetNamespace", "")
+        self.types = {t.get("name"): t for t in root if t.tag in (XS + "complexType", XS + "simpleType")}
+        self.document = next(e for e in root if e.tag == XS + "element")
+
+    def children(self, type_name: str) -> List[Tuple[str, str]]:
+        """Éléments enfants (nom, type) d'un complexType, ordre du schéma (sequence / choice imbriqués)."""
+        t = self.types.get(type_name)
+        if t is None or t.tag != XS + "complexType" or t.find(XS + "simpleContent") is not None:
+            return []
+        return [(e.get("name"), e.get("type")) for e in t.iter(XS + "element")]
+
+    def attributes(self, type_name: str) -> List[str]:
+        t = self.types.get(type_name)
+        return [] if t is None else [a.get("name") for a in t.iter(XS + "attribute")]
+
+    def record_types(self, record_path: str) -> List[str]:
+        """Types des éléments enregistrement désignés par record_path (depuis l'élément racine)."""
+        level = self.children(self.document.get("type"))
+        types: List[str] = []
+        steps = record_path.split("/")
+        for k, step in enumerate(steps):
+            hits = [(n, t) for n, t in level if step in ("*", n)]
+            if not hits:
+                raise ValueError(f"{self.path.name}: '{step}' introuvable dans {record_path}")
+            if k == len(steps) - 1:
+                types = [t for _, t in hits]
+            else:
+                level = [c for _, t in hits for c in self.children(t)]
+        return list(dict.fromkeys(types))
+
+    def leaf_paths(self, type_name: str, prefix: Tuple[str, ...] = ()) -> List[Tuple[str, ...]]:
+        """Chemins (balises) de toutes les feuilles sous type_name ; une feuille à attributs ajoute aussi '@Attr'."""
+        out: List[Tuple[str, ...]] = []
+        for name, child_type in self.children(type_name):
+            path = prefix + (name,)
+            if self.children(child_type):
+                out.extend(self.leaf_paths(child_type, path))
+                continue
+            out.append(path)
+            out.extend(path + ("@" + a,) for a in self.attributes(child_type))
+        return out
+
+
+def _match(pattern: Tuple[str, ...], path: Tuple[str, ...]) -> bool:
+    if not pattern:
+        return not path
+    head = pattern[0]
+    if head == "**":
+        return any(_match(pattern[1:], path[k:]) for k in range(len(path) + 1))
+    return bool(path) and head in ("*", path[0]) and _match(pattern[1:], path[1:])
+
+
+def resolve_fields(xsd: Xsd, record_path: str) -> Dict[str, List[str]]:
+    """COLUMN_SPEC -> {colonne: ["./a:X/a:Y[/@Attr]", ...]} pour un message ; lève ValueError si un motif est vide."""
+    paths: List[Tuple[str, ...]] = []
+    for t in xsd.record_types(record_path):
+        paths.extend(p for p in xsd.leaf_paths(t) if p not in paths)
+
+    fields: Dict[str, List[str]] = {}
+    for col, patterns in COLUMN_SPEC.items():
+        resolved: List[str] = []
+        for pattern in patterns:
+            hits = [p for p in paths if _match(tuple(pattern.split("/")), p)]
+            if not hits:
+                raise ValueError(f"{xsd.path.name}: colonne {col} - aucun chemin schéma pour '{pattern}'")
+            for p in hits:
+                xp = "./" + "/".join(s if s.startswith("@") else "a:" + s for s in p)
+                if xp not in resolved:
+                    resolved.append(xp)
+        fields[col] = resolved
+    return fields
+
+
+def _q(s: str) -> str:
+    return json.dumps(s, ensure_ascii=False)
+
+
+def render(messages: Dict[str, Tuple[Xsd, Dict[str, List[str]]]]) -> str:
+    lines = [
+        "# -*- coding: utf-8 -*-",
+        '"""',
+        "firds_fields.py",
+        "===============",
+        "",
+        "FICHIER GÉNÉRÉ par tools/gen_firds_fields.py - ne pas modifier à la main.",
+        "",
+        "Tables d'extraction colonne BSV -> chemins ElementPath relatifs à l'enregistrement (préfixe 'a' = namespace",
+        "du message), issues des XSD ESMA. Par colonne, le premier chemin non vide l'emporte (cf. FieldPlan dans 02).",
+        "",
+    ]
+    lines += [f"{kind} : {xsd.path.name}" for kind, (xsd, _) in messages.items()]
+    lines += ['"""', "", "from typing import Dict, List", ""]
+    for kind, (xsd, fields) in messages.items():
+        lines += [
+            "",
+            f"{kind}_XSD = {_q(xsd.path.name)}",
+            f"{kind}_NS = {_q(xsd.target_ns)}",
+            f"{kind}_FIELDS: Dict[str, List[str]] = {{",
+        ]
+        for col, xps in fields.items():
+            if len(xps) == 1:
+                lines.append(f"    {_q(col)}: [{_q(xps[0])}],")
+                continue
+            lines.append(f"    {_q(col)}: [")
+            lines += [f"        {_q(xp)}," for xp in xps]
+            lines.append("    ],")
+        lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Génère firds_fields.py depuis les XSD FIRDS (FULINS / DLTINS).")
+    p.add_argument("--xsd-dir", type=Path, default=XSD_DIR)
+    p.add_argument("--out", type=Path, default=OUT_DEFAULT)
+    p.add_argument("--check", action="store_true", help="Échoue si --out diffère de la génération (sans écrire)")
+    args = p.parse_args(argv)
+
+    messages = {}
+    for kind, (xsd_name, record_path) in MESSAGES.items():
+        xsd = Xsd(args.xsd_dir / xsd_name)
+        try:
+            fields = resolve_fields(xsd, record_path)
+        except ValueError as e:
+            print(f"[GEN] ERROR {e}", file=sys.stderr)
+            return 1
+        messages[kind] = (xsd, fields)
+        print(f"[GEN] {kind} {xsd_name} ns={xsd.target_ns} columns={len(fields)} paths={sum(map(len, fields.values()))}")
+
+    text = render(messages)
+    if args.check:
+        current = args.out.read_text(encoding="utf-8") if args.out.exists() else ""
+        if current != text:
+            print(f"[GEN] {args.out} n'est pas à jour (relancer sans --check)", file=sys.stderr)
+            return 1
+        print(f"[GEN] {args.out} à jour")
+        return 0
+
+    args.out.write_text(text, encoding="utf-8", newline="\n")
+    print(f"[GEN] written {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -47,7 +47,7 @@ CREATE TABLE [stg].[ESMA_INSTRUMENT_LISTING](
 	[HeaderReportingNCA] [nvarchar](255) COLLATE French_CI_AS NULL,
 	[HeaderReportingPeriodDate] [date] NULL,
 	[SourceFileName] [nvarchar](260) COLLATE French_CI_AS NULL,
-	[TechRcrdId] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TechRcrdId] [bigint] NULL,
 	[LoadDtmUTC] [datetime2](0) NOT NULL,
  CONSTRAINT [PK_stg_ESMA_INSTRUMENT_LISTING] PRIMARY KEY CLUSTERED 
 (
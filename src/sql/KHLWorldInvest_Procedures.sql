@@ -77,7 +77,16 @@ END
 SET ANSI_NULLS ON
 SET QUOTED_IDENTIFIER OFF
 
+/* -----------------------------------------------------------------------------
+   Instruments LISTING / DEBT / DERIVATIVE depuis stg.ESMA_FULINS_WIDE.
+   - @DltinsKeysOnly = 0 : reconstruction complète (repli de 03-LOAD_STG quand 02-BUILD_CSV n'a pas écrit
+     les BSV typés csv/INSTRUMENTS, sinon chargés directement par BULK INSERT) ;
+   - @DltinsKeysOnly = 1 : seules les clés (ISIN, MIC) présentes dans stg.ESMA_DLTINS_WIDE sont supprimées puis
+     recalculées, après application du DLTINS (stg.usp_Run_Daily_stg_Load).
+   Une PK (ISIN, MIC, ValidFromDate_PK) en double garde le TechRcrdId le plus grand, comme 02-BUILD_CSV.
+   ---------------------------------------------------------------------------- */
 CREATE PROCEDURE [stg].[usp_Load_ESMA_INSTRUMENTS_From_FULINS_WIDE]
+    @DltinsKeysOnly bit = 0
 AS
 BEGIN
     SET NOCOUNT ON;
@@ -93,7 +102,8 @@ BEGIN
         @Before_DerivCnt bigint,
         @After_ListCnt   bigint,
         @After_DebtCnt   bigint,
-        @After_DerivCnt  bigint;
+        @After_DerivCnt  bigint,
+        @DltKeyCnt       bigint = NULL;
 
     /* ========= BEGIN LOG ========= */
     INSERT INTO [AUDIT_BI].[log].[ESMA_Load_Log]
@@ -135,6 +145,7 @@ BEGIN
          N'BEFORE - instrument rebuild snapshot', N'BEFORE',
          CONCAT(
              N'LastFullValidFromDate=', CONVERT(varchar(10), @LastFullValidFromDate, 120),
+             N' | DltinsKeysOnly=', @DltinsKeysOnly,
              N' | LISTING=', @Before_ListCnt,
              N' | DEBT=', @Before_DebtCnt,
              N' | DERIVATIVE=', @Before_DerivCnt
@@ -144,15 +155,43 @@ BEGIN
         BEGIN TRAN;
 
         IF OBJECT_ID('tempdb..#base_dedup') IS NOT NULL DROP TABLE #base_dedup;
+        IF OBJECT_ID('tempdb..#dlt_keys') IS NOT NULL DROP TABLE #dlt_keys;
+
+        /* Clés touchées par le DLTINS du jour (mêmes trim / troncature que les colonnes cibles) */
+        CREATE TABLE #dlt_keys (
+            ISIN            varchar(12) COLLATE French_CI_AS NOT NULL,
+            TradingVenueMIC varchar(50) COLLATE French_CI_AS NOT NULL,
+            PRIMARY KEY (ISIN, TradingVenueMIC)
+        );
+
+        IF @DltinsKeysOnly = 1
+        BEGIN
+            INSERT INTO #dlt_keys (ISIN, TradingVenueMIC)
+            SELECT DISTINCT k.ISIN, k.TradingVenueMIC
+            FROM [stg].[ESMA_DLTINS_WIDE] d
+            CROSS APPLY (SELECT
+                ISIN            = CONVERT(varchar(12), NULLIF(LTRIM(RTRIM(CONVERT(nvarchar(255),d.ISIN))),N'')),
+                TradingVenueMIC = CONVERT(varchar(50), NULLIF(LTRIM(RTRIM(CONVERT(nvarchar(255),d.TradingVenueMIC))),N''))
+            ) k
+            WHERE k.ISIN IS NOT NULL AND k.TradingVenueMIC IS NOT NULL;
+
+            SET @DltKeyCnt = @@ROWCOUNT;
+        END;
         
         ;WITH base_full AS (
             SELECT 
                 HeaderReportingMarketId, HeaderReportingNCA, HeaderReportingPeriodDate, SourceFileName, TechRcrdId, ISIN, FullName, ShortName, CFI, CommodityDerivativeInd, NotionalCurrency, IssuerLEI, TradingVenueMIC, IssuerReqAdmission, AdmissionApprvlDate, ReqForAdmissionDate, FirstTradingDate, TerminationDate, TotalIssuedNominalAmount, TotalIssuedNominalAmountCcy, MaturityDate, NominalValuePerUnit, NominalValuePerUnitCcy, FixedRate, FloatRefRateISIN, FloatRefRateIndex, FloatTermUnit, FloatTermValue, FloatBasisPointSpread, DebtSeniority, ExpiryDate, PriceMultiplier, UnderlyingISIN, UnderlyingLEI, UnderlyingIndexRef, UnderlyingIndexTermUnit, UnderlyingIndexTermValue, OptionType, OptionExerciseStyle, DeliveryType, StrikePrice, StrikePriceCcy, StrikeNoPriceCcy, CmdtyBaseProduct, CmdtySubProduct, CmdtySubSubProduct, CmdtyTransactionType, CmdtyFinalPriceType, ValidFromDate, ValidToDate, LatestRecordFlag
             FROM (
                 SELECT HeaderReportingMarketId, HeaderReportingNCA, HeaderReportingPeriodDate, SourceFileName, TechRcrdId, ISIN, FullName, ShortName, CFI, CommodityDerivativeInd, NotionalCurrency, IssuerLEI, TradingVenueMIC, IssuerReqAdmission, AdmissionApprvlDate, ReqForAdmissionDate, FirstTradingDate, TerminationDate, TotalIssuedNominalAmount, TotalIssuedNominalAmountCcy, MaturityDate, NominalValuePerUnit, NominalValuePerUnitCcy, FixedRate, FloatRefRateISIN, FloatRefRateIndex, FloatTermUnit, FloatTermValue, FloatBasisPointSpread, DebtSeniority, ExpiryDate, PriceMultiplier, UnderlyingISIN, UnderlyingLEI, UnderlyingIndexRef, UnderlyingIndexTermUnit, UnderlyingIndexTermValue, OptionType, OptionExerciseStyle, DeliveryType, StrikePrice, StrikePriceCcy, StrikeNoPriceCcy, CmdtyBaseProduct, CmdtySubProduct, CmdtySubSubProduct, CmdtyTransactionType, CmdtyFinalPriceType, ValidFromDate, ValidToDate, LatestRecordFlag
-                    , ROW_NUMBER() OVER (PARTITION BY ISIN, IssuerLEI, TradingVenueMIC ORDER BY ValidFromDate DESC) rnk
+                    , ROW_NUMBER() OVER (PARTITION BY ISIN, TradingVenueMIC, COALESCE(ValidFromDate, CONVERT(date,'19000101')) ORDER BY TechRcrdId DESC) rnk
                 FROM [stg].[ESMA_FULINS_WIDE] a   
                 WHERE LatestRecordFlag = 1
+                  AND (@DltinsKeysOnly = 0 OR EXISTS (
+                        SELECT 1
+                        FROM #dlt_keys k
+                        WHERE k.ISIN = CONVERT(varchar(12), NULLIF(LTRIM(RTRIM(CONVERT(nvarchar(255),a.ISIN))),N''))
+                          AND k.TradingVenueMIC = CONVERT(varchar(50), NULLIF(LTRIM(RTRIM(CONVERT(nvarchar(255),a.TradingVenueMIC))),N''))
+                  ))
             ) a
             WHERE rnk = 1
         ),
@@ -161,7 +200,7 @@ BEGIN
                 ISIN_s = NULLIF(LTRIM(RTRIM(CONVERT(nvarchar(255),ISIN))),N''),
                 MIC_s  = NULLIF(LTRIM(RTRIM(CONVERT(nvarchar(255),TradingVenueMIC))),N''),
                 SourceFileName_s = NULLIF(LTRIM(RTRIM(CONVERT(nvarchar(255),SourceFileName))),N''),
-                TechRcrdId_s     = NULLIF(LTRIM(RTRIM(CONVERT(nvarchar(255),TechRcrdId))),N''),
+                TechRcrdId_i     = TRY_CONVERT(bigint, TechRcrdId),
                 FullName_s       = NULLIF(CONVERT(nvarchar(400),FullName),N''),
                 ShortName_s      = NULLIF(CONVERT(nvarchar(200),ShortName),N''),
                 CFI_s            = NULLIF(LTRIM(RTRIM(CONVERT(nvarchar(255),CFI))),N''),
@@ -238,7 +277,11 @@ BEGIN
         FROM base_typed;
 
         /* LISTING */
-        TRUNCATE TABLE stg.ESMA_INSTRUMENT_LISTING;
+        IF @DltinsKeysOnly = 0
+            TRUNCATE TABLE stg.ESMA_INSTRUMENT_LISTING;
+        ELSE
+            DELETE t FROM stg.ESMA_INSTRUMENT_LISTING t
+            WHERE EXISTS (SELECT 1 FROM #dlt_keys k WHERE k.ISIN = t.ISIN AND k.TradingVenueMIC = t.TradingVenueMIC);
 
         INSERT INTO stg.ESMA_INSTRUMENT_LISTING (
             ISIN, TradingVenueMIC,
@@ -278,11 +321,15 @@ BEGIN
             HeaderReportingNCA_s,
             HeaderReportingPeriodDate_d,
             CONVERT(nvarchar(260), SourceFileName_s),
-            TechRcrdId_s
+            TechRcrdId_i
         FROM #base_dedup;
 
         /* DEBT */
-        TRUNCATE TABLE stg.ESMA_INSTRUMENT_DEBT;
+        IF @DltinsKeysOnly = 0
+            TRUNCATE TABLE stg.ESMA_INSTRUMENT_DEBT;
+        ELSE
+            DELETE t FROM stg.ESMA_INSTRUMENT_DEBT t
+            WHERE EXISTS (SELECT 1 FROM #dlt_keys k WHERE k.ISIN = t.ISIN AND k.TradingVenueMIC = t.TradingVenueMIC);
 
         INSERT INTO stg.ESMA_INSTRUMENT_DEBT (
             ISIN, TradingVenueMIC,
@@ -315,7 +362,11 @@ BEGIN
         WHERE CFI_s IS NOT NULL AND LEFT(CFI_s,1) = 'D';
 
         /* DERIVATIVE */
-        TRUNCATE TABLE stg.ESMA_INSTRUMENT_DERIVATIVE;
+        IF @DltinsKeysOnly = 0
+            TRUNCATE TABLE stg.ESMA_INSTRUMENT_DERIVATIVE;
+        ELSE
+            DELETE t FROM stg.ESMA_INSTRUMENT_DERIVATIVE t
+            WHERE EXISTS (SELECT 1 FROM #dlt_keys k WHERE k.ISIN = t.ISIN AND k.TradingVenueMIC = t.TradingVenueMIC);
 
         INSERT INTO stg.ESMA_INSTRUMENT_DERIVATIVE (
             ISIN, TradingVenueMIC,
@@ -359,12 +410,14 @@ BEGIN
             OR CmdtyBaseProduct_s IS NOT NULL;
 
         DROP TABLE #base_dedup;
+        DROP TABLE #dlt_keys;
 
         COMMIT;
     END TRY
     BEGIN CATCH
         IF @@TRANCOUNT > 0 ROLLBACK;
         IF OBJECT_ID('tempdb..#base_dedup') IS NOT NULL DROP TABLE #base_dedup;
+        IF OBJECT_ID('tempdb..#dlt_keys') IS NOT NULL DROP TABLE #dlt_keys;
 
         INSERT INTO [AUDIT_BI].[log].[ESMA_Load_Log]
             (ScriptName, LaunchTimestamp, EndTime, Message, Element, Complement)
@@ -389,6 +442,8 @@ BEGIN
          N'AFTER - instrument rebuild snapshot', N'AFTER',
          CONCAT(
              N'LastFullValidFromDate=', CONVERT(varchar(10), @LastFullValidFromDate, 120),
+             N' | DltinsKeysOnly=', @DltinsKeysOnly,
+             N' | DltinsKeys=', @DltKeyCnt,
              N' | LISTING=', @After_ListCnt,
              N' | DEBT=', @After_DebtCnt,
              N' | DERIVATIVE=', @After_DerivCnt
@@ -432,23 +487,17 @@ BEGIN
 	COMMIT TRANSACTION update_ESMA_DLTINS 
 	    IF OBJECT_ID('tempdb..#D') IS NOT NULL DROP TABLE #D;
 
-        ;WITH D0 AS (
-            SELECT
-                d.*,
-                VF   = TRY_CONVERT(date, LEFT(coalesce(d.ValidFromDate,d.HeaderReportingPeriodDate), 10)),
-                TERM = TRY_CONVERT(date, LEFT(d.TerminationDate, 10)),
-                RN = ROW_NUMBER() OVER (
-                    PARTITION BY d.ISIN, d.TradingVenueMIC, LEFT(d.ValidFromDate,10), d.ActionType
-                    ORDER BY TRY_CONVERT(bigint, d.TechRcrdId) DESC
-                )
-            FROM stg.ESMA_DLTINS_WIDE d
-            WHERE d.ISIN IS NOT NULL
-              AND d.TradingVenueMIC IS NOT NULL
-        )
-        SELECT *
+        /* Une ligne par (ISIN, TradingVenueMIC, VF, ActionType) : dédoublonnage fait en amont par 02-BUILD_CSV
+           (DltinsDedup, même règle que l'ancien ROW_NUMBER ... ORDER BY TRY_CONVERT(bigint, TechRcrdId) DESC) */
+        SELECT
+            d.*,
+            VF   = TRY_CONVERT(date, LEFT(coalesce(d.ValidFromDate,d.HeaderReportingPeriodDate), 10)),
+            TERM = TRY_CONVERT(date, LEFT(d.TerminationDate, 10))
         INTO #D
-        FROM D0
-        WHERE RN = 1 AND VF IS NOT NULL;
+        FROM stg.ESMA_DLTINS_WIDE d
+        WHERE d.ISIN IS NOT NULL
+          AND d.TradingVenueMIC IS NOT NULL
+          AND TRY_CONVERT(date, LEFT(coalesce(d.ValidFromDate,d.HeaderReportingPeriodDate), 10)) IS NOT NULL;
 
         CREATE INDEX IX_D_BK ON #D (ISIN, TradingVenueMIC, VF, ActionType);
 
@@ -526,6 +575,24 @@ BEGIN
 
         EXEC(@insSql);
 
+        /* Trace des fichiers DLTINS appliqués : chaîne continue => mode delta-only possible (01-GET_FILES) */
+        SET @step = N'TRACE APPLIED';
+        MERGE stg.ESMA_DLTINS_APPLIED AS t
+        USING (
+            SELECT SourceFileName,
+                   FileDate = TRY_CONVERT(date, SUBSTRING(SourceFileName, 8, 8)),
+                   [RowCount] = COUNT_BIG(*)
+            FROM stg.ESMA_DLTINS_WIDE
+            WHERE SourceFileName LIKE 'DLTINS[_]%'
+            GROUP BY SourceFileName
+        ) AS s
+        ON t.SourceFileName = s.SourceFileName
+        WHEN MATCHED THEN
+            UPDATE SET t.[RowCount] = s.[RowCount], t.AppliedDtmUTC = SYSUTCDATETIME()
+        WHEN NOT MATCHED THEN
+            INSERT (SourceFileName, FileDate, [RowCount], AppliedDtmUTC)
+            VALUES (s.SourceFileName, s.FileDate, s.[RowCount], SYSUTCDATETIME());
+
         SET @step = N'DONE';
         DECLARE @openCnt int = (SELECT COUNT(*) FROM stg.ESMA_FULINS_WIDE WHERE LatestRecordFlag = 1 AND ValidToDate IS NULL);
          DECLARE @horodatage2 datetime2(0)=SYSUTCDATETIME();
@@ -556,6 +623,139 @@ BEGIN
     END CATCH
 END
 
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+
+/* -----------------------------------------------------------------------------
+   FULL incrémental : applique stg.ESMA_FULINS_DIFF (jeu NEW / MOD / TERM calculé par 02-BUILD_CSV contre
+   l'index d'empreintes du FULL précédent) à stg.ESMA_FULINS_WIDE, au lieu de TRUNCATE + rechargement complet.
+   - NEW / MOD / TERM : la ligne courante de la clé (ISIN, MIC) est fermée à ValidFromDate - 1 ;
+   - NEW / MOD : la ligne du nouveau FULL est insérée (LatestRecordFlag = 1, ValidToDate NULL).
+   Rejouable : une clé NEW / MOD dont la ligne courante porte déjà la ValidFromDate du diff est ignorée.
+   ---------------------------------------------------------------------------- */
+CREATE PROCEDURE [stg].[usp_Apply_FULINS_Diff]
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+
+    DECLARE @proc nvarchar(200) = N'stg.usp_Apply_FULINS_Diff';
+    DECLARE @step nvarchar(200) = N'START';
+    DECLARE @horodatage datetime2(0) = SYSUTCDATETIME();
+    DECLARE @skipped bigint = 0, @closed bigint = 0, @inserted bigint = 0;
+
+    BEGIN TRY
+        EXEC log.usp_ESMA_WriteLog
+            @ProcessName=@proc,
+            @StepName=@step,
+            @LogLevel=N'INFO',
+            @Message=N'START apply FULINS diff -> FULINS',
+            @EventUTC=@horodatage,
+            @RowCount=NULL,
+            @DetailsJson=NULL;
+
+        IF OBJECT_ID('tempdb..#D') IS NOT NULL DROP TABLE #D;
+
+        /* Une ligne par (ISIN, TradingVenueMIC) : dédoublonnage fait par l'index d'empreintes de 02-BUILD_CSV */
+        SELECT d.*
+        INTO #D
+        FROM stg.ESMA_FULINS_DIFF d
+        WHERE d.ISIN IS NOT NULL
+          AND d.TradingVenueMIC IS NOT NULL
+          AND d.ValidFromDate IS NOT NULL
+          AND d.ActionType IN ('NEW','MOD','TERM');
+
+        CREATE INDEX IX_D_BK ON #D (ISIN, TradingVenueMIC);
+
+        /* Relance : diff déjà appliqué pour cette clé */
+        SET @step = N'SKIP APPLIED';
+        DELETE d
+        FROM #D d
+        WHERE d.ActionType IN ('NEW','MOD')
+          AND EXISTS (
+                SELECT 1
+                FROM stg.ESMA_FULINS_WIDE f
+                WHERE f.ISIN = d.ISIN
+                  AND f.TradingVenueMIC = d.TradingVenueMIC
+                  AND f.ValidToDate IS NULL
+                  AND f.LatestRecordFlag = 1
+                  AND f.ValidFromDate = d.ValidFromDate
+          );
+        SET @skipped = @@ROWCOUNT;
+
+        BEGIN TRANSACTION;
+
+        /* NEW / MOD / TERM : close current at VF-1 */
+        SET @step = N'CLOSE CURRENT';
+        UPDATE f
+            SET f.ValidToDate = DATEADD(day, -1, d.ValidFromDate),
+                f.LatestRecordFlag = 0
+        FROM stg.ESMA_FULINS_WIDE f
+        JOIN #D d
+          ON f.ISIN = d.ISIN
+         AND f.TradingVenueMIC = d.TradingVenueMIC
+        WHERE f.ValidToDate IS NULL
+          AND f.LatestRecordFlag = 1;
+        SET @closed = @@ROWCOUNT;
+
+        /* Insert NEW + MOD rows (TERM is close-only) */
+        SET @step = N'INSERT NEW/MOD';
+
+        DECLARE @cols nvarchar(max);
+
+        SELECT @cols = STUFF((
+            SELECT N',' + QUOTENAME(c.name)
+            FROM sys.columns c
+            WHERE c.object_id = OBJECT_ID('stg.ESMA_FULINS_WIDE')
+              AND c.name NOT IN ('ValidToDate','LatestRecordFlag')
+            ORDER BY c.column_id
+            FOR XML PATH(''), TYPE
+        ).value('.','nvarchar(max)'), 1, 1, N'');
+
+        DECLARE @insSql nvarchar(max) =
+            N'INSERT INTO stg.ESMA_FULINS_WIDE (' + @cols + N',[ValidToDate],[LatestRecordFlag]) ' +
+            N'SELECT ' + @cols + N', NULL, 1 ' +
+            N'FROM #D ' +
+            N'WHERE ActionType IN (''NEW'',''MOD'');';
+
+        EXEC(@insSql);
+        SET @inserted = (SELECT COUNT_BIG(*) FROM #D WHERE ActionType IN ('NEW','MOD'));
+
+        COMMIT TRANSACTION;
+        DROP TABLE #D;
+
+        SET @step = N'DONE';
+        DECLARE @details nvarchar(4000) = CONCAT(N'{"skipped":', @skipped, N',"closed":', @closed, N',"inserted":', @inserted, N'}');
+        DECLARE @horodatage2 datetime2(0) = SYSUTCDATETIME();
+        EXEC log.usp_ESMA_WriteLog
+            @ProcessName=@proc,
+            @StepName=@step,
+            @LogLevel=N'INFO',
+            @Message=N'DONE apply FULINS diff -> FULINS',
+            @EventUTC=@horodatage2,
+            @RowCount=@inserted,
+            @DetailsJson=@details;
+
+    END TRY
+    BEGIN CATCH
+        IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;
+        IF OBJECT_ID('tempdb..#D') IS NOT NULL DROP TABLE #D;
+
+        DECLARE @err_msg nvarchar(300) = CONCAT(N'|ERROR :', ERROR_NUMBER(), N' step: ', @step, N' line: ', ERROR_LINE(),
+                                                N' Message: ', LEFT(ERROR_MESSAGE(), 200));
+        DECLARE @horodatage_err datetime2(0) = SYSUTCDATETIME();
+        EXEC log.usp_ESMA_WriteLog
+            @ProcessName=@proc,
+            @StepName=N'FAILED',
+            @LogLevel=N'ERROR',
+            @Message=@err_msg,
+            @EventUTC=@horodatage_err,
+            @RowCount=NULL,
+            @DetailsJson=NULL;
+        THROW;
+    END CATCH
+END
+
 SET ANSI_NULLS ON
 SET QUOTED_IDENTIFIER OFF
 
@@ -589,7 +789,8 @@ BEGIN
         VALUES (@ScriptName,@LaunchTs,@StartStep,N'STEP: EXEC stg.usp_Process_DLTINS_Daily (before)',N'stg.ESMA_FULINS_WIDE',CONCAT(N'rowcount_before=',@rc_before));
 
         EXEC [stg].[usp_Process_DLTINS_Daily];
-        EXEC [stg].[usp_Load_ESMA_INSTRUMENTS_From_FULINS_WIDE];
+        -- instruments déjà chargés depuis le FULL par 03-LOAD_STG : seules les clés du DLTINS sont recalculées
+        EXEC [stg].[usp_Load_ESMA_INSTRUMENTS_From_FULINS_WIDE] @DltinsKeysOnly = 1;
         
         SELECT @rc_after = COALESCE(SUM(row_count),0)
         FROM sys.dm_db_partition_stats
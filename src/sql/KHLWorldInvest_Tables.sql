@@ -160,7 +160,7 @@ CREATE TABLE [stg].[ESMA_INSTRUMENT_LISTING](
 	[HeaderReportingNCA] [nvarchar](255) COLLATE French_CI_AS NULL,
 	[HeaderReportingPeriodDate] [date] NULL,
 	[SourceFileName] [nvarchar](260) COLLATE French_CI_AS NULL,
-	[TechRcrdId] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TechRcrdId] [bigint] NULL,
 	[LoadDtmUTC] [datetime2](0) NOT NULL,
  CONSTRAINT [PK_stg_ESMA_INSTRUMENT_LISTING] PRIMARY KEY CLUSTERED 
 (
@@ -243,7 +243,7 @@ CREATE TABLE [stg].[ESMA_FULINS_WIDE](
 	[HeaderReportingNCA] [nvarchar](255) COLLATE French_CI_AS NULL,
 	[HeaderReportingPeriodDate] [nvarchar](255) COLLATE French_CI_AS NULL,
 	[SourceFileName] [nvarchar](255) COLLATE French_CI_AS NULL,
-	[TechRcrdId] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TechRcrdId] [bigint] NULL,
 	[ISIN] [nvarchar](255) COLLATE French_CI_AS NULL,
 	[FullName] [nvarchar](255) COLLATE French_CI_AS NULL,
 	[ShortName] [nvarchar](255) COLLATE French_CI_AS NULL,
@@ -299,7 +299,7 @@ CREATE TABLE [stg].[ESMA_DLTINS_WIDE](
 	[HeaderReportingNCA] [nvarchar](50) COLLATE French_CI_AS NULL,
 	[HeaderReportingPeriodDate] [nvarchar](50) COLLATE French_CI_AS NULL,
 	[SourceFileName] [nvarchar](260) COLLATE French_CI_AS NULL,
-	[TechRcrdId] [nvarchar](64) COLLATE French_CI_AS NULL,
+	[TechRcrdId] [bigint] NULL,
 	[ISIN] [nvarchar](12) COLLATE French_CI_AS NULL,
 	[FullName] [nvarchar](500) COLLATE French_CI_AS NULL,
 	[ShortName] [nvarchar](200) COLLATE French_CI_AS NULL,
@@ -349,6 +349,19 @@ CREATE TABLE [stg].[ESMA_DLTINS_WIDE](
 	[ActionType] [varchar](10) COLLATE French_CI_AS NOT NULL
 ) ON [PRIMARY]
 
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+CREATE TABLE [stg].[ESMA_DLTINS_APPLIED](
+	[SourceFileName] [nvarchar](260) COLLATE French_CI_AS NOT NULL,
+	[FileDate] [date] NULL,
+	[RowCount] [bigint] NOT NULL,
+	[AppliedDtmUTC] [datetime2](0) NOT NULL,
+ CONSTRAINT [PK_stg_ESMA_DLTINS_APPLIED] PRIMARY KEY CLUSTERED 
+(
+	[SourceFileName] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+) ON [PRIMARY]
+
 ALTER TABLE [log].[ESMA_Load_Log] ADD  CONSTRAINT [DF_ESMA_Load_Log_CreatedOn]  DEFAULT (sysdatetime()) FOR [CreatedOn]
 ALTER TABLE [stg].[ESMA_INSTRUMENT_LISTING] ADD  CONSTRAINT [DF_stg_ESMA_INSTRUMENT_LISTING_ValidFromDatePK]  DEFAULT (CONVERT([date],'19000101')) FOR [ValidFromDate_PK]
 ALTER TABLE [stg].[ESMA_INSTRUMENT_LISTING] ADD  CONSTRAINT [DF_stg_ESMA_INSTRUMENT_LISTING_LoadDtmUTC]  DEFAULT (sysutcdatetime()) FOR [LoadDtmUTC]
@@ -356,3 +369,596 @@ ALTER TABLE [stg].[ESMA_INSTRUMENT_DERIVATIVE] ADD  CONSTRAINT [DF_stg_ESMA_INST
 ALTER TABLE [stg].[ESMA_INSTRUMENT_DERIVATIVE] ADD  CONSTRAINT [DF_stg_ESMA_INSTRUMENT_DERIV_LoadDtmUTC]  DEFAULT (sysutcdatetime()) FOR [LoadDtmUTC]
 ALTER TABLE [stg].[ESMA_INSTRUMENT_DEBT] ADD  CONSTRAINT [DF_stg_ESMA_INSTRUMENT_DEBT_ValidFromDatePK]  DEFAULT (CONVERT([date],'19000101')) FOR [ValidFromDate_PK]
 ALTER TABLE [stg].[ESMA_INSTRUMENT_DEBT] ADD  CONSTRAINT [DF_stg_ESMA_INSTRUMENT_DEBT_LoadDtmUTC]  DEFAULT (sysutcdatetime()) FOR [LoadDtmUTC]
+ALTER TABLE [stg].[ESMA_DLTINS_APPLIED] ADD  CONSTRAINT [DF_stg_ESMA_DLTINS_APPLIED_AppliedDtmUTC]  DEFAULT (sysutcdatetime()) FOR [AppliedDtmUTC]
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Cible BULK INSERT de 03-LOAD_STG (BSV typés de 02-BUILD_CSV) : toutes les colonnes sauf LoadDtmUTC (défaut) */
+CREATE VIEW [stg].[v_ESMA_INSTRUMENT_LISTING_LOAD]
+AS
+SELECT
+    [ISIN], [TradingVenueMIC], [ValidFromDate], [ValidToDate], [LatestRecordFlag], [ValidFromDate_PK],
+    [FullName], [ShortName], [CFI], [CommodityDerivativeInd], [NotionalCurrency], [IssuerLEI],
+    [IssuerReqAdmission], [AdmissionApprvlDate], [ReqForAdmissionDate], [FirstTradingDate],
+    [TerminationDate], [CmdtyBaseProduct], [CmdtySubProduct], [CmdtySubSubProduct], [CmdtyTransactionType],
+    [CmdtyFinalPriceType], [HeaderReportingMarketId], [HeaderReportingNCA], [HeaderReportingPeriodDate],
+    [SourceFileName], [TechRcrdId]
+FROM [stg].[ESMA_INSTRUMENT_LISTING];
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Cible BULK INSERT de 03-LOAD_STG (BSV typés de 02-BUILD_CSV) : toutes les colonnes sauf LoadDtmUTC (défaut) */
+CREATE VIEW [stg].[v_ESMA_INSTRUMENT_DEBT_LOAD]
+AS
+SELECT
+    [ISIN], [TradingVenueMIC], [ValidFromDate], [ValidToDate], [LatestRecordFlag], [ValidFromDate_PK],
+    [TotalIssuedNominalAmount], [TotalIssuedNominalAmountCcy], [MaturityDate], [NominalValuePerUnit],
+    [NominalValuePerUnitCcy], [FixedRate], [FloatRefRateISIN], [FloatRefRateIndex], [FloatTermUnit],
+    [FloatTermValue], [FloatBasisPointSpread], [DebtSeniority]
+FROM [stg].[ESMA_INSTRUMENT_DEBT];
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Cible BULK INSERT de 03-LOAD_STG (BSV typés de 02-BUILD_CSV) : toutes les colonnes sauf LoadDtmUTC (défaut) */
+CREATE VIEW [stg].[v_ESMA_INSTRUMENT_DERIVATIVE_LOAD]
+AS
+SELECT
+    [ISIN], [TradingVenueMIC], [ValidFromDate], [ValidToDate], [LatestRecordFlag], [ValidFromDate_PK],
+    [ExpiryDate], [PriceMultiplier], [UnderlyingISIN], [UnderlyingLEI], [UnderlyingIndexRef],
+    [UnderlyingIndexTermUnit], [UnderlyingIndexTermValue], [OptionType], [OptionExerciseStyle],
+    [DeliveryType], [StrikePrice], [StrikePriceCcy], [StrikeNoPriceCcy], [CmdtyBaseProduct],
+    [CmdtySubProduct], [CmdtySubSubProduct], [CmdtyTransactionType], [CmdtyFinalPriceType]
+FROM [stg].[ESMA_INSTRUMENT_DERIVATIVE];
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Table fantôme de 03-LOAD_STG ([ESMA] load_swap) : chargée puis échangée avec [stg].[ESMA_FULINS_WIDE] par ALTER TABLE ... SWITCH (même structure, même filegroup) */
+CREATE TABLE [stg].[ESMA_FULINS_WIDE__next](
+	[HeaderReportingMarketId] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[HeaderReportingNCA] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[HeaderReportingPeriodDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[SourceFileName] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TechRcrdId] [bigint] NULL,
+	[ISIN] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FullName] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[ShortName] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CFI] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CommodityDerivativeInd] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[NotionalCurrency] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[IssuerLEI] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TradingVenueMIC] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[IssuerReqAdmission] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[AdmissionApprvlDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[ReqForAdmissionDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FirstTradingDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TerminationDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TotalIssuedNominalAmount] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TotalIssuedNominalAmountCcy] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[MaturityDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[NominalValuePerUnit] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[NominalValuePerUnitCcy] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FixedRate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatRefRateISIN] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatRefRateIndex] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatTermUnit] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatTermValue] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatBasisPointSpread] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[DebtSeniority] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[ExpiryDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[PriceMultiplier] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingISIN] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingLEI] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexRef] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermUnit] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermValue] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[OptionType] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[OptionExerciseStyle] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[DeliveryType] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[StrikePrice] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[StrikePriceCcy] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[StrikeNoPriceCcy] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtyBaseProduct] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtySubProduct] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtySubSubProduct] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtyTransactionType] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtyFinalPriceType] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[ValidFromDate] [date] NULL,
+	[ValidToDate] [date] NULL,
+	[LatestRecordFlag] [bit] NULL
+) ON [PRIMARY]
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Réceptacle vide de l'échange (ALTER TABLE ... SWITCH) de [stg].[ESMA_FULINS_WIDE] par ALTER TABLE ... SWITCH (même structure, même filegroup) */
+CREATE TABLE [stg].[ESMA_FULINS_WIDE__old](
+	[HeaderReportingMarketId] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[HeaderReportingNCA] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[HeaderReportingPeriodDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[SourceFileName] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TechRcrdId] [bigint] NULL,
+	[ISIN] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FullName] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[ShortName] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CFI] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CommodityDerivativeInd] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[NotionalCurrency] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[IssuerLEI] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TradingVenueMIC] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[IssuerReqAdmission] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[AdmissionApprvlDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[ReqForAdmissionDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FirstTradingDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TerminationDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TotalIssuedNominalAmount] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TotalIssuedNominalAmountCcy] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[MaturityDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[NominalValuePerUnit] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[NominalValuePerUnitCcy] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FixedRate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatRefRateISIN] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatRefRateIndex] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatTermUnit] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatTermValue] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatBasisPointSpread] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[DebtSeniority] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[ExpiryDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[PriceMultiplier] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingISIN] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingLEI] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexRef] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermUnit] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermValue] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[OptionType] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[OptionExerciseStyle] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[DeliveryType] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[StrikePrice] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[StrikePriceCcy] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[StrikeNoPriceCcy] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtyBaseProduct] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtySubProduct] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtySubSubProduct] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtyTransactionType] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtyFinalPriceType] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[ValidFromDate] [date] NULL,
+	[ValidToDate] [date] NULL,
+	[LatestRecordFlag] [bit] NULL
+) ON [PRIMARY]
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Table fantôme de 03-LOAD_STG ([ESMA] load_swap) : chargée puis échangée avec [stg].[ESMA_DLTINS_WIDE] par ALTER TABLE ... SWITCH (même structure, même filegroup) */
+CREATE TABLE [stg].[ESMA_DLTINS_WIDE__next](
+	[HeaderReportingMarketId] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[HeaderReportingNCA] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[HeaderReportingPeriodDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[SourceFileName] [nvarchar](260) COLLATE French_CI_AS NULL,
+	[TechRcrdId] [bigint] NULL,
+	[ISIN] [nvarchar](12) COLLATE French_CI_AS NULL,
+	[FullName] [nvarchar](500) COLLATE French_CI_AS NULL,
+	[ShortName] [nvarchar](200) COLLATE French_CI_AS NULL,
+	[CFI] [nvarchar](20) COLLATE French_CI_AS NULL,
+	[CommodityDerivativeInd] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[NotionalCurrency] [nvarchar](3) COLLATE French_CI_AS NULL,
+	[IssuerLEI] [nvarchar](20) COLLATE French_CI_AS NULL,
+	[TradingVenueMIC] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[IssuerReqAdmission] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[AdmissionApprvlDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[ReqForAdmissionDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[FirstTradingDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[TerminationDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[TotalIssuedNominalAmount] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[TotalIssuedNominalAmountCcy] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[MaturityDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[NominalValuePerUnit] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[NominalValuePerUnitCcy] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[FixedRate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[FloatRefRateISIN] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[FloatRefRateIndex] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[FloatTermUnit] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[FloatTermValue] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[FloatBasisPointSpread] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[DebtSeniority] [nvarchar](20) COLLATE French_CI_AS NULL,
+	[ExpiryDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[PriceMultiplier] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[UnderlyingISIN] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[UnderlyingLEI] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexRef] [nvarchar](200) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermUnit] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermValue] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[OptionType] [nvarchar](20) COLLATE French_CI_AS NULL,
+	[OptionExerciseStyle] [nvarchar](20) COLLATE French_CI_AS NULL,
+	[DeliveryType] [nvarchar](20) COLLATE French_CI_AS NULL,
+	[StrikePrice] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[StrikePriceCcy] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[StrikeNoPriceCcy] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[CmdtyBaseProduct] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[CmdtySubProduct] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[CmdtySubSubProduct] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[CmdtyTransactionType] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[CmdtyFinalPriceType] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[ValidFromDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[ValidToDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[LatestRecordFlag] [bit] NULL,
+	[ActionType] [varchar](10) COLLATE French_CI_AS NOT NULL
+) ON [PRIMARY]
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Réceptacle vide de l'échange (ALTER TABLE ... SWITCH) de [stg].[ESMA_DLTINS_WIDE] par ALTER TABLE ... SWITCH (même structure, même filegroup) */
+CREATE TABLE [stg].[ESMA_DLTINS_WIDE__old](
+	[HeaderReportingMarketId] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[HeaderReportingNCA] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[HeaderReportingPeriodDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[SourceFileName] [nvarchar](260) COLLATE French_CI_AS NULL,
+	[TechRcrdId] [bigint] NULL,
+	[ISIN] [nvarchar](12) COLLATE French_CI_AS NULL,
+	[FullName] [nvarchar](500) COLLATE French_CI_AS NULL,
+	[ShortName] [nvarchar](200) COLLATE French_CI_AS NULL,
+	[CFI] [nvarchar](20) COLLATE French_CI_AS NULL,
+	[CommodityDerivativeInd] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[NotionalCurrency] [nvarchar](3) COLLATE French_CI_AS NULL,
+	[IssuerLEI] [nvarchar](20) COLLATE French_CI_AS NULL,
+	[TradingVenueMIC] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[IssuerReqAdmission] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[AdmissionApprvlDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[ReqForAdmissionDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[FirstTradingDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[TerminationDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[TotalIssuedNominalAmount] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[TotalIssuedNominalAmountCcy] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[MaturityDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[NominalValuePerUnit] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[NominalValuePerUnitCcy] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[FixedRate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[FloatRefRateISIN] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[FloatRefRateIndex] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[FloatTermUnit] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[FloatTermValue] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[FloatBasisPointSpread] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[DebtSeniority] [nvarchar](20) COLLATE French_CI_AS NULL,
+	[ExpiryDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[PriceMultiplier] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[UnderlyingISIN] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[UnderlyingLEI] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexRef] [nvarchar](200) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermUnit] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermValue] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[OptionType] [nvarchar](20) COLLATE French_CI_AS NULL,
+	[OptionExerciseStyle] [nvarchar](20) COLLATE French_CI_AS NULL,
+	[DeliveryType] [nvarchar](20) COLLATE French_CI_AS NULL,
+	[StrikePrice] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[StrikePriceCcy] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[StrikeNoPriceCcy] [nvarchar](10) COLLATE French_CI_AS NULL,
+	[CmdtyBaseProduct] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[CmdtySubProduct] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[CmdtySubSubProduct] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[CmdtyTransactionType] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[CmdtyFinalPriceType] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[ValidFromDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[ValidToDate] [nvarchar](50) COLLATE French_CI_AS NULL,
+	[LatestRecordFlag] [bit] NULL,
+	[ActionType] [varchar](10) COLLATE French_CI_AS NOT NULL
+) ON [PRIMARY]
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Table fantôme de 03-LOAD_STG ([ESMA] load_swap) : chargée puis échangée avec [stg].[ESMA_INSTRUMENT_LISTING] par ALTER TABLE ... SWITCH (même structure, même filegroup) */
+CREATE TABLE [stg].[ESMA_INSTRUMENT_LISTING__next](
+	[ISIN] [varchar](12) COLLATE French_CI_AS NOT NULL,
+	[TradingVenueMIC] [varchar](50) COLLATE French_CI_AS NOT NULL,
+	[ValidFromDate] [date] NULL,
+	[ValidToDate] [date] NULL,
+	[LatestRecordFlag] [bit] NULL,
+	[ValidFromDate_PK] [date] NOT NULL,
+	[FullName] [nvarchar](400) COLLATE French_CI_AS NULL,
+	[ShortName] [nvarchar](200) COLLATE French_CI_AS NULL,
+	[CFI] [varchar](6) COLLATE French_CI_AS NULL,
+	[CommodityDerivativeInd] [bit] NULL,
+	[NotionalCurrency] [varchar](10) COLLATE French_CI_AS NULL,
+	[IssuerLEI] [varchar](50) COLLATE French_CI_AS NULL,
+	[IssuerReqAdmission] [bit] NULL,
+	[AdmissionApprvlDate] [date] NULL,
+	[ReqForAdmissionDate] [date] NULL,
+	[FirstTradingDate] [date] NULL,
+	[TerminationDate] [date] NULL,
+	[CmdtyBaseProduct] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtySubProduct] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtySubSubProduct] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtyTransactionType] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtyFinalPriceType] [varchar](50) COLLATE French_CI_AS NULL,
+	[HeaderReportingMarketId] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[HeaderReportingNCA] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[HeaderReportingPeriodDate] [date] NULL,
+	[SourceFileName] [nvarchar](260) COLLATE French_CI_AS NULL,
+	[TechRcrdId] [bigint] NULL,
+	[LoadDtmUTC] [datetime2](0) NOT NULL,
+ CONSTRAINT [PK_stg_ESMA_INSTRUMENT_LISTING__next] PRIMARY KEY CLUSTERED 
+(
+	[ISIN] ASC,
+	[TradingVenueMIC] ASC,
+	[ValidFromDate_PK] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+) ON [PRIMARY]
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Réceptacle vide de l'échange (ALTER TABLE ... SWITCH) de [stg].[ESMA_INSTRUMENT_LISTING] par ALTER TABLE ... SWITCH (même structure, même filegroup) */
+CREATE TABLE [stg].[ESMA_INSTRUMENT_LISTING__old](
+	[ISIN] [varchar](12) COLLATE French_CI_AS NOT NULL,
+	[TradingVenueMIC] [varchar](50) COLLATE French_CI_AS NOT NULL,
+	[ValidFromDate] [date] NULL,
+	[ValidToDate] [date] NULL,
+	[LatestRecordFlag] [bit] NULL,
+	[ValidFromDate_PK] [date] NOT NULL,
+	[FullName] [nvarchar](400) COLLATE French_CI_AS NULL,
+	[ShortName] [nvarchar](200) COLLATE French_CI_AS NULL,
+	[CFI] [varchar](6) COLLATE French_CI_AS NULL,
+	[CommodityDerivativeInd] [bit] NULL,
+	[NotionalCurrency] [varchar](10) COLLATE French_CI_AS NULL,
+	[IssuerLEI] [varchar](50) COLLATE French_CI_AS NULL,
+	[IssuerReqAdmission] [bit] NULL,
+	[AdmissionApprvlDate] [date] NULL,
+	[ReqForAdmissionDate] [date] NULL,
+	[FirstTradingDate] [date] NULL,
+	[TerminationDate] [date] NULL,
+	[CmdtyBaseProduct] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtySubProduct] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtySubSubProduct] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtyTransactionType] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtyFinalPriceType] [varchar](50) COLLATE French_CI_AS NULL,
+	[HeaderReportingMarketId] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[HeaderReportingNCA] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[HeaderReportingPeriodDate] [date] NULL,
+	[SourceFileName] [nvarchar](260) COLLATE French_CI_AS NULL,
+	[TechRcrdId] [bigint] NULL,
+	[LoadDtmUTC] [datetime2](0) NOT NULL,
+ CONSTRAINT [PK_stg_ESMA_INSTRUMENT_LISTING__old] PRIMARY KEY CLUSTERED 
+(
+	[ISIN] ASC,
+	[TradingVenueMIC] ASC,
+	[ValidFromDate_PK] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+) ON [PRIMARY]
+
+ALTER TABLE [stg].[ESMA_INSTRUMENT_LISTING__next] ADD  CONSTRAINT [DF_stg_ESMA_INSTRUMENT_LISTING__next_ValidFromDatePK]  DEFAULT (CONVERT([date],'19000101')) FOR [ValidFromDate_PK]
+ALTER TABLE [stg].[ESMA_INSTRUMENT_LISTING__next] ADD  CONSTRAINT [DF_stg_ESMA_INSTRUMENT_LISTING__next_LoadDtmUTC]  DEFAULT (sysutcdatetime()) FOR [LoadDtmUTC]
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Cible BULK INSERT de 03-LOAD_STG avec [ESMA] load_swap : [stg].[ESMA_INSTRUMENT_LISTING__next] sauf LoadDtmUTC (défaut) */
+CREATE VIEW [stg].[v_ESMA_INSTRUMENT_LISTING_LOAD__next]
+AS
+SELECT
+    [ISIN], [TradingVenueMIC], [ValidFromDate], [ValidToDate], [LatestRecordFlag], [ValidFromDate_PK],
+    [FullName], [ShortName], [CFI], [CommodityDerivativeInd], [NotionalCurrency], [IssuerLEI],
+    [IssuerReqAdmission], [AdmissionApprvlDate], [ReqForAdmissionDate], [FirstTradingDate],
+    [TerminationDate], [CmdtyBaseProduct], [CmdtySubProduct], [CmdtySubSubProduct], [CmdtyTransactionType],
+    [CmdtyFinalPriceType], [HeaderReportingMarketId], [HeaderReportingNCA], [HeaderReportingPeriodDate],
+    [SourceFileName], [TechRcrdId]
+FROM [stg].[ESMA_INSTRUMENT_LISTING__next];
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Table fantôme de 03-LOAD_STG ([ESMA] load_swap) : chargée puis échangée avec [stg].[ESMA_INSTRUMENT_DEBT] par ALTER TABLE ... SWITCH (même structure, même filegroup) */
+CREATE TABLE [stg].[ESMA_INSTRUMENT_DEBT__next](
+	[ISIN] [varchar](12) COLLATE French_CI_AS NOT NULL,
+	[TradingVenueMIC] [varchar](50) COLLATE French_CI_AS NOT NULL,
+	[ValidFromDate] [date] NULL,
+	[ValidToDate] [date] NULL,
+	[LatestRecordFlag] [bit] NULL,
+	[ValidFromDate_PK] [date] NOT NULL,
+	[TotalIssuedNominalAmount] [decimal](38, 10) NULL,
+	[TotalIssuedNominalAmountCcy] [varchar](10) COLLATE French_CI_AS NULL,
+	[MaturityDate] [date] NULL,
+	[NominalValuePerUnit] [decimal](38, 10) NULL,
+	[NominalValuePerUnitCcy] [varchar](10) COLLATE French_CI_AS NULL,
+	[FixedRate] [decimal](38, 10) NULL,
+	[FloatRefRateISIN] [varchar](12) COLLATE French_CI_AS NULL,
+	[FloatRefRateIndex] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatTermUnit] [varchar](10) COLLATE French_CI_AS NULL,
+	[FloatTermValue] [int] NULL,
+	[FloatBasisPointSpread] [decimal](38, 10) NULL,
+	[DebtSeniority] [nvarchar](100) COLLATE French_CI_AS NULL,
+	[LoadDtmUTC] [datetime2](0) NOT NULL,
+ CONSTRAINT [PK_stg_ESMA_INSTRUMENT_DEBT__next] PRIMARY KEY CLUSTERED 
+(
+	[ISIN] ASC,
+	[TradingVenueMIC] ASC,
+	[ValidFromDate_PK] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+) ON [PRIMARY]
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Réceptacle vide de l'échange (ALTER TABLE ... SWITCH) de [stg].[ESMA_INSTRUMENT_DEBT] par ALTER TABLE ... SWITCH (même structure, même filegroup) */
+CREATE TABLE [stg].[ESMA_INSTRUMENT_DEBT__old](
+	[ISIN] [varchar](12) COLLATE French_CI_AS NOT NULL,
+	[TradingVenueMIC] [varchar](50) COLLATE French_CI_AS NOT NULL,
+	[ValidFromDate] [date] NULL,
+	[ValidToDate] [date] NULL,
+	[LatestRecordFlag] [bit] NULL,
+	[ValidFromDate_PK] [date] NOT NULL,
+	[TotalIssuedNominalAmount] [decimal](38, 10) NULL,
+	[TotalIssuedNominalAmountCcy] [varchar](10) COLLATE French_CI_AS NULL,
+	[MaturityDate] [date] NULL,
+	[NominalValuePerUnit] [decimal](38, 10) NULL,
+	[NominalValuePerUnitCcy] [varchar](10) COLLATE French_CI_AS NULL,
+	[FixedRate] [decimal](38, 10) NULL,
+	[FloatRefRateISIN] [varchar](12) COLLATE French_CI_AS NULL,
+	[FloatRefRateIndex] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatTermUnit] [varchar](10) COLLATE French_CI_AS NULL,
+	[FloatTermValue] [int] NULL,
+	[FloatBasisPointSpread] [decimal](38, 10) NULL,
+	[DebtSeniority] [nvarchar](100) COLLATE French_CI_AS NULL,
+	[LoadDtmUTC] [datetime2](0) NOT NULL,
+ CONSTRAINT [PK_stg_ESMA_INSTRUMENT_DEBT__old] PRIMARY KEY CLUSTERED 
+(
+	[ISIN] ASC,
+	[TradingVenueMIC] ASC,
+	[ValidFromDate_PK] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+) ON [PRIMARY]
+
+ALTER TABLE [stg].[ESMA_INSTRUMENT_DEBT__next] ADD  CONSTRAINT [DF_stg_ESMA_INSTRUMENT_DEBT__next_ValidFromDatePK]  DEFAULT (CONVERT([date],'19000101')) FOR [ValidFromDate_PK]
+ALTER TABLE [stg].[ESMA_INSTRUMENT_DEBT__next] ADD  CONSTRAINT [DF_stg_ESMA_INSTRUMENT_DEBT__next_LoadDtmUTC]  DEFAULT (sysutcdatetime()) FOR [LoadDtmUTC]
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Cible BULK INSERT de 03-LOAD_STG avec [ESMA] load_swap : [stg].[ESMA_INSTRUMENT_DEBT__next] sauf LoadDtmUTC (défaut) */
+CREATE VIEW [stg].[v_ESMA_INSTRUMENT_DEBT_LOAD__next]
+AS
+SELECT
+    [ISIN], [TradingVenueMIC], [ValidFromDate], [ValidToDate], [LatestRecordFlag], [ValidFromDate_PK],
+    [TotalIssuedNominalAmount], [TotalIssuedNominalAmountCcy], [MaturityDate], [NominalValuePerUnit],
+    [NominalValuePerUnitCcy], [FixedRate], [FloatRefRateISIN], [FloatRefRateIndex], [FloatTermUnit],
+    [FloatTermValue], [FloatBasisPointSpread], [DebtSeniority]
+FROM [stg].[ESMA_INSTRUMENT_DEBT__next];
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Table fantôme de 03-LOAD_STG ([ESMA] load_swap) : chargée puis échangée avec [stg].[ESMA_INSTRUMENT_DERIVATIVE] par ALTER TABLE ... SWITCH (même structure, même filegroup) */
+CREATE TABLE [stg].[ESMA_INSTRUMENT_DERIVATIVE__next](
+	[ISIN] [varchar](12) COLLATE French_CI_AS NOT NULL,
+	[TradingVenueMIC] [varchar](50) COLLATE French_CI_AS NOT NULL,
+	[ValidFromDate] [date] NULL,
+	[ValidToDate] [date] NULL,
+	[LatestRecordFlag] [bit] NULL,
+	[ValidFromDate_PK] [date] NOT NULL,
+	[ExpiryDate] [date] NULL,
+	[PriceMultiplier] [decimal](38, 10) NULL,
+	[UnderlyingISIN] [varchar](12) COLLATE French_CI_AS NULL,
+	[UnderlyingLEI] [varchar](50) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexRef] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermUnit] [varchar](10) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermValue] [int] NULL,
+	[OptionType] [varchar](50) COLLATE French_CI_AS NULL,
+	[OptionExerciseStyle] [varchar](50) COLLATE French_CI_AS NULL,
+	[DeliveryType] [varchar](50) COLLATE French_CI_AS NULL,
+	[StrikePrice] [decimal](38, 10) NULL,
+	[StrikePriceCcy] [varchar](10) COLLATE French_CI_AS NULL,
+	[StrikeNoPriceCcy] [bit] NULL,
+	[CmdtyBaseProduct] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtySubProduct] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtySubSubProduct] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtyTransactionType] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtyFinalPriceType] [varchar](50) COLLATE French_CI_AS NULL,
+	[LoadDtmUTC] [datetime2](0) NOT NULL,
+ CONSTRAINT [PK_stg_ESMA_INSTRUMENT_DERIVATIVE__next] PRIMARY KEY CLUSTERED 
+(
+	[ISIN] ASC,
+	[TradingVenueMIC] ASC,
+	[ValidFromDate_PK] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+) ON [PRIMARY]
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Réceptacle vide de l'échange (ALTER TABLE ... SWITCH) de [stg].[ESMA_INSTRUMENT_DERIVATIVE] par ALTER TABLE ... SWITCH (même structure, même filegroup) */
+CREATE TABLE [stg].[ESMA_INSTRUMENT_DERIVATIVE__old](
+	[ISIN] [varchar](12) COLLATE French_CI_AS NOT NULL,
+	[TradingVenueMIC] [varchar](50) COLLATE French_CI_AS NOT NULL,
+	[ValidFromDate] [date] NULL,
+	[ValidToDate] [date] NULL,
+	[LatestRecordFlag] [bit] NULL,
+	[ValidFromDate_PK] [date] NOT NULL,
+	[ExpiryDate] [date] NULL,
+	[PriceMultiplier] [decimal](38, 10) NULL,
+	[UnderlyingISIN] [varchar](12) COLLATE French_CI_AS NULL,
+	[UnderlyingLEI] [varchar](50) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexRef] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermUnit] [varchar](10) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermValue] [int] NULL,
+	[OptionType] [varchar](50) COLLATE French_CI_AS NULL,
+	[OptionExerciseStyle] [varchar](50) COLLATE French_CI_AS NULL,
+	[DeliveryType] [varchar](50) COLLATE French_CI_AS NULL,
+	[StrikePrice] [decimal](38, 10) NULL,
+	[StrikePriceCcy] [varchar](10) COLLATE French_CI_AS NULL,
+	[StrikeNoPriceCcy] [bit] NULL,
+	[CmdtyBaseProduct] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtySubProduct] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtySubSubProduct] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtyTransactionType] [varchar](50) COLLATE French_CI_AS NULL,
+	[CmdtyFinalPriceType] [varchar](50) COLLATE French_CI_AS NULL,
+	[LoadDtmUTC] [datetime2](0) NOT NULL,
+ CONSTRAINT [PK_stg_ESMA_INSTRUMENT_DERIVATIVE__old] PRIMARY KEY CLUSTERED 
+(
+	[ISIN] ASC,
+	[TradingVenueMIC] ASC,
+	[ValidFromDate_PK] ASC
+)WITH (PAD_INDEX = OFF, STATISTICS_NORECOMPUTE = OFF, IGNORE_DUP_KEY = OFF, ALLOW_ROW_LOCKS = ON, ALLOW_PAGE_LOCKS = ON, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+) ON [PRIMARY]
+
+ALTER TABLE [stg].[ESMA_INSTRUMENT_DERIVATIVE__next] ADD  CONSTRAINT [DF_stg_ESMA_INSTRUMENT_DERIV__next_ValidFromDatePK]  DEFAULT (CONVERT([date],'19000101')) FOR [ValidFromDate_PK]
+ALTER TABLE [stg].[ESMA_INSTRUMENT_DERIVATIVE__next] ADD  CONSTRAINT [DF_stg_ESMA_INSTRUMENT_DERIV__next_LoadDtmUTC]  DEFAULT (sysutcdatetime()) FOR [LoadDtmUTC]
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* Cible BULK INSERT de 03-LOAD_STG avec [ESMA] load_swap : [stg].[ESMA_INSTRUMENT_DERIVATIVE__next] sauf LoadDtmUTC (défaut) */
+CREATE VIEW [stg].[v_ESMA_INSTRUMENT_DERIVATIVE_LOAD__next]
+AS
+SELECT
+    [ISIN], [TradingVenueMIC], [ValidFromDate], [ValidToDate], [LatestRecordFlag], [ValidFromDate_PK],
+    [ExpiryDate], [PriceMultiplier], [UnderlyingISIN], [UnderlyingLEI], [UnderlyingIndexRef],
+    [UnderlyingIndexTermUnit], [UnderlyingIndexTermValue], [OptionType], [OptionExerciseStyle],
+    [DeliveryType], [StrikePrice], [StrikePriceCcy], [StrikeNoPriceCcy], [CmdtyBaseProduct],
+    [CmdtySubProduct], [CmdtySubSubProduct], [CmdtyTransactionType], [CmdtyFinalPriceType]
+FROM [stg].[ESMA_INSTRUMENT_DERIVATIVE__next];
+
+SET ANSI_NULLS ON
+SET QUOTED_IDENTIFIER ON
+/* FULL incrémental : jeu NEW / MOD / TERM de 02-BUILD_CSV (colonnes de [stg].[ESMA_FULINS_WIDE] + ActionType,
+   comme le DLTINS), chargé par 03-LOAD_STG puis appliqué par [stg].[usp_Apply_FULINS_Diff] */
+CREATE TABLE [stg].[ESMA_FULINS_DIFF](
+	[HeaderReportingMarketId] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[HeaderReportingNCA] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[HeaderReportingPeriodDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[SourceFileName] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TechRcrdId] [bigint] NULL,
+	[ISIN] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FullName] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[ShortName] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CFI] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CommodityDerivativeInd] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[NotionalCurrency] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[IssuerLEI] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TradingVenueMIC] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[IssuerReqAdmission] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[AdmissionApprvlDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[ReqForAdmissionDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FirstTradingDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TerminationDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TotalIssuedNominalAmount] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[TotalIssuedNominalAmountCcy] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[MaturityDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[NominalValuePerUnit] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[NominalValuePerUnitCcy] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FixedRate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatRefRateISIN] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatRefRateIndex] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatTermUnit] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatTermValue] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[FloatBasisPointSpread] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[DebtSeniority] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[ExpiryDate] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[PriceMultiplier] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingISIN] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingLEI] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexRef] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermUnit] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[UnderlyingIndexTermValue] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[OptionType] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[OptionExerciseStyle] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[DeliveryType] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[StrikePrice] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[StrikePriceCcy] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[StrikeNoPriceCcy] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtyBaseProduct] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtySubProduct] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtySubSubProduct] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtyTransactionType] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[CmdtyFinalPriceType] [nvarchar](255) COLLATE French_CI_AS NULL,
+	[ValidFromDate] [date] NULL,
+	[ValidToDate] [date] NULL,
+	[LatestRecordFlag] [bit] NULL,
+	[ActionType] [varchar](10) COLLATE French_CI_AS NOT NULL
+) ON [PRIMARY]